@@ -3,9 +3,12 @@ One-time Lambda function to run database migrations
 Deploy this, invoke it once, then delete it
 """
 
-import json
 import os
-import boto3
+import time
+import urllib.request
+from urllib.parse import quote, urlparse
+
+import orjson  # provided by the Lambda layer alongside psycopg
 
 # Migration SQL embedded directly
 MIGRATIONS = {
@@ -143,29 +146,103 @@ CREATE INDEX idx_letter_revisions_letter_id ON letter_revisions(letter_id);
 '''
 }
 
+# Reused across warm invocations of the same execution environment.
+# boto3 is imported on first use so the init phase does not pay for it.
+_BOTO3_SESSION = None
+_SECRETS_CLIENT = None
+_DB_CONFIG = None
+_DB_CONFIG_FETCHED_AT = 0.0
+_CONN = None
+
+SECRET_ID = 'demand-letters-dev/database/master'
+# Mirrors the Parameters and Secrets extension's own cache TTL setting
+SECRET_TTL_SECONDS = int(os.environ.get('SECRETS_MANAGER_TTL', '300'))
+
+
+def get_boto3_session():
+    """Get or create the boto3 session (service models load per client)"""
+    global _BOTO3_SESSION
+    if _BOTO3_SESSION is None:
+        import boto3
+
+        _BOTO3_SESSION = boto3.session.Session(region_name='us-east-1')
+    return _BOTO3_SESSION
+
+
+def fetch_secret_string():
+    """
+    Fetch the raw secret string.
+
+    Uses the AWS Parameters and Secrets Lambda extension when its port is
+    configured (a localhost HTTP call), falling back to the Secrets Manager API.
+    """
+    global _SECRETS_CLIENT
+    extension_port = os.environ.get('PARAMETERS_SECRETS_EXTENSION_HTTP_PORT')
+    if extension_port:
+        request = urllib.request.Request(
+            f'http://localhost:{extension_port}/secretsmanager/get?secretId={quote(SECRET_ID, safe="")}',
+            headers={'X-Aws-Parameters-Secrets-Token': os.environ['AWS_SESSION_TOKEN']},
+        )
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return orjson.loads(response.read())['SecretString']
+
+    if _SECRETS_CLIENT is None:
+        _SECRETS_CLIENT = get_boto3_session().client('secretsmanager')
+    return _SECRETS_CLIENT.get_secret_value(SecretId=SECRET_ID)['SecretString']
+
+
+def get_db_config():
+    """Get database credentials, parsed once and cached for SECRET_TTL_SECONDS"""
+    global _DB_CONFIG, _DB_CONFIG_FETCHED_AT
+    now = time.monotonic()
+    if _DB_CONFIG is None or now - _DB_CONFIG_FETCHED_AT > SECRET_TTL_SECONDS:
+        _DB_CONFIG = orjson.loads(fetch_secret_string())
+        _DB_CONFIG_FETCHED_AT = now
+    return _DB_CONFIG
+
+
+def get_connection(psycopg, db_config):
+    """
+    Open (or reuse) the single database connection for this execution environment.
+
+    When RDS_PROXY_URL is set, connect through RDS Proxy using a short-lived
+    IAM auth token instead of the master credentials.
+    """
+    global _CONN
+    if _CONN is None or _CONN.closed:
+        proxy_url = os.environ.get('RDS_PROXY_URL')
+        if proxy_url:
+            url = urlparse(proxy_url)
+            token = get_boto3_session().client('rds').generate_db_auth_token(
+                DBHostname=url.hostname,
+                Port=url.port or 5432,
+                DBUsername=url.username,
+            )
+            _CONN = psycopg.connect(proxy_url, password=token, sslmode='require', autocommit=True)
+        else:
+            _CONN = psycopg.connect(db_config['database_url'], autocommit=True)
+    return _CONN
+
+
 def lambda_handler(event, context):
     """Run migrations"""
 
     try:
-        import psycopg2
+        import psycopg
     except ImportError:
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': 'psycopg2 not available - use Lambda layer'})
+            'body': orjson.dumps({'error': 'psycopg not available - use Lambda layer with psycopg[c,binary]'}).decode()
         }
 
     # Get database credentials from Secrets Manager
-    secrets_client = boto3.client('secretsmanager', region_name='us-east-1')
-    secret = secrets_client.get_secret_value(SecretId='demand-letters-dev/database/master')
-    db_config = json.loads(secret['SecretString'])
+    db_config = get_db_config()
 
-    conn = None
     results = []
 
     try:
-        # Connect to database
-        conn = psycopg2.connect(db_config['database_url'])
-        conn.autocommit = True
+        # Connect to database (connection is kept open for warm invocations)
+        conn = get_connection(psycopg, db_config)
         cursor = conn.cursor()
 
         # Create migrations table
@@ -179,7 +256,10 @@ def lambda_handler(event, context):
         results.append('Migrations table ready')
 
         # Get applied migrations
-        cursor.execute('SELECT filename FROM schema_migrations')
+        cursor.execute(
+            'SELECT filename FROM schema_migrations WHERE filename = ANY(%s)',
+            (list(MIGRATIONS.keys()),),
+        )
         applied = set(row[0] for row in cursor.fetchall())
 
         # Run each migration
@@ -189,8 +269,14 @@ def lambda_handler(event, context):
                 continue
 
             try:
-                cursor.execute(sql)
-                cursor.execute('INSERT INTO schema_migrations (filename) VALUES (%s)', (filename,))
+                # One explicit transaction per file: its DDL and the bookkeeping row
+                # commit (or roll back) together with a single WAL flush
+                with conn.transaction():
+                    cursor.execute(sql)
+                    cursor.execute(
+                        'INSERT INTO schema_migrations (filename) VALUES (%s) ON CONFLICT (filename) DO NOTHING',
+                        (filename,),
+                    )
                 results.append(f'{filename}: SUCCESS')
             except Exception as e:
                 results.append(f'{filename}: FAILED - {str(e)}')
@@ -198,20 +284,17 @@ def lambda_handler(event, context):
 
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'message': 'Migrations completed',
                 'results': results
-            })
+            }).decode()
         }
 
     except Exception as e:
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': str(e),
                 'results': results
-            })
+            }).decode()
         }
-    finally:
-        if conn:
-            conn.close()
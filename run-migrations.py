@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
-"""Simple migration runner using psycopg2"""
+"""Simple migration runner using psycopg (v3)"""
 
+import glob
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 try:
-    import psycopg2
+    import psycopg
 except ImportError:
-    print("Error: psycopg2 not installed. Install with: pip install psycopg2-binary")
+    print("Error: psycopg not installed. Install with: pip install 'psycopg[c,binary]>=3.3.2'")
     sys.exit(1)
 
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -21,18 +23,32 @@ url = urlparse(DATABASE_URL)
 conn_params = {
     'host': url.hostname,
     'port': url.port or 5432,
-    'database': url.path[1:],  # Remove leading /
+    'dbname': url.path[1:],  # Remove leading /
     'user': url.username,
     'password': url.password
 }
 
 MIGRATIONS_DIR = 'services/database/migrations'
 
+
+def read_file(path):
+    with open(path, 'r') as f:
+        return f.read()
+
+
+# Migration files are small and fixed for a given deploy: read them once, in
+# parallel (file I/O releases the GIL), keeping filename order for execution
+MIGRATION_PATHS = sorted(glob.glob(f'{MIGRATIONS_DIR}/*.sql'))
+with ThreadPoolExecutor(max_workers=8) as executor:
+    MIGRATIONS = dict(zip(
+        (os.path.basename(path) for path in MIGRATION_PATHS),
+        executor.map(read_file, MIGRATION_PATHS),
+    ))
+
 def run_migrations():
     try:
         print('Connecting to database...')
-        conn = psycopg2.connect(**conn_params)
-        conn.autocommit = True
+        conn = psycopg.connect(**conn_params, autocommit=True)
         cursor = conn.cursor()
         print('✓ Connected')
 
@@ -48,28 +64,31 @@ def run_migrations():
         print('✓ Migrations table ready')
 
         # Get applied migrations
-        cursor.execute('SELECT filename FROM schema_migrations ORDER BY filename')
+        cursor.execute(
+            'SELECT filename FROM schema_migrations WHERE filename = ANY(%s)',
+            (list(MIGRATIONS.keys()),),
+        )
         applied = set(row[0] for row in cursor.fetchall())
         print(f'Applied migrations: {len(applied)}')
 
-        # Get migration files
-        import glob
-        files = sorted([os.path.basename(f) for f in glob.glob(f'{MIGRATIONS_DIR}/*.sql')])
-        print(f'Total migration files: {len(files)}')
+        print(f'Total migration files: {len(MIGRATIONS)}')
 
         # Run pending migrations
-        for file in files:
+        for file, sql in MIGRATIONS.items():
             if file in applied:
                 print(f'⊘ {file} (already applied)')
                 continue
 
             print(f'→ Running {file}...')
-            with open(f'{MIGRATIONS_DIR}/{file}', 'r') as f:
-                sql = f.read()
-
             try:
-                cursor.execute(sql)
-                cursor.execute('INSERT INTO schema_migrations (filename) VALUES (%s)', (file,))
+                # One explicit transaction per file: its DDL and the bookkeeping row
+                # commit (or roll back) together with a single WAL flush
+                with conn.transaction():
+                    cursor.execute(sql)
+                    cursor.execute(
+                        'INSERT INTO schema_migrations (filename) VALUES (%s) ON CONFLICT (filename) DO NOTHING',
+                        (file,),
+                    )
                 print(f'✓ {file} applied successfully')
             except Exception as e:
                 print(f'✗ {file} failed: {e}')
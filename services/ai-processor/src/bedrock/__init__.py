@@ -1,16 +1,19 @@
 """AWS Bedrock integration for Claude AI."""
 
-from .client import BedrockClient
+from .client import BedrockClient, get_default_client
 from .config import BedrockConfig
 from .exceptions import (
     BedrockClientError,
     BedrockConfigurationError,
     BedrockError,
+    BedrockRateLimitError,
     BedrockServerError,
     BedrockThrottlingError,
     BedrockValidationError,
 )
 from .tools import (
+    EXAMPLE_EXTRACTION_TOOL,
+    EXTRACTED_FACT_TOOL,
     ExampleExtraction,
     ExtractedFact,
     create_tool_choice,
@@ -20,11 +23,13 @@ from .tools import (
 
 __all__ = [
     "BedrockClient",
+    "get_default_client",
     "BedrockConfig",
     "BedrockError",
     "BedrockClientError",
     "BedrockServerError",
     "BedrockThrottlingError",
+    "BedrockRateLimitError",
     "BedrockValidationError",
     "BedrockConfigurationError",
     "pydantic_to_tool_schema",
@@ -32,4 +37,6 @@ __all__ = [
     "extract_tool_result",
     "ExtractedFact",
     "ExampleExtraction",
+    "EXTRACTED_FACT_TOOL",
+    "EXAMPLE_EXTRACTION_TOOL",
 ]
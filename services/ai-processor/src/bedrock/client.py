@@ -1,14 +1,17 @@
 """AWS Bedrock client for Claude AI integration."""
 
+import functools
 import json
 import logging
+import threading
 import time
-from typing import Any, Type
+from typing import Any, Iterator, Type
 
 import boto3
 from botocore.config import Config
 from pydantic import BaseModel
 
+from ..metrics import metrics
 from ..utils import (
     exponential_backoff,
     generate_correlation_id,
@@ -17,8 +20,254 @@ from ..utils import (
     log_bedrock_response,
 )
 from .config import BedrockConfig
-from .exceptions import BedrockClientError, BedrockConfigurationError
-from .tools import create_tool_choice, extract_tool_result, pydantic_to_tool_schema
+from .exceptions import (
+    BedrockClientError,
+    BedrockConfigurationError,
+    BedrockRateLimitError,
+    BedrockServerError,
+)
+from .tools import (
+    CACHED_TOOL_USE_KEY,
+    create_tool_choice,
+    extract_tool_result,
+    find_tool_use_block,
+    pydantic_to_tool_schema,
+)
+
+# botocore settings shared by every bedrock-runtime client
+_BOTO_CONFIG = Config(
+    # We handle retries ourselves; "standard" keeps adaptive client-side
+    # rate limiting off
+    retries={"max_attempts": 0, "mode": "standard"},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=120,  # Long generations can take minutes
+)
+
+# boto3 clients shared by all BedrockClient instances, keyed by
+# (service, region, session); a session of None means boto3's default session
+_CLIENT_CACHE: dict[tuple[str, str, Any], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# id()s of cached boto3 clients that have completed a call. Latency metrics
+# are split by whether the client was reused; that says nothing about which
+# pooled urllib3 connection a call ran on, which may still be new.
+_USED_CLIENT_IDS: set[int] = set()
+
+# Bedrock batch inference bills tokens at half the on-demand rate
+BATCH_COST_FACTOR = 0.5
+
+# Converse content block marking the end of a cacheable prompt prefix
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# Rate limiters shared by all BedrockClient instances, keyed by
+# (region, model_id) since Bedrock quotas apply per model per region
+_RATE_LIMITERS: dict[tuple[str, str], "TokenBucket"] = {}
+
+# Batch job states that will not change again
+_BATCH_TERMINAL_STATES = frozenset(
+    {"Completed", "PartiallyCompleted", "Failed", "Stopped", "Expired"}
+)
+
+
+def _get_aws_client(
+    service: str, aws_region: str, session: boto3.session.Session | None = None
+) -> Any:
+    """
+    Get or create the shared boto3 client for a service and region.
+
+    Sharing one client per region lets every BedrockClient reuse the same
+    HTTP connection pool instead of paying client construction (including
+    the service-model load) each time.
+
+    Args:
+        service: boto3 service name (e.g. "bedrock-runtime")
+        aws_region: AWS region for the client
+        session: boto3 session to create the client from (default session if None)
+
+    Returns:
+        boto3 client
+    """
+    key = (service, aws_region, session)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                factory = session.client if session is not None else boto3.client
+                client = factory(service, region_name=aws_region, config=_BOTO_CONFIG)
+                _CLIENT_CACHE[key] = client
+    return client
+
+
+def _get_runtime_client(aws_region: str, session: boto3.session.Session | None = None) -> Any:
+    """Get or create the shared bedrock-runtime client for a region."""
+    return _get_aws_client("bedrock-runtime", aws_region, session)
+
+
+def _anthropic_content(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Translate converse content blocks into Anthropic messages blocks.
+
+    A CACHE_POINT becomes cache_control on the block before it.
+
+    Args:
+        blocks: Converse content blocks
+
+    Returns:
+        Anthropic content blocks
+    """
+    content: list[dict[str, Any]] = []
+    for block in blocks:
+        if "cachePoint" in block:
+            if content:
+                content[-1]["cache_control"] = {"type": "ephemeral"}
+        elif "type" in block:
+            content.append(dict(block))
+        else:
+            content.append({"type": "text", **block})
+    return content
+
+
+def _split_s3_uri(uri: str) -> tuple[str, str]:
+    """
+    Split an s3://bucket/prefix URI into bucket and key prefix.
+
+    Args:
+        uri: S3 URI
+
+    Returns:
+        (bucket, prefix) with any trailing slash stripped from the prefix
+    """
+    bucket, _, prefix = uri.removeprefix("s3://").partition("/")
+    return bucket, prefix.rstrip("/")
+
+
+class TokenBucket:
+    """
+    Client-side tokens-per-minute and requests-per-minute limiter.
+
+    Each acquire() reserves its tokens and one request straight away, and
+    sleeps until the refill covers the reservation. So concurrent callers
+    queue in order instead of all hitting Bedrock and getting 429s. Either
+    limit may be None to leave it unchecked. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int | None = None,
+        requests_per_minute: int | None = None,
+    ):
+        """
+        Initialize the limiter with both buckets full.
+
+        Args:
+            tokens_per_minute: Input plus output token quota (None for no limit)
+            requests_per_minute: Request quota (None for no limit)
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._tokens = float(tokens_per_minute or 0)
+        self._requests = float(requests_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add what has accrued since the last update, capped at a minute's quota."""
+        elapsed = now - self._updated
+        self._updated = now
+        if self.tokens_per_minute:
+            self._tokens = min(
+                self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+            )
+        if self.requests_per_minute:
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed * self.requests_per_minute / 60,
+            )
+
+    def acquire(self, tokens: int, max_wait: float = 5.0) -> float:
+        """
+        Reserve capacity for one request, waiting for the refill if needed.
+
+        Args:
+            tokens: Estimated input plus output tokens for the request
+            max_wait: Longest acceptable wait in seconds
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            BedrockRateLimitError: If the wait would exceed max_wait (nothing
+                is reserved; retry_after is the wait in whole seconds)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0
+            if self.tokens_per_minute and tokens > self._tokens:
+                wait = (tokens - self._tokens) * 60 / self.tokens_per_minute
+            if self.requests_per_minute and self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60 / self.requests_per_minute)
+            if wait > max_wait:
+                raise BedrockRateLimitError(
+                    f"Client-side rate limit: request would wait {wait:.1f}s",
+                    retry_after=int(wait) + 1,
+                )
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+            if self.requests_per_minute:
+                self._requests -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def refund(self, tokens: int, requests: int = 0) -> None:
+        """
+        Return reserved capacity the request did not use.
+
+        Args:
+            tokens: Tokens to give back (e.g. max_tokens minus output tokens)
+            requests: Request slots to give back (1 when the call failed)
+        """
+        with self._lock:
+            if self.tokens_per_minute and tokens > 0:
+                self._tokens = min(self.tokens_per_minute, self._tokens + tokens)
+            if self.requests_per_minute and requests > 0:
+                self._requests = min(self.requests_per_minute, self._requests + requests)
+
+
+def _get_rate_limiter(config: BedrockConfig, model_id: str) -> TokenBucket | None:
+    """
+    Get the shared rate limiter for a model, or None when no quota is configured.
+
+    Args:
+        config: Bedrock configuration with the quotas and region
+        model_id: Model the request is for
+
+    Returns:
+        Shared TokenBucket, or None if neither quota is set
+    """
+    if not (config.tokens_per_minute or config.requests_per_minute):
+        return None
+    key = (config.aws_region, model_id)
+    limiter = _RATE_LIMITERS.get(key)
+    if limiter is None:
+        with _CLIENT_CACHE_LOCK:
+            limiter = _RATE_LIMITERS.setdefault(
+                key, TokenBucket(config.tokens_per_minute, config.requests_per_minute)
+            )
+    return limiter
+
+
+def reset_client_cache() -> None:
+    """Drop shared boto3 clients, rate limiters and the default client (for tests)."""
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.clear()
+        _USED_CLIENT_IDS.clear()
+        _RATE_LIMITERS.clear()
+    get_default_client.cache_clear()
 
 
 class BedrockClient:
@@ -37,6 +286,7 @@ class BedrockClient:
         self,
         config: BedrockConfig | None = None,
         logger: logging.Logger | None = None,
+        session: boto3.session.Session | None = None,
     ):
         """
         Initialize Bedrock client.
@@ -44,17 +294,17 @@ class BedrockClient:
         Args:
             config: Bedrock configuration (uses default if None)
             logger: Logger instance (creates default if None)
+            session: boto3 session to build the runtime client from, so it
+                can be shared with other AWS clients (boto3's default
+                session if None)
         """
         self.config = config or BedrockConfig.from_settings()
         self.logger = logger or logging.getLogger("bedrock.client")
+        self._session = session
 
-        # Initialize boto3 client
+        # Reuse the process-wide boto3 client for this region
         try:
-            boto_config = Config(
-                region_name=self.config.aws_region,
-                retries={"max_attempts": 0},  # We handle retries ourselves
-            )
-            self.client = boto3.client("bedrock-runtime", config=boto_config)
+            self.client = _get_runtime_client(self.config.aws_region, session)
         except Exception as e:
             raise BedrockConfigurationError(
                 f"Failed to initialize Bedrock client: {e}"
@@ -72,12 +322,15 @@ class BedrockClient:
         correlation_id: str | None = None,
         firm_id: int | None = None,
         user_id: int | None = None,
+        cache_prompt: bool = False,
+        model_id: str | None = None,
     ) -> dict[str, Any]:
         """
         Invoke Claude via Bedrock with comprehensive logging.
 
         Args:
-            messages: Conversation messages in Claude format
+            messages: Conversation messages in Claude format; a list-content
+                message may include CACHE_POINT blocks to cache its prefix
             system: System prompt (optional)
             temperature: Temperature override (uses config default if None)
             max_tokens: Max tokens override (uses config default if None)
@@ -86,6 +339,10 @@ class BedrockClient:
             correlation_id: Request correlation ID for tracing
             firm_id: Firm context for multi-tenancy
             user_id: User context
+            cache_prompt: Put a prompt cache point after the system prompt so
+                repeat calls read tools and system from the cache
+            model_id: Model override, e.g. config.model_id_small for light
+                tasks (uses config.model_id if None)
 
         Returns:
             Bedrock API response
@@ -94,28 +351,18 @@ class BedrockClient:
             BedrockClientError: For client-side errors (4xx)
             BedrockServerError: For server-side errors (5xx)
             BedrockThrottlingError: For rate limiting (429)
+            BedrockRateLimitError: If the client-side quota would make the
+                call wait longer than rate_limit_max_wait (not retried)
         """
+        model_id = model_id or self.config.model_id
+
         # Generate correlation ID if not provided
         if correlation_id is None:
             correlation_id = generate_correlation_id()
 
-        # Build request body
-        request_body = {
-            "anthropicVersion": "bedrock-2023-05-31",
-            "messages": messages,
-            "maxTokens": max_tokens or self.config.max_tokens,
-            "temperature": temperature
-            if temperature is not None
-            else self.config.temperature_extraction,
-        }
-
-        # Add optional parameters
-        if system:
-            request_body["system"] = system
-        if tools:
-            request_body["tools"] = tools
-        if tool_choice:
-            request_body["toolChoice"] = tool_choice
+        request_body = self._build_request_body(
+            messages, system, temperature, max_tokens, tools, tool_choice, cache_prompt
+        )
 
         # Estimate input tokens (rough approximation)
         prompt_tokens = self._estimate_tokens(messages, system)
@@ -123,7 +370,7 @@ class BedrockClient:
         # Log request
         log_bedrock_request(
             self.logger,
-            model_id=self.config.model_id,
+            model_id=model_id,
             prompt_tokens=prompt_tokens,
             correlation_id=correlation_id,
             firm_id=firm_id,
@@ -134,36 +381,56 @@ class BedrockClient:
             tool_count=len(tools) if tools else 0,
         )
 
+        # Wait for quota instead of provoking a 429 (Bedrock reserves maxTokens)
+        limiter = _get_rate_limiter(self.config, model_id)
+        reserved = prompt_tokens + request_body["maxTokens"]
+        if limiter is not None:
+            limiter.acquire(reserved, self.config.rate_limit_max_wait)
+
         # Invoke Bedrock API
-        start_time = time.time()
+        start_time = time.perf_counter()
+        response = None
         try:
             response = self.client.converse(
-                modelId=self.config.model_id, **request_body
+                modelId=model_id, **request_body
             )
 
             # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            client_reused = id(self.client) in _USED_CLIENT_IDS
+            _USED_CLIENT_IDS.add(id(self.client))
+            metrics.record_metric(
+                "BedrockInvocationLatency",
+                latency_ms,
+                "Milliseconds",
+                {"ClientReused": str(client_reused)},
+            )
 
             # Extract token usage
             usage = response.get("usage", {})
             input_tokens = usage.get("inputTokens", prompt_tokens)
             output_tokens = usage.get("outputTokens", 0)
+            if limiter is not None:
+                limiter.refund(request_body["maxTokens"] - output_tokens)
+            cache_read_tokens = usage.get("cacheReadInputTokens", 0)
+            cache_write_tokens = usage.get("cacheWriteInputTokens", 0)
 
             # Calculate cost
-            cost = self.config.calculate_cost(input_tokens, output_tokens)
+            cost = self.config.calculate_cost(
+                input_tokens, output_tokens, cache_read_tokens, cache_write_tokens, model_id
+            )
 
-            # Check for tool usage
+            # Check for tool usage (cached on the response for extract_tool_result)
             tool_used = None
-            content = response.get("output", {}).get("message", {}).get("content", [])
-            for block in content:
-                if "toolUse" in block:
-                    tool_used = block["toolUse"].get("name")
-                    break
+            tool_use = find_tool_use_block(response)
+            if tool_use is not None:
+                response[CACHED_TOOL_USE_KEY] = tool_use
+                tool_used = tool_use.get("name")
 
             # Log response
             log_bedrock_response(
                 self.logger,
-                model_id=self.config.model_id,
+                model_id=model_id,
                 prompt_tokens=input_tokens,
                 completion_tokens=output_tokens,
                 latency_ms=latency_ms,
@@ -172,12 +439,276 @@ class BedrockClient:
                 user_id=user_id,
                 cost_estimate=cost,
                 tool_used=tool_used,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
+                client_reused=client_reused,
             )
 
             return response
 
         except Exception as e:
+            # A failed call hands back its whole reservation before any retry
+            if limiter is not None and response is None:
+                limiter.refund(reserved, requests=1)
+
             # Log error
+            log_bedrock_error(
+                self.logger,
+                error=e,
+                model_id=model_id,
+                correlation_id=correlation_id,
+                firm_id=firm_id,
+                user_id=user_id,
+            )
+            raise
+
+    def invoke_stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+        cache_prompt: bool = False,
+        include_usage: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Invoke Claude via Bedrock and yield content deltas as they are generated.
+
+        Unlike invoke(), the response is never buffered in full. Each yielded
+        item is a contentBlockDelta ``delta`` dict, e.g. ``{"text": "..."}`` or
+        ``{"toolUse": {"input": "<partial JSON>"}}``. Usage and cost are logged
+        once the stream's metadata event arrives. Streams are not retried,
+        since chunks may already have been consumed.
+
+        Args:
+            messages: Conversation messages in Claude format
+            system: System prompt (optional)
+            temperature: Temperature override (uses config default if None)
+            max_tokens: Max tokens override (uses config default if None)
+            tools: Tool definitions for structured outputs
+            tool_choice: Force specific tool usage
+            correlation_id: Request correlation ID for tracing
+            firm_id: Firm context for multi-tenancy
+            user_id: User context
+            cache_prompt: Put a prompt cache point after the system prompt
+            include_usage: Finish with a ``{"usage": {...}}`` item carrying
+                the stream's token usage
+
+        Yields:
+            Content block deltas in generation order
+        """
+        for event in self._stream_events(
+            messages,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            tool_choice=tool_choice,
+            correlation_id=correlation_id,
+            firm_id=firm_id,
+            user_id=user_id,
+            cache_prompt=cache_prompt,
+        ):
+            if "contentBlockDelta" in event:
+                yield event["contentBlockDelta"]["delta"]
+            elif include_usage and "metadata" in event:
+                yield {"usage": event["metadata"].get("usage", {})}
+
+    @exponential_backoff(max_retries=3, base_delay=1.0, max_delay=60.0)
+    def invoke_via_stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+        cache_prompt: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Invoke Claude over converse_stream and assemble a converse-shaped response.
+
+        Deltas are accumulated per content block while the model is still
+        generating, and each toolUse input is parsed once when the stream
+        ends. The connection therefore never sits idle waiting on one large
+        payload, and the result works with extract_tool_result exactly like
+        invoke()'s. Safe to retry because nothing is handed to the caller
+        until the stream completes.
+
+        Args:
+            messages: Conversation messages in Claude format
+            system: System prompt (optional)
+            temperature: Temperature override (uses config default if None)
+            max_tokens: Max tokens override (uses config default if None)
+            tools: Tool definitions for structured outputs
+            tool_choice: Force specific tool usage
+            correlation_id: Request correlation ID for tracing
+            firm_id: Firm context for multi-tenancy
+            user_id: User context
+            cache_prompt: Put a prompt cache point after the system prompt
+
+        Returns:
+            Response dict with output.message.content, stopReason and usage
+        """
+        blocks: dict[int, dict[str, Any]] = {}
+        stop_reason = None
+        usage: dict[str, Any] = {}
+
+        for event in self._stream_events(
+            messages,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            tool_choice=tool_choice,
+            correlation_id=correlation_id,
+            firm_id=firm_id,
+            user_id=user_id,
+            cache_prompt=cache_prompt,
+        ):
+            if "contentBlockDelta" in event:
+                block_delta = event["contentBlockDelta"]
+                block = blocks.setdefault(block_delta.get("contentBlockIndex", 0), {"parts": []})
+                delta = block_delta["delta"]
+                if "toolUse" in delta:
+                    block["parts"].append(delta["toolUse"].get("input", ""))
+                else:
+                    block["parts"].append(delta.get("text", ""))
+            elif "contentBlockStart" in event:
+                block_start = event["contentBlockStart"]
+                tool_use = block_start.get("start", {}).get("toolUse")
+                if tool_use is not None:
+                    blocks[block_start.get("contentBlockIndex", 0)] = {
+                        "toolUse": dict(tool_use),
+                        "parts": [],
+                    }
+            elif "messageStop" in event:
+                stop_reason = event["messageStop"].get("stopReason")
+            elif "metadata" in event:
+                usage = event["metadata"].get("usage", {})
+
+        content = []
+        for index in sorted(blocks):
+            block = blocks[index]
+            joined = "".join(block["parts"])
+            if "toolUse" in block:
+                tool_use = block["toolUse"]
+                tool_use["input"] = json.loads(joined) if joined else {}
+                content.append({"toolUse": tool_use})
+            else:
+                content.append({"text": joined})
+
+        response = {
+            "output": {"message": {"role": "assistant", "content": content}},
+            "stopReason": stop_reason,
+            "usage": usage,
+        }
+        tool_use = find_tool_use_block(response)
+        if tool_use is not None:
+            response[CACHED_TOOL_USE_KEY] = tool_use
+        return response
+
+    def _stream_events(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+        cache_prompt: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Run converse_stream and yield raw stream events, logging usage at the end.
+
+        Shared by invoke_stream and invoke_via_stream; see those for arguments.
+        """
+        if correlation_id is None:
+            correlation_id = generate_correlation_id()
+
+        request_body = self._build_request_body(
+            messages, system, temperature, max_tokens, tools, tool_choice, cache_prompt
+        )
+        prompt_tokens = self._estimate_tokens(messages, system)
+
+        log_bedrock_request(
+            self.logger,
+            model_id=self.config.model_id,
+            prompt_tokens=prompt_tokens,
+            correlation_id=correlation_id,
+            firm_id=firm_id,
+            user_id=user_id,
+            temperature=request_body["temperature"],
+            max_tokens=request_body["maxTokens"],
+            has_tools=tools is not None,
+            tool_count=len(tools) if tools else 0,
+            streaming=True,
+        )
+
+        limiter = _get_rate_limiter(self.config, self.config.model_id)
+        reserved = prompt_tokens + request_body["maxTokens"]
+        if limiter is not None:
+            limiter.acquire(reserved, self.config.rate_limit_max_wait)
+
+        start_time = time.perf_counter()
+        settled = False
+        try:
+            response = self.client.converse_stream(
+                modelId=self.config.model_id, **request_body
+            )
+
+            usage: dict[str, Any] = {}
+            tool_used = None
+            for event in response["stream"]:
+                yield event
+                if "contentBlockStart" in event:
+                    start = event["contentBlockStart"].get("start", {})
+                    if "toolUse" in start:
+                        tool_used = start["toolUse"].get("name")
+                elif "metadata" in event:
+                    usage = event["metadata"].get("usage", {})
+
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            _USED_CLIENT_IDS.add(id(self.client))
+            input_tokens = usage.get("inputTokens", prompt_tokens)
+            output_tokens = usage.get("outputTokens", 0)
+            if limiter is not None:
+                limiter.refund(request_body["maxTokens"] - output_tokens)
+            settled = True
+            cache_read_tokens = usage.get("cacheReadInputTokens", 0)
+            cache_write_tokens = usage.get("cacheWriteInputTokens", 0)
+
+            log_bedrock_response(
+                self.logger,
+                model_id=self.config.model_id,
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                latency_ms=latency_ms,
+                correlation_id=correlation_id,
+                firm_id=firm_id,
+                user_id=user_id,
+                cost_estimate=self.config.calculate_cost(
+                    input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+                ),
+                tool_used=tool_used,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
+            )
+
+        except Exception as e:
+            if limiter is not None and not settled:
+                limiter.refund(reserved, requests=1)
             log_bedrock_error(
                 self.logger,
                 error=e,
@@ -241,6 +772,331 @@ class BedrockClient:
         # Extract and validate result
         return extract_tool_result(response, tool_schema)
 
+    def batch_invoke(
+        self,
+        records: list[dict[str, Any]],
+        job_name: str | None = None,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 300.0,
+        timeout: float = 24 * 3600,
+        correlation_id: str | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Run many prompts as one Bedrock batch inference job and wait for it.
+
+        Meant for non-interactive work (backfills, overnight regeneration):
+        records are written as JSONL under config.batch_s3_uri, the job is
+        polled with exponential backoff, and each output line is converted
+        to the converse response shape so extract_tool_result works on it
+        unchanged. Batch tokens cost BATCH_COST_FACTOR of the on-demand rate
+        and do not count against on-demand request quotas. Bedrock enforces
+        a minimum number of records per job; small jobs should use invoke().
+
+        Args:
+            records: Dicts with a unique ``custom_id`` and ``params``, the
+                keyword arguments invoke() would take (messages, system,
+                temperature, max_tokens, tools, tool_choice)
+            job_name: Batch job name (generated if None)
+            poll_interval: Initial delay between status checks (seconds)
+            max_poll_interval: Cap on the delay between status checks (seconds)
+            timeout: Give up waiting after this many seconds
+            correlation_id: Request correlation ID for tracing
+            firm_id: Firm context for multi-tenancy
+            user_id: User context
+
+        Returns:
+            Converse-shaped responses keyed by custom_id; records the job
+            failed to process are omitted
+
+        Raises:
+            BedrockConfigurationError: If batch S3 URI or role ARN is not configured
+            BedrockServerError: If the job fails, stops, expires, or times out
+        """
+        if not (self.config.batch_s3_uri and self.config.batch_role_arn):
+            raise BedrockConfigurationError(
+                "Batch inference requires BEDROCK_BATCH_S3_URI and BEDROCK_BATCH_ROLE_ARN"
+            )
+        if correlation_id is None:
+            correlation_id = generate_correlation_id()
+        if job_name is None:
+            job_name = f"batch-{correlation_id}"
+
+        s3 = _get_aws_client("s3", self.config.aws_region, self._session)
+        control = _get_aws_client("bedrock", self.config.aws_region, self._session)
+
+        bucket, prefix = _split_s3_uri(self.config.batch_s3_uri)
+        job_prefix = f"{prefix}/{job_name}" if prefix else job_name
+        input_key = f"{job_prefix}/input.jsonl"
+        jsonl = "\n".join(
+            json.dumps(
+                {
+                    "recordId": record["custom_id"],
+                    "modelInput": self._build_model_input(**record["params"]),
+                }
+            )
+            for record in records
+        )
+        s3.put_object(Bucket=bucket, Key=input_key, Body=jsonl.encode("utf-8"))
+
+        log_bedrock_request(
+            self.logger,
+            model_id=self.config.model_id,
+            prompt_tokens=sum(
+                self._estimate_tokens(r["params"]["messages"], r["params"].get("system"))
+                for r in records
+            ),
+            correlation_id=correlation_id,
+            firm_id=firm_id,
+            user_id=user_id,
+            batch=True,
+            record_count=len(records),
+        )
+
+        start_time = time.perf_counter()
+        try:
+            job_arn = control.create_model_invocation_job(
+                jobName=job_name,
+                roleArn=self.config.batch_role_arn,
+                modelId=self.config.model_id,
+                inputDataConfig={
+                    "s3InputDataConfig": {
+                        "s3Uri": f"s3://{bucket}/{input_key}",
+                        "s3InputFormat": "JSONL",
+                    }
+                },
+                outputDataConfig={
+                    "s3OutputDataConfig": {"s3Uri": f"s3://{bucket}/{job_prefix}/output/"}
+                },
+            )["jobArn"]
+
+            delay = poll_interval
+            while True:
+                job = control.get_model_invocation_job(jobIdentifier=job_arn)
+                status = job["status"]
+                if status in _BATCH_TERMINAL_STATES:
+                    break
+                if time.perf_counter() - start_time + delay > timeout:
+                    raise BedrockServerError(
+                        f"Batch job {job_name} still {status} after {timeout:.0f}s"
+                    )
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+
+            if status not in ("Completed", "PartiallyCompleted"):
+                raise BedrockServerError(
+                    f"Batch job {job_name} ended {status}: {job.get('message', '')}"
+                )
+
+            # Output lands under <output uri>/<job id>/<input file name>.out
+            job_id = job_arn.rsplit("/", 1)[-1]
+            body = s3.get_object(
+                Bucket=bucket, Key=f"{job_prefix}/output/{job_id}/input.jsonl.out"
+            )["Body"].read()
+
+            responses: dict[str, dict[str, Any]] = {}
+            input_tokens = output_tokens = 0
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                model_output = record.get("modelOutput")
+                if model_output is None:
+                    self.logger.warning(
+                        f"Batch record {record.get('recordId')} failed: {record.get('error')}",
+                        extra={"correlation_id": correlation_id},
+                    )
+                    continue
+                response = self._converse_response(model_output)
+                input_tokens += response["usage"]["inputTokens"]
+                output_tokens += response["usage"]["outputTokens"]
+                responses[record["recordId"]] = response
+
+            log_bedrock_response(
+                self.logger,
+                model_id=self.config.model_id,
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                latency_ms=(time.perf_counter() - start_time) * 1000,
+                correlation_id=correlation_id,
+                firm_id=firm_id,
+                user_id=user_id,
+                cost_estimate=self.config.calculate_cost(input_tokens, output_tokens)
+                * BATCH_COST_FACTOR,
+                batch=True,
+                record_count=len(records),
+                succeeded_count=len(responses),
+            )
+            return responses
+
+        except Exception as e:
+            log_bedrock_error(
+                self.logger,
+                error=e,
+                model_id=self.config.model_id,
+                correlation_id=correlation_id,
+                firm_id=firm_id,
+                user_id=user_id,
+            )
+            raise
+
+    def _build_model_input(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        cache_prompt: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Build an Anthropic messages body for a batch record.
+
+        Batch inference takes the model's native request format rather than
+        Converse's, so converse-style tool specs, tool choices, text blocks,
+        and cache points (as cache_control) are translated here.
+
+        Args:
+            messages: Conversation messages
+            system: System prompt
+            temperature: Temperature override
+            max_tokens: Max tokens override
+            tools: Tool definitions (converse toolSpec format)
+            tool_choice: Forced tool directive
+            cache_prompt: Mark the system prompt as a cache breakpoint
+
+        Returns:
+            Anthropic messages request body
+        """
+        model_input: dict[str, Any] = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens or self.config.max_tokens,
+            "temperature": temperature
+            if temperature is not None
+            else self.config.temperature_extraction,
+            "messages": [
+                {
+                    "role": message["role"],
+                    "content": message["content"]
+                    if isinstance(message["content"], str)
+                    else _anthropic_content(message["content"]),
+                }
+                for message in messages
+            ],
+        }
+        if system:
+            model_input["system"] = (
+                [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+                if cache_prompt
+                else system
+            )
+        if tools:
+            model_input["tools"] = [
+                {
+                    "name": tool["toolSpec"]["name"],
+                    "description": tool["toolSpec"].get("description", ""),
+                    "input_schema": tool["toolSpec"]["inputSchema"]["json"],
+                }
+                for tool in tools
+            ]
+        if tool_choice:
+            if "type" in tool_choice:
+                model_input["tool_choice"] = tool_choice
+            elif "tool" in tool_choice:
+                model_input["tool_choice"] = {"type": "tool", "name": tool_choice["tool"]["name"]}
+            else:
+                model_input["tool_choice"] = {"type": next(iter(tool_choice))}
+        return model_input
+
+    @staticmethod
+    def _converse_response(model_output: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert an Anthropic messages response into the converse response shape.
+
+        Args:
+            model_output: Native model response from a batch output record
+
+        Returns:
+            Response dict with output.message.content, stopReason and usage
+        """
+        content = []
+        for block in model_output.get("content", []):
+            if block.get("type") == "tool_use":
+                content.append(
+                    {
+                        "toolUse": {
+                            "toolUseId": block.get("id"),
+                            "name": block.get("name"),
+                            "input": block.get("input", {}),
+                        }
+                    }
+                )
+            else:
+                content.append({"text": block.get("text", "")})
+
+        usage = model_output.get("usage", {})
+        response = {
+            "output": {"message": {"role": "assistant", "content": content}},
+            "stopReason": model_output.get("stop_reason"),
+            "usage": {
+                "inputTokens": usage.get("input_tokens", 0),
+                "outputTokens": usage.get("output_tokens", 0),
+            },
+        }
+        tool_use = find_tool_use_block(response)
+        if tool_use is not None:
+            response[CACHED_TOOL_USE_KEY] = tool_use
+        return response
+
+    def _build_request_body(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        tools: list[dict[str, Any]] | None,
+        tool_choice: dict[str, Any] | None,
+        cache_prompt: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Build the Converse request body shared by invoke and invoke_stream.
+
+        Args:
+            messages: Conversation messages
+            system: System prompt
+            temperature: Temperature override
+            max_tokens: Max tokens override
+            tools: Tool definitions
+            tool_choice: Forced tool directive
+            cache_prompt: Add a prompt cache point after the system prompt
+
+        Returns:
+            Request keyword arguments (excluding modelId)
+        """
+        request_body = {
+            "anthropicVersion": "bedrock-2023-05-31",
+            "messages": messages,
+            "maxTokens": max_tokens or self.config.max_tokens,
+            "temperature": temperature
+            if temperature is not None
+            else self.config.temperature_extraction,
+        }
+
+        # Add optional parameters
+        if system:
+            # Tools precede the system prompt, so this point caches both
+            request_body["system"] = (
+                [{"text": system}, CACHE_POINT] if cache_prompt else system
+            )
+        if tools:
+            request_body["tools"] = tools
+        if tool_choice:
+            request_body["toolChoice"] = tool_choice
+
+        return request_body
+
     def _estimate_tokens(
         self, messages: list[dict[str, Any]], system: str | None = None
     ) -> int:
@@ -255,19 +1111,32 @@ class BedrockClient:
             Estimated token count
         """
         # Rough approximation: 4 characters per token
-        char_count = 0
-
-        if system:
-            char_count += len(system)
+        char_count = len(system) if system else 0
 
         for message in messages:
             content = message.get("content", "")
             if isinstance(content, str):
                 char_count += len(content)
             elif isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict):
-                        if "text" in block:
-                            char_count += len(block["text"])
+                char_count += sum(
+                    len(block["text"])
+                    for block in content
+                    if isinstance(block, dict) and "text" in block
+                )
+
+        return char_count >> 2
 
-        return char_count // 4
+
+@functools.cache
+def get_default_client() -> BedrockClient:
+    """
+    Get the process-wide BedrockClient built from default configuration.
+
+    DocumentAnalyzer, LetterGenerator, and the extractors fall back to this
+    when no client is passed, so they share one client (and its keep-alive
+    connections) instead of each constructing their own.
+
+    Returns:
+        Shared BedrockClient instance
+    """
+    return BedrockClient()
@@ -1,9 +1,13 @@
 """Bedrock-specific configuration and helpers."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..config import get_settings
 
+# Prompt cache pricing relative to the uncached input token rate
+CACHE_READ_RATE_FACTOR = 0.1
+CACHE_WRITE_RATE_FACTOR = 1.25
+
 
 @dataclass
 class BedrockConfig:
@@ -19,6 +23,27 @@ class BedrockConfig:
     cost_per_input_token: float
     cost_per_output_token: float
     aws_region: str
+    batch_s3_uri: str | None = None
+    batch_role_arn: str | None = None
+    model_id_small: str | None = None
+    cost_per_input_token_small: float | None = None
+    cost_per_output_token_small: float | None = None
+    tokens_per_minute: int | None = None
+    requests_per_minute: int | None = None
+    rate_limit_max_wait: float = 5.0
+    _input_rate: float = field(init=False, repr=False, compare=False)
+    _output_rate: float = field(init=False, repr=False, compare=False)
+    _small_rates: tuple[float, float] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve per-token rates once so calculate_cost is a single expression."""
+        self._input_rate = float(self.cost_per_input_token)
+        self._output_rate = float(self.cost_per_output_token)
+        self._small_rates = None
+        small_input = self.cost_per_input_token_small
+        small_output = self.cost_per_output_token_small
+        if small_input is not None and small_output is not None:
+            self._small_rates = (float(small_input), float(small_output))
 
     @classmethod
     def from_settings(cls) -> "BedrockConfig":
@@ -35,19 +60,45 @@ class BedrockConfig:
             cost_per_input_token=settings.bedrock_cost_per_input_token,
             cost_per_output_token=settings.bedrock_cost_per_output_token,
             aws_region=settings.aws_region,
+            batch_s3_uri=settings.bedrock_batch_s3_uri,
+            batch_role_arn=settings.bedrock_batch_role_arn,
+            model_id_small=settings.bedrock_model_id_small,
+            cost_per_input_token_small=settings.bedrock_cost_per_input_token_small,
+            cost_per_output_token_small=settings.bedrock_cost_per_output_token_small,
+            tokens_per_minute=settings.bedrock_tokens_per_minute,
+            requests_per_minute=settings.bedrock_requests_per_minute,
+            rate_limit_max_wait=settings.bedrock_rate_limit_max_wait,
         )
 
-    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        model_id: str | None = None,
+    ) -> float:
         """
         Calculate estimated cost for token usage.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
+            model_id: Model that was invoked (priced at the small model's
+                rates when it is model_id_small; defaults to model_id)
 
         Returns:
             Estimated cost in USD
         """
-        input_cost = input_tokens * self.cost_per_input_token
-        output_cost = output_tokens * self.cost_per_output_token
-        return input_cost + output_cost
+        input_rate, output_rate = self._input_rate, self._output_rate
+        if model_id is not None and model_id == self.model_id_small and self._small_rates:
+            input_rate, output_rate = self._small_rates
+        cost = input_tokens * input_rate + output_tokens * output_rate
+        if cache_read_tokens or cache_write_tokens:
+            cost += input_rate * (
+                cache_read_tokens * CACHE_READ_RATE_FACTOR
+                + cache_write_tokens * CACHE_WRITE_RATE_FACTOR
+            )
+        return cost
@@ -31,6 +31,12 @@ class BedrockThrottlingError(BedrockError):
         self.retry_after = retry_after
 
 
+class BedrockRateLimitError(BedrockThrottlingError):
+    """Client-side rate limit would be exceeded; raised before calling Bedrock and not retried."""
+
+    pass
+
+
 class BedrockValidationError(BedrockError):
     """Tool output validation errors."""
 
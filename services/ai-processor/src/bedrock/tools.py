@@ -1,14 +1,27 @@
 """Tool calling definitions for structured outputs with Claude."""
 
-from typing import Any, Type
+import functools
+import json
+from typing import Any, Type, get_args, get_origin
 
 from pydantic import BaseModel
 
 
+@functools.lru_cache(maxsize=32)
+def _json_schema(model: Type[BaseModel]) -> dict[str, Any]:
+    """Build a model's JSON schema once, however many tools are built from it."""
+    return model.model_json_schema()
+
+
+@functools.lru_cache(maxsize=128)
 def pydantic_to_tool_schema(model: Type[BaseModel], name: str, description: str) -> dict[str, Any]:
     """
     Convert Pydantic model to Bedrock tool calling schema.
 
+    Results are cached per (model, name, description), and every tool built
+    from the same model shares one JSON schema dictionary; treat the
+    returned dictionary as read-only.
+
     Args:
         model: Pydantic model class
         name: Tool name
@@ -17,8 +30,8 @@ def pydantic_to_tool_schema(model: Type[BaseModel], name: str, description: str)
     Returns:
         Tool schema dictionary for Bedrock API
     """
-    # Get JSON schema from Pydantic model
-    json_schema = model.model_json_schema()
+    # Get JSON schema from Pydantic model (shared across tool names)
+    json_schema = _json_schema(model)
 
     # Convert to Bedrock tool format
     tool_schema = {
@@ -34,10 +47,13 @@ def pydantic_to_tool_schema(model: Type[BaseModel], name: str, description: str)
     return tool_schema
 
 
+@functools.lru_cache(maxsize=128)
 def create_tool_choice(tool_name: str) -> dict[str, Any]:
     """
     Create tool choice directive to force Claude to use specific tool.
 
+    Results are cached per tool name; treat the returned dictionary as read-only.
+
     Args:
         tool_name: Name of the tool to use
 
@@ -51,13 +67,65 @@ def create_tool_choice(tool_name: str) -> dict[str, Any]:
     }
 
 
-def extract_tool_result(response: dict[str, Any], model: Type[BaseModel]) -> BaseModel:
+# Response key under which BedrockClient.invoke stores the parsed toolUse block
+CACHED_TOOL_USE_KEY = "_cached_tool_use"
+
+
+def find_tool_use_block(response: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Find the first toolUse block in a Bedrock response.
+
+    Args:
+        response: Bedrock API response
+
+    Returns:
+        The toolUse dictionary, or None if the response has no tool use
+    """
+    content = response.get("output", {}).get("message", {}).get("content", [])
+    return next((block["toolUse"] for block in content if "toolUse" in block), None)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build nested models found in an annotation (Model, list[Model], Optional[Model])."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct(annotation, value) if isinstance(value, dict) else value
+    if get_origin(annotation) is list and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, item) for item in value]
+    for arg in get_args(annotation):
+        if arg is not type(None):
+            constructed = _construct_value(arg, value)
+            if constructed is not value:
+                return constructed
+    return value
+
+
+def _construct(model: Type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Recursively build a model with model_construct (no validation or coercion)."""
+    values = {
+        name: _construct_value(field.annotation, data[name])
+        for name, field in model.model_fields.items()
+        if name in data
+    }
+    return model.model_construct(**values)
+
+
+def extract_tool_result(
+    response: dict[str, Any], model: Type[BaseModel], validate: bool = True
+) -> BaseModel:
     """
     Extract and validate tool result from Bedrock response.
 
+    With validate=False the model (and any nested models) are built with
+    model_construct after only a top-level shape check. That skips the
+    validator pipeline, so it also skips type coercion and field validators
+    (e.g. enum conversion and date parsing); use it only for models whose
+    fields are plain JSON types, or when raw values are acceptable.
+
     Args:
         response: Bedrock API response
         model: Pydantic model to validate against
+        validate: Run full Pydantic validation (default)
 
     Returns:
         Validated Pydantic model instance
@@ -67,15 +135,8 @@ def extract_tool_result(response: dict[str, Any], model: Type[BaseModel]) -> Bas
     """
     from .exceptions import BedrockValidationError
 
-    # Navigate response structure
-    content = response.get("output", {}).get("message", {}).get("content", [])
-
-    # Find tool use block
-    tool_use = None
-    for block in content:
-        if "toolUse" in block:
-            tool_use = block["toolUse"]
-            break
+    # Reuse the block located by BedrockClient.invoke when available
+    tool_use = response.get(CACHED_TOOL_USE_KEY) or find_tool_use_block(response)
 
     if not tool_use:
         raise BedrockValidationError("No tool use found in response")
@@ -83,6 +144,20 @@ def extract_tool_result(response: dict[str, Any], model: Type[BaseModel]) -> Bas
     # Extract input data
     tool_input = tool_use.get("input", {})
 
+    if not validate:
+        if not isinstance(tool_input, dict):
+            raise BedrockValidationError("Tool output validation failed: expected an object")
+        missing = [
+            name
+            for name, field in model.model_fields.items()
+            if field.is_required() and name not in tool_input
+        ]
+        if missing:
+            raise BedrockValidationError(
+                f"Tool output validation failed: missing fields {missing}"
+            )
+        return _construct(model, tool_input)
+
     # Validate with Pydantic model
     try:
         return model.model_validate(tool_input)
@@ -90,6 +165,79 @@ def extract_tool_result(response: dict[str, Any], model: Type[BaseModel]) -> Bas
         raise BedrockValidationError(f"Tool output validation failed: {e}") from e
 
 
+class ToolInputScanner:
+    """
+    Incrementally scan streamed toolUse input for completed top-level fields.
+
+    Feed the partial JSON fragments from converse_stream in order; each call
+    returns the (name, value) pairs of top-level object fields whose values
+    finished in that fragment, so callers can act on a field before the rest
+    of the tool input has been generated. Every character is scanned once.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._key: str | None = None
+        self._token: list[str] | None = None
+
+    def feed(self, fragment: str) -> list[tuple[str, Any]]:
+        """
+        Scan the next fragment of tool input.
+
+        Args:
+            fragment: Next chunk of the partial JSON string
+
+        Returns:
+            Top-level fields completed by this fragment, in order
+        """
+        self._parts.append(fragment)
+        completed = []
+        for char in fragment:
+            if self._token is not None:
+                self._token.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key is None:
+                        # Closing quote of a top-level key
+                        self._key = json.loads("".join(self._token))
+                        self._token = None
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._token is None:
+                    self._token = [char]
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0 and self._token is not None:
+                    completed.append(self._finish_field())
+            elif char == "," and self._depth == 1 and self._token is not None:
+                completed.append(self._finish_field())
+            elif char == ":" and self._depth == 1:
+                self._token = []
+        return completed
+
+    def _finish_field(self) -> tuple[str, Any]:
+        """Parse the value that just ended, without its trailing delimiter."""
+        value = json.loads("".join(self._token[:-1]))
+        field = (self._key, value)
+        self._key = None
+        self._token = None
+        return field
+
+    def text(self) -> str:
+        """Return all input fed so far."""
+        return "".join(self._parts)
+
+
 # Example tool schemas (can be used as templates)
 
 class ExtractedFact(BaseModel):
@@ -105,3 +253,12 @@ class ExampleExtraction(BaseModel):
 
     facts: list[ExtractedFact]
     summary: str
+
+
+# Prebuilt tool schemas for the example models (built once at import)
+EXTRACTED_FACT_TOOL = pydantic_to_tool_schema(
+    ExtractedFact, "extract_fact", "Extract a single fact"
+)
+EXAMPLE_EXTRACTION_TOOL = pydantic_to_tool_schema(
+    ExampleExtraction, "extract_data", "Extract facts and a summary from a document"
+)
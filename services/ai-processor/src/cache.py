@@ -0,0 +1,56 @@
+"""
+Result cache for the AI processor service.
+
+Optional Redis-backed cache used to skip repeat Bedrock calls. As in the API
+service, caching is disabled when REDIS_URL is not configured or the redis
+package is unavailable; callers then fall through to normal processing.
+"""
+
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How long cached extraction results live (seconds)
+EXTRACTION_CACHE_TTL_SECONDS = int(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", "86400"))
+
+_redis_client: Any | None = None
+_redis_initialized = False
+
+
+def get_redis_client() -> Any | None:
+    """
+    Get the shared Redis client, or None when caching is disabled.
+
+    Returns:
+        redis.Redis instance, or None if REDIS_URL is unset or Redis is unavailable
+    """
+    global _redis_client, _redis_initialized
+    if _redis_initialized:
+        return _redis_client
+    _redis_initialized = True
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        logger.info("REDIS_URL not configured. Extraction caching will be disabled.")
+        return None
+
+    try:
+        import redis
+
+        # Short timeouts: a slow cache must never cost more than it saves
+        _redis_client = redis.Redis.from_url(
+            redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+        )
+    except Exception as e:
+        logger.warning(f"Failed to initialize Redis client: {e}")
+        _redis_client = None
+    return _redis_client
+
+
+def reset_redis_client() -> None:
+    """Forget the shared Redis client (useful for testing)."""
+    global _redis_client, _redis_initialized
+    _redis_client = None
+    _redis_initialized = False
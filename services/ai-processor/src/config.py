@@ -1,6 +1,10 @@
 """Application configuration using pydantic-settings."""
 
-from pydantic import Field
+import functools
+import os
+import sys
+
+from pydantic import Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -27,6 +31,10 @@ class Settings(BaseSettings):
         default="anthropic.claude-3-5-sonnet-20241022-v2:0",
         description="Claude model ID for Bedrock",
     )
+    bedrock_model_id_small: str = Field(
+        default="anthropic.claude-3-5-haiku-20241022-v1:0",
+        description="Smaller Claude model ID for light rewrites (tone, header and closing)",
+    )
     bedrock_max_tokens: int = Field(
         default=4096, description="Maximum tokens for Bedrock responses"
     )
@@ -37,6 +45,16 @@ class Settings(BaseSettings):
         default=0.7, description="Temperature for generation (creative)"
     )
 
+    # Batch inference (non-interactive jobs; both must be set to submit)
+    bedrock_batch_s3_uri: str | None = Field(
+        default=None,
+        description="S3 prefix (s3://bucket/prefix) for batch inference input and output",
+    )
+    bedrock_batch_role_arn: str | None = Field(
+        default=None,
+        description="IAM role Bedrock assumes to read and write batch inference data",
+    )
+
     # Retry Configuration
     bedrock_max_retries: int = Field(
         default=3, description="Maximum retry attempts for Bedrock API calls"
@@ -48,6 +66,18 @@ class Settings(BaseSettings):
         default=60.0, description="Maximum delay for exponential backoff (seconds)"
     )
 
+    # Client-side rate limiting (set to the account's Bedrock quotas to enable)
+    bedrock_tokens_per_minute: int | None = Field(
+        default=None, description="Bedrock tokens-per-minute quota for the model"
+    )
+    bedrock_requests_per_minute: int | None = Field(
+        default=None, description="Bedrock requests-per-minute quota for the model"
+    )
+    bedrock_rate_limit_max_wait: float = Field(
+        default=5.0,
+        description="Longest wait for quota (seconds) before failing with a throttling error",
+    )
+
     # Cost Tracking (Claude 3.5 Sonnet pricing as of 2024)
     bedrock_cost_per_input_token: float = Field(
         default=0.000003, description="Cost per input token (USD)"
@@ -55,6 +85,12 @@ class Settings(BaseSettings):
     bedrock_cost_per_output_token: float = Field(
         default=0.000015, description="Cost per output token (USD)"
     )
+    bedrock_cost_per_input_token_small: float = Field(
+        default=0.0000008, description="Cost per input token for the small model (USD)"
+    )
+    bedrock_cost_per_output_token_small: float = Field(
+        default=0.000004, description="Cost per output token for the small model (USD)"
+    )
 
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -65,19 +101,41 @@ class Settings(BaseSettings):
     )
 
 
-# Singleton settings instance
-_settings: Settings | None = None
+def load_settings() -> Settings:
+    """
+    Load settings, preferring a pre-validated JSON snapshot when configured.
+
+    SETTINGS_SNAPSHOT_PATH may point at a file produced at deploy time with
+    ``python -m src.config > settings.json``. Validating that JSON in one pass
+    skips .env parsing and per-field environment lookups. Without a snapshot
+    (or if the file is missing) settings come from the environment as usual.
+    """
+    snapshot_path = os.environ.get("SETTINGS_SNAPSHOT_PATH")
+    if snapshot_path and os.path.exists(snapshot_path):
+        with open(snapshot_path, "rb") as f:
+            return Settings.model_validate_json(f.read())
+    return Settings()
 
 
+@functools.cache
 def get_settings() -> Settings:
-    """Get settings instance (singleton pattern)."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get settings instance (cached after the first successful load)."""
+    return load_settings()
 
 
 def reset_settings() -> None:
     """Reset settings (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
+
+
+# Warm the cache at import so .env parsing and validation happen during the
+# Lambda init phase. Incomplete environments (e.g. tests) fail lazily instead.
+try:
+    get_settings()
+except ValidationError:
+    pass
+
+
+if __name__ == "__main__":
+    # Emit a settings snapshot for SETTINGS_SNAPSHOT_PATH
+    sys.stdout.write(Settings().model_dump_json() + "\n")
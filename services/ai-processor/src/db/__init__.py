@@ -2,20 +2,31 @@
 Database connection module for AI processor service.
 """
 
+from . import connection
 from .connection import (
-    engine,
+    get_engine,
     SessionLocal,
     get_db_session,
     get_session,
     test_connection,
+    warmup,
     close_connections,
 )
 
 __all__ = [
     "engine",
+    "get_engine",
     "SessionLocal",
     "get_db_session",
     "get_session",
     "test_connection",
+    "warmup",
     "close_connections",
 ]
+
+
+def __getattr__(name: str):
+    # Defer engine creation until first use (see connection.get_engine)
+    if name == "engine":
+        return connection.get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,156 @@
+"""
+Async database connection management for AI Processor service.
+
+This module provides an asyncpg-backed SQLAlchemy async engine and session
+factory for I/O-bound code paths that run on an event loop. It is kept
+separate from connection.py so the sync path does not require greenlet or
+asyncpg.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from .connection import (
+    AI_PROCESSOR_ROLE,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_QUERY_CACHE_SIZE,
+    dump_json,
+    ping_if_idle,
+    receive_checkin,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Create async session factory (bound when the engine is first created)
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False)
+
+_async_engine: AsyncEngine | None = None
+
+
+def _async_database_url(url: str) -> str:
+    """
+    Point a PostgreSQL URL at the asyncpg driver.
+
+    Args:
+        url: Database URL with any (or no) explicit PostgreSQL driver
+
+    Returns:
+        str: Equivalent postgresql+asyncpg URL
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def _make_async_engine(role: str = AI_PROCESSOR_ROLE) -> AsyncEngine:
+    """
+    Create the async engine for a process role.
+
+    Args:
+        role: "worker" for an unpooled engine (NullPool), otherwise pooled
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine
+    """
+    url = _async_database_url(DATABASE_URL)
+    if role == "worker":
+        return create_async_engine(
+            url,
+            poolclass=NullPool,
+            query_cache_size=DB_QUERY_CACHE_SIZE,
+            json_serializer=dump_json,
+            json_deserializer=orjson.loads,
+            echo=False,
+        )
+    async_engine = create_async_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        json_serializer=dump_json,
+        json_deserializer=orjson.loads,
+        echo=False,
+    )
+    if not DB_POOL_PRE_PING:
+        # Pool events fire on the sync engine wrapped by the async one
+        event.listen(async_engine.sync_engine, "checkin", receive_checkin)
+        event.listen(async_engine.sync_engine, "checkout", ping_if_idle)
+    return async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the process-wide async engine, creating it on first use.
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _make_async_engine()
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for database sessions.
+
+    Usage:
+        async with get_async_db_session() as session:
+            result = await session.execute(select(Model))
+
+    Yields:
+        AsyncSession: SQLAlchemy async session
+    """
+    get_async_engine()
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error: {e}")
+            raise
+
+
+async def close_async_connections():
+    """
+    Close all async database connections.
+    Should be called on application shutdown.
+    """
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    logger.info("Async database connections closed")
+
+
+# Export commonly used items
+__all__ = [
+    "AsyncSessionLocal",
+    "get_async_engine",
+    "get_async_db_session",
+    "close_async_connections",
+]
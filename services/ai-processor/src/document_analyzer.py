@@ -4,20 +4,27 @@ Document Analyzer
 Main module for analyzing documents and extracting structured information using Claude.
 """
 
+import hashlib
 import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import repeat
+from multiprocessing import get_all_start_methods, get_context
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
-import pypdf
+import pymupdf
 
-from .bedrock.client import BedrockClient
+from .bedrock.client import BedrockClient, get_default_client
+from .cache import EXTRACTION_CACHE_TTL_SECONDS, get_redis_client
 from .bedrock.tools import pydantic_to_tool_schema, extract_tool_result
 from .prompts.extraction_prompts import (
-    SYSTEM_PROMPT,
+    EXTRACTION_PROMPT_VERSION,
     get_extraction_prompt,
-    get_document_type_guidelines,
+    get_system_prompt,
 )
 from .schemas.extraction import (
     ExtractedData,
@@ -26,6 +33,175 @@ from .schemas.extraction import (
 )
 
 
+# Tool schema for structured output, built once at import
+_DOCUMENT_DATA_TOOL_SCHEMA = pydantic_to_tool_schema(
+    ExtractedData,
+    name="extract_document_data",
+    description="Extract structured information from the legal document",
+)
+
+# Below this many pages, spawning worker processes costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 32
+
+# Page workers start from a fresh interpreter rather than a fork, which could
+# copy locks held by the logging QueueListener or metrics drain thread
+_PAGE_POOL_CONTEXT = get_context(
+    "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+)
+
+# Documents longer than this are split into overlapping chunks, extracted in
+# parallel, and merged; shorter documents use a single Bedrock call
+CHUNK_MAX_CHARS = 40_000
+CHUNK_OVERLAP_CHARS = 2_000
+MAX_CHUNK_WORKERS = 8
+
+
+def _chunk_text(
+    text: str, max_chars: int = CHUNK_MAX_CHARS, overlap: int = CHUNK_OVERLAP_CHARS
+) -> list[str]:
+    """
+    Split text into chunks of at most max_chars, each overlapping the last.
+
+    Chunks end on a line break where one falls in the back half of the
+    window, so sentences are rarely cut mid-way; the overlap keeps anything
+    straddling a boundary whole in at least one chunk.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+        overlap: Characters repeated from the end of the previous chunk
+
+    Returns:
+        List of chunks (a single chunk when text fits in max_chars)
+
+    Raises:
+        ValueError: If overlap is not less than half of max_chars
+    """
+    if overlap >= max_chars // 2:
+        raise ValueError("overlap must be less than half of max_chars")
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks = []
+    start = 0
+    while True:
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            cut = text.rfind("\n", start + max_chars // 2, end)
+            if cut != -1:
+                end = cut + 1
+        chunks.append(text[start:end])
+        if end >= len(text):
+            return chunks
+        start = end - overlap
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a dedup key component (case- and whitespace-insensitive)."""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def _dedupe(items: list, key: Callable[[Any], tuple]) -> list:
+    """Drop items whose normalized key was already seen, keeping first occurrences."""
+    seen = set()
+    unique = []
+    for item in items:
+        item_key = tuple(_normalize(part) for part in key(item))
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+def _merge_extractions(chunks: list[ExtractedData]) -> ExtractedData:
+    """
+    Merge per-chunk extractions of one document into a single result.
+
+    Parties, damages, and facts are concatenated in document order and
+    deduplicated (chunk overlap means boundary items are usually seen twice).
+    Metadata and summary come from the first chunk, which holds the document
+    header; the incident is the first one found.
+    """
+    first = chunks[0]
+    damages = _dedupe(
+        [d for c in chunks for d in c.damages],
+        key=lambda d: (d.damage_type, d.amount, d.provider),
+    )
+    notes = [c.extraction_notes for c in chunks if c.extraction_notes]
+
+    merged = ExtractedData(
+        metadata=first.metadata,
+        parties=_dedupe(
+            [p for c in chunks for p in c.parties],
+            key=lambda p: (p.name, p.party_type),
+        ),
+        incident=next((c.incident for c in chunks if c.incident), None),
+        damages=damages,
+        case_facts=_dedupe(
+            [f for c in chunks for f in c.case_facts],
+            key=lambda f: (f.fact,),
+        ),
+        summary=first.summary,
+        extraction_notes="\n".join(dict.fromkeys(notes)) or None,
+    )
+    # Chunk estimates overlap, so recompute from the deduplicated entries
+    if any(c.total_damages_estimate is not None for c in chunks):
+        merged.total_damages_estimate = merged.calculate_total_damages()
+    return merged
+
+
+def _open_pdf(source: bytes | str) -> pymupdf.Document:
+    """Open a PDF from raw bytes or a filesystem path."""
+    if isinstance(source, bytes):
+        return pymupdf.open(stream=source, filetype="pdf")
+    return pymupdf.open(source)
+
+
+def _pdf_source(pdf_file: BinaryIO | Path) -> bytes | str:
+    """
+    Resolve a PDF argument to something MuPDF can open.
+
+    Paths, and file objects backed by a regular file on disk, resolve to a
+    filesystem path so MuPDF reads the file itself instead of the whole PDF
+    being copied into Python bytes first. Other streams are read into memory.
+    """
+    if isinstance(pdf_file, Path):
+        return str(pdf_file)
+    name = getattr(pdf_file, "name", None)
+    try:
+        if isinstance(name, str) and os.path.isfile(name) and pdf_file.tell() == 0:
+            return name
+    except (OSError, ValueError):
+        pass
+    return pdf_file.read()
+
+
+def _read_pages(
+    doc: pymupdf.Document, start: int, stop: int
+) -> Iterator[tuple[int, str | None, str | None]]:
+    """Lazily extract text for pages [start, stop) as (page_num, text, error) tuples."""
+    for page_num in range(start, stop):
+        try:
+            text = doc[page_num].get_text("text")
+        except Exception as e:
+            yield page_num, None, str(e)
+        else:
+            yield page_num, text, None
+
+
+def _extract_page_range(
+    source: bytes | str, start: int, stop: int
+) -> list[tuple[int, str | None, str | None]]:
+    """Worker entry point: open the PDF and extract one contiguous page range."""
+    doc = _open_pdf(source)
+    try:
+        return list(_read_pages(doc, start, stop))
+    finally:
+        doc.close()
+
+
 class DocumentAnalyzer:
     """
     Analyzes documents and extracts structured information.
@@ -40,16 +216,20 @@ class DocumentAnalyzer:
         self,
         bedrock_client: BedrockClient | None = None,
         logger: logging.Logger | None = None,
+        cache: Any | None = None,
     ):
         """
         Initialize document analyzer.
 
         Args:
-            bedrock_client: Bedrock client instance (creates default if None)
+            bedrock_client: Bedrock client instance (uses the shared default if None)
             logger: Logger instance (creates default if None)
+            cache: Redis-compatible client for extraction results
+                (uses the shared client from REDIS_URL if None; disabled if unset)
         """
-        self.bedrock_client = bedrock_client or BedrockClient()
+        self.bedrock_client = bedrock_client or get_default_client()
         self.logger = logger or logging.getLogger("document_analyzer")
+        self.cache = cache if cache is not None else get_redis_client()
 
     def extract_text_from_pdf(self, pdf_file: BinaryIO | Path) -> str:
         """
@@ -65,45 +245,92 @@ class DocumentAnalyzer:
             ValueError: If PDF cannot be read
         """
         try:
-            if isinstance(pdf_file, Path):
-                with open(pdf_file, "rb") as f:
-                    return self._extract_pdf_text(f)
-            else:
-                return self._extract_pdf_text(pdf_file)
+            text = "\n".join(
+                f"--- Page {page_num + 1} ---\n{page_text}\n"
+                for page_num, page_text in self._iter_pdf_pages(pdf_file)
+            )
+            if not text:
+                raise ValueError("No text could be extracted from PDF")
+            return text
         except Exception as e:
             self.logger.error(f"Failed to extract text from PDF: {e}")
             raise ValueError(f"PDF extraction failed: {e}") from e
 
-    def _extract_pdf_text(self, pdf_file: BinaryIO) -> str:
+    def _iter_pdf_pages(self, pdf_file: BinaryIO | Path) -> Iterator[tuple[int, str]]:
         """
-        Internal method to extract text from PDF file object.
+        Yield (page_num, text) for each page of a PDF that has text, in order.
+
+        Paths and on-disk file objects are opened by MuPDF directly so the
+        file is not first read into Python bytes. Smaller documents are read
+        one page at a time as the caller consumes them; documents of
+        PARALLEL_PAGE_THRESHOLD pages or more are split across worker
+        processes. Pages that fail to extract yield a placeholder.
 
         Args:
-            pdf_file: PDF file object
+            pdf_file: PDF file object or path
 
-        Returns:
-            Extracted text
+        Yields:
+            Zero-based page number and that page's text
         """
-        reader = pypdf.PdfReader(pdf_file)
-        text_parts = []
-
-        for page_num, page in enumerate(reader.pages):
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(f"--- Page {page_num + 1} ---\n{page_text}\n")
-            except Exception as e:
+        source = _pdf_source(pdf_file)
+
+        doc = _open_pdf(source)
+        try:
+            page_count = doc.page_count
+            if page_count < PARALLEL_PAGE_THRESHOLD:
+                yield from self._usable_pages(_read_pages(doc, 0, page_count))
+                return
+        finally:
+            doc.close()
+
+        yield from self._usable_pages(self._extract_pages_parallel(source, page_count))
+
+    def _usable_pages(
+        self, pages: Iterable[tuple[int, str | None, str | None]]
+    ) -> Iterator[tuple[int, str]]:
+        """Drop empty pages and replace failed ones with a logged placeholder."""
+        for page_num, page_text, error in pages:
+            if error is not None:
                 self.logger.warning(
-                    f"Failed to extract text from page {page_num + 1}: {e}"
-                )
-                text_parts.append(
-                    f"--- Page {page_num + 1} ---\n[Text extraction failed]\n"
+                    f"Failed to extract text from page {page_num + 1}: {error}"
                 )
+                yield page_num, "[Text extraction failed]"
+            elif page_text:
+                yield page_num, page_text
+
+    def _extract_pages_parallel(
+        self, source: bytes | str, page_count: int
+    ) -> list[tuple[int, str | None, str | None]]:
+        """
+        Extract pages across worker processes, one contiguous range per worker.
 
-        if not text_parts:
-            raise ValueError("No text could be extracted from PDF")
+        Extracts in-process when only one worker would run, and falls back
+        to that where process pools are not available (e.g. AWS Lambda has no
+        /dev/shm for multiprocessing) or a worker dies.
 
-        return "\n".join(text_parts)
+        Args:
+            source: PDF bytes or filesystem path
+            page_count: Number of pages in the document
+
+        Returns:
+            (page_num, text, error) tuples in page order
+        """
+        workers = min(os.cpu_count() or 1, page_count)
+        if workers <= 1:
+            return _extract_page_range(source, 0, page_count)
+        step = -(-page_count // workers)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(stops), mp_context=_PAGE_POOL_CONTEXT
+            ) as executor:
+                chunks = executor.map(_extract_page_range, repeat(source), starts, stops)
+                return [page for chunk in chunks for page in chunk]
+        except (OSError, BrokenProcessPool) as e:
+            self.logger.warning(f"Process pool unavailable, extracting serially: {e}")
+            return _extract_page_range(source, 0, page_count)
 
     def analyze_document(
         self,
@@ -129,53 +356,41 @@ class DocumentAnalyzer:
         Raises:
             ValueError: If extraction fails
         """
-        start_time = time.time()
-
-        try:
-            # Build system prompt with document-type-specific guidelines
-            system_prompt = SYSTEM_PROMPT
-            if document_type:
-                guidelines = get_document_type_guidelines(document_type)
-                if guidelines:
-                    system_prompt += f"\n\n{guidelines}"
-
-            # Build user message with extraction instructions
-            user_message = get_extraction_prompt(document_text, document_type)
-
-            # Create tool schema for structured output
-            tool_schema = pydantic_to_tool_schema(
-                ExtractedData,
-                name="extract_document_data",
-                description="Extract structured information from the legal document",
-            )
+        start_time = time.perf_counter()
 
-            # Invoke Claude with tool calling
+        # Identical text, type, model, and prompts yield the same extraction
+        cache_key = self._extraction_cache_key(document_text, document_type, firm_id)
+        cached_data = self._get_cached_extraction(cache_key)
+        if cached_data is not None:
             self.logger.info(
-                f"Starting document extraction for document {document_id}",
+                f"Extraction cache hit for document {document_id}",
                 extra={"document_id": document_id, "firm_id": firm_id},
             )
-
-            response = self.bedrock_client.invoke(
-                messages=[{"role": "user", "content": user_message}],
-                system=system_prompt,
-                tools=[tool_schema],
-                tool_choice={"type": "tool", "name": "extract_document_data"},
-                firm_id=firm_id,
-                user_id=user_id,
+            return ExtractionResult(
+                document_id=document_id,
+                extracted_data=cached_data,
+                processing_time_seconds=round(time.perf_counter() - start_time, 2),
+                token_usage={"input_tokens": 0, "output_tokens": 0},
+                model_id=self.bedrock_client.config.model_id,
+                extraction_timestamp=datetime.utcnow().isoformat() + "Z",
+                success=True,
             )
 
-            # Extract structured data from tool use
-            extracted_data = extract_tool_result(response, ExtractedData)
+        try:
+            chunks = _chunk_text(document_text)
+            if len(chunks) == 1:
+                extracted_data, token_usage = self._extract(
+                    document_text, document_type, firm_id, user_id
+                )
+            else:
+                extracted_data, token_usage = self._extract_chunked(
+                    chunks, document_type, firm_id, user_id
+                )
 
-            # Calculate processing time
-            processing_time = time.time() - start_time
+            self._cache_extraction(cache_key, extracted_data)
 
-            # Get token usage from response
-            usage = response.get("usage", {})
-            token_usage = {
-                "input_tokens": usage.get("input_tokens", 0),
-                "output_tokens": usage.get("output_tokens", 0),
-            }
+            # Calculate processing time
+            processing_time = time.perf_counter() - start_time
 
             # Build extraction result
             result = ExtractionResult(
@@ -188,10 +403,13 @@ class DocumentAnalyzer:
                 success=True,
             )
 
+            # One record per extraction keeps logging off the hot path
             self.logger.info(
                 f"Successfully extracted data from document {document_id}",
                 extra={
                     "document_id": document_id,
+                    "firm_id": firm_id,
+                    "chunk_count": len(chunks),
                     "processing_time": processing_time,
                     "input_tokens": token_usage["input_tokens"],
                     "output_tokens": token_usage["output_tokens"],
@@ -204,7 +422,7 @@ class DocumentAnalyzer:
             return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_message = str(e)
 
             self.logger.error(
@@ -227,6 +445,150 @@ class DocumentAnalyzer:
                 error_message=error_message,
             )
 
+    def _extract(
+        self,
+        document_text: str,
+        document_type: str | None,
+        firm_id: int | None,
+        user_id: int | None,
+    ) -> tuple[ExtractedData, dict[str, int]]:
+        """
+        Run one extraction call over (a chunk of) document text.
+
+        Returns:
+            Tuple of (extracted data, token usage)
+        """
+        # System prompt with document-type-specific guidelines (precomputed)
+        system_prompt = get_system_prompt(document_type)
+
+        # Build user message with extraction instructions
+        user_message = get_extraction_prompt(document_text, document_type)
+
+        # Streamed so tool input accumulates while Claude is still generating.
+        # The tool schema and type-specific system prompt are identical for
+        # every chunk and every document of a type, so they are cached as a
+        # prompt prefix: calls within the cache TTL (5 minutes) pay for them
+        # at the cache-read rate.
+        response = self.bedrock_client.invoke_via_stream(
+            messages=[{"role": "user", "content": user_message}],
+            system=system_prompt,
+            tools=[_DOCUMENT_DATA_TOOL_SCHEMA],
+            tool_choice={"type": "tool", "name": "extract_document_data"},
+            firm_id=firm_id,
+            user_id=user_id,
+            cache_prompt=True,
+        )
+
+        # Extract structured data from tool use
+        extracted_data = extract_tool_result(response, ExtractedData)
+
+        # Get token usage from response
+        usage = response.get("usage", {})
+        token_usage = {
+            "input_tokens": usage.get("inputTokens", usage.get("input_tokens", 0)),
+            "output_tokens": usage.get("outputTokens", usage.get("output_tokens", 0)),
+        }
+        return extracted_data, token_usage
+
+    def _extract_chunked(
+        self,
+        chunks: list[str],
+        document_type: str | None,
+        firm_id: int | None,
+        user_id: int | None,
+    ) -> tuple[ExtractedData, dict[str, int]]:
+        """
+        Extract each chunk concurrently and merge the results.
+
+        boto3 is blocking, so chunks run in worker threads sharing this
+        analyzer's Bedrock client. Any failed chunk fails the whole document.
+
+        Returns:
+            Tuple of (merged extracted data, summed token usage)
+        """
+        with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CHUNK_WORKERS)) as executor:
+            results = list(
+                executor.map(
+                    self._extract,
+                    chunks,
+                    repeat(document_type),
+                    repeat(firm_id),
+                    repeat(user_id),
+                )
+            )
+
+        token_usage = {
+            "input_tokens": sum(usage["input_tokens"] for _, usage in results),
+            "output_tokens": sum(usage["output_tokens"] for _, usage in results),
+        }
+        return _merge_extractions([data for data, _ in results]), token_usage
+
+    def _extraction_cache_key(
+        self, document_text: str, document_type: str | None, firm_id: int | None
+    ) -> str:
+        """
+        Build the content-addressed cache key for an extraction.
+
+        Scoped by firm so tenants never share cache entries.
+
+        Args:
+            document_text: Full text of the document
+            document_type: Type of document
+            firm_id: Firm ID for multi-tenancy
+
+        Returns:
+            Cache key string
+        """
+        text_hash = hashlib.sha256(document_text.encode("utf-8")).hexdigest()
+        return ":".join(
+            (
+                "extraction",
+                str(firm_id or ""),
+                text_hash,
+                document_type or "",
+                self.bedrock_client.config.model_id,
+                EXTRACTION_PROMPT_VERSION,
+            )
+        )
+
+    def _get_cached_extraction(self, cache_key: str) -> ExtractedData | None:
+        """
+        Look up a cached extraction; cache errors are logged and treated as misses.
+
+        Args:
+            cache_key: Key from _extraction_cache_key
+
+        Returns:
+            Cached extracted data, or None on miss
+        """
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get(cache_key)
+            if cached is None:
+                return None
+            return ExtractedData.model_validate_json(cached)
+        except Exception as e:
+            self.logger.warning(f"Extraction cache read failed: {e}")
+            return None
+
+    def _cache_extraction(self, cache_key: str, extracted_data: ExtractedData) -> None:
+        """
+        Store an extraction result; cache errors are logged and ignored.
+
+        Args:
+            cache_key: Key from _extraction_cache_key
+            extracted_data: Validated extraction to cache
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.setex(
+                cache_key, EXTRACTION_CACHE_TTL_SECONDS, extracted_data.model_dump_json()
+            )
+        except Exception as e:
+            self.logger.warning(f"Extraction cache write failed: {e}")
+
     def analyze_pdf_document(
         self,
         document_id: str,
@@ -7,5 +7,12 @@ Specialized extractors for focused information extraction from documents.
 from .parties import PartyExtractor
 from .damages import DamageExtractor
 from .facts import FactExtractor
+from .batch import BatchExtractor, CombinedExtractionResult
 
-__all__ = ["PartyExtractor", "DamageExtractor", "FactExtractor"]
+__all__ = [
+    "PartyExtractor",
+    "DamageExtractor",
+    "FactExtractor",
+    "BatchExtractor",
+    "CombinedExtractionResult",
+]
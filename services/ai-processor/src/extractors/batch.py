@@ -0,0 +1,189 @@
+"""
+Batch Extractor
+
+Runs party, damage, and fact extraction in a single Bedrock tool call.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from pydantic import BaseModel
+
+from ..bedrock.client import BedrockClient, get_default_client
+from ..bedrock.tools import extract_tool_result, pydantic_to_tool_schema
+from ..schemas.extraction import CaseFact, Damage, Party
+from .damages import DAMAGE_SYSTEM_PROMPT, DamageExtractor
+from .facts import FACT_SYSTEM_PROMPT, FactExtractor
+from .parties import PARTY_SYSTEM_PROMPT, PartyExtractor
+
+BATCH_SYSTEM_PROMPT = f"""You are performing three extraction tasks over the same document in one pass.
+
+## Parties
+{PARTY_SYSTEM_PROMPT}
+
+## Damages
+{DAMAGE_SYSTEM_PROMPT}
+
+## Facts
+{FACT_SYSTEM_PROMPT}"""
+
+_USER_TEMPLATE_BATCH = """Extract all parties, damages, and legally relevant facts from this document{doc_context}:
+
+{document_text}
+
+For each party, provide: full name, role in the case, any contact or insurance
+information, confidence level, and source text.
+
+For each damage entry, provide: type, description, amount (if stated), whether
+the amount is an estimate or actual, provider/source, date incurred, confidence
+level, and source text. Also calculate the total estimated damages if possible.
+
+For each fact, provide: the factual statement, category, importance level
+(high/medium/low), confidence level, and source text.{focus_instruction}"""
+
+
+class CombinedExtractionResult(BaseModel):
+    """Result of combined party, damage, and fact extraction."""
+
+    parties: list[Party]
+    damages: list[Damage]
+    total_estimated: Optional[float] = None
+    facts: list[CaseFact]
+
+
+# Built once at import; the schema is fixed for the result model
+_COMBINED_TOOL_SCHEMA = pydantic_to_tool_schema(
+    CombinedExtractionResult,
+    name="extract_all",
+    description="Extract all parties, damages, and relevant facts from the document",
+)
+
+
+class BatchExtractor:
+    """
+    Extracts parties, damages, and case facts with one Bedrock round-trip.
+
+    Use this instead of calling PartyExtractor, DamageExtractor, and
+    FactExtractor back to back: the document text is sent and tokenized once
+    rather than three times.
+    """
+
+    def __init__(
+        self,
+        bedrock_client: BedrockClient | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Initialize batch extractor.
+
+        Args:
+            bedrock_client: Bedrock client instance (uses the shared default if None)
+            logger: Logger instance
+        """
+        self.bedrock_client = bedrock_client or get_default_client()
+        self.logger = logger or logging.getLogger("extractor.batch")
+
+    def extract_all(
+        self,
+        document_text: str,
+        document_type: Optional[str] = None,
+        focus_area: Optional[str] = None,
+    ) -> CombinedExtractionResult:
+        """
+        Extract parties, damages, and case facts from document text.
+
+        Args:
+            document_text: Full text of the document
+            document_type: Type of document (helps with context)
+            focus_area: Optional fact focus (e.g., "liability", "causation")
+
+        Returns:
+            Combined result with parties, damages (and total), and facts
+
+        Raises:
+            ValueError: If extraction fails
+        """
+        doc_context = f" (Type: {document_type})" if document_type else ""
+        focus_instruction = ""
+        if focus_area:
+            focus_instruction = f"\n\nFor facts, focus specifically on: {focus_area}"
+
+        user_message = _USER_TEMPLATE_BATCH.format_map(
+            {
+                "doc_context": doc_context,
+                "document_text": document_text,
+                "focus_instruction": focus_instruction,
+            }
+        )
+
+        try:
+            response = self.bedrock_client.invoke(
+                messages=[{"role": "user", "content": user_message}],
+                system=BATCH_SYSTEM_PROMPT,
+                tools=[_COMBINED_TOOL_SCHEMA],
+                tool_choice={"type": "tool", "name": "extract_all"},
+                cache_prompt=True,
+            )
+
+            result = extract_tool_result(response, CombinedExtractionResult)
+            self.logger.info(
+                f"Extracted {len(result.parties)} parties, "
+                f"{len(result.damages)} damage entries, "
+                f"{len(result.facts)} case facts"
+            )
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Batch extraction failed: {e}")
+            raise ValueError(f"Failed to extract document data: {e}") from e
+
+    async def extract_all_concurrently(
+        self,
+        document_text: str,
+        document_type: Optional[str] = None,
+        focus_area: Optional[str] = None,
+    ) -> CombinedExtractionResult:
+        """
+        Run the three focused extractors concurrently and merge their results.
+
+        Use this when the focused prompts' extraction quality is preferred over
+        a single combined call; the three Bedrock round-trips overlap instead
+        of running back to back. boto3 is blocking, so each extractor runs in
+        a worker thread sharing this extractor's Bedrock client.
+
+        Args:
+            document_text: Full text of the document
+            document_type: Type of document (helps with context)
+            focus_area: Optional fact focus (e.g., "liability", "causation")
+
+        Returns:
+            Combined result with parties, damages (and total), and facts
+
+        Raises:
+            ValueError: If any extraction fails
+        """
+        parties, damages, facts = await asyncio.gather(
+            asyncio.to_thread(
+                PartyExtractor(self.bedrock_client).extract_parties,
+                document_text,
+                document_type,
+            ),
+            asyncio.to_thread(
+                DamageExtractor(self.bedrock_client).extract_damages,
+                document_text,
+                document_type,
+            ),
+            asyncio.to_thread(
+                FactExtractor(self.bedrock_client).extract_facts,
+                document_text,
+                focus_area,
+            ),
+        )
+
+        return CombinedExtractionResult(
+            parties=parties,
+            damages=damages.damages,
+            total_estimated=damages.total_estimated,
+            facts=facts,
+        )
@@ -7,12 +7,48 @@ Specialized extractor for identifying and extracting damage/loss information fro
 import logging
 from typing import Optional
 
-from ..bedrock.client import BedrockClient
+from ..bedrock.client import BedrockClient, get_default_client
 from ..bedrock.tools import pydantic_to_tool_schema, extract_tool_result
 from ..schemas.extraction import Damage
 from pydantic import BaseModel
 
 
+DAMAGE_SYSTEM_PROMPT = """You are an expert at identifying and quantifying damages in legal cases.
+
+Extract all damages and losses mentioned in the document, including:
+- Medical expenses (itemized)
+- Property damage
+- Lost wages and income
+- Pain and suffering
+- Punitive damages
+- Out-of-pocket expenses
+- Future damages
+
+For each damage:
+- Specify the type of damage
+- Extract the exact amount if stated
+- Note whether it's an estimate or actual amount
+- Identify the provider or source
+- Include the date if available
+- Assign confidence level"""
+
+_USER_TEMPLATE_DAMAGES = """Extract all damages and losses from this document{doc_context}:
+
+{document_text}
+
+For each damage entry, provide:
+1. Type of damage (medical, property, lost wages, etc.)
+2. Description
+3. Amount (if stated)
+4. Whether amount is estimate or actual
+5. Provider/source
+6. Date incurred
+7. Confidence level
+8. Source text
+
+Also calculate the total estimated damages if possible."""
+
+
 class DamagesResult(BaseModel):
     """Result of damage extraction."""
 
@@ -20,6 +56,14 @@ class DamagesResult(BaseModel):
     total_estimated: Optional[float] = None
 
 
+# Built once at import; the schema is fixed for the result model
+_DAMAGES_TOOL_SCHEMA = pydantic_to_tool_schema(
+    DamagesResult,
+    name="extract_damages",
+    description="Extract all damages and losses from the document",
+)
+
+
 class DamageExtractor:
     """
     Extracts damage and loss information from document text.
@@ -37,10 +81,10 @@ class DamageExtractor:
         Initialize damage extractor.
 
         Args:
-            bedrock_client: Bedrock client instance
+            bedrock_client: Bedrock client instance (uses the shared default if None)
             logger: Logger instance
         """
-        self.bedrock_client = bedrock_client or BedrockClient()
+        self.bedrock_client = bedrock_client or get_default_client()
         self.logger = logger or logging.getLogger("extractor.damages")
 
     def extract_damages(
@@ -61,54 +105,18 @@ class DamageExtractor:
         Raises:
             ValueError: If extraction fails
         """
-        system_prompt = """You are an expert at identifying and quantifying damages in legal cases.
-
-Extract all damages and losses mentioned in the document, including:
-- Medical expenses (itemized)
-- Property damage
-- Lost wages and income
-- Pain and suffering
-- Punitive damages
-- Out-of-pocket expenses
-- Future damages
-
-For each damage:
-- Specify the type of damage
-- Extract the exact amount if stated
-- Note whether it's an estimate or actual amount
-- Identify the provider or source
-- Include the date if available
-- Assign confidence level"""
-
         doc_context = f" (Type: {document_type})" if document_type else ""
-        user_message = f"""Extract all damages and losses from this document{doc_context}:
-
-{document_text}
-
-For each damage entry, provide:
-1. Type of damage (medical, property, lost wages, etc.)
-2. Description
-3. Amount (if stated)
-4. Whether amount is estimate or actual
-5. Provider/source
-6. Date incurred
-7. Confidence level
-8. Source text
-
-Also calculate the total estimated damages if possible."""
-
-        tool_schema = pydantic_to_tool_schema(
-            DamagesResult,
-            name="extract_damages",
-            description="Extract all damages and losses from the document",
+        user_message = _USER_TEMPLATE_DAMAGES.format_map(
+            {"doc_context": doc_context, "document_text": document_text}
         )
 
         try:
             response = self.bedrock_client.invoke(
                 messages=[{"role": "user", "content": user_message}],
-                system=system_prompt,
-                tools=[tool_schema],
+                system=DAMAGE_SYSTEM_PROMPT,
+                tools=[_DAMAGES_TOOL_SCHEMA],
                 tool_choice={"type": "tool", "name": "extract_damages"},
+                cache_prompt=True,
             )
 
             result = extract_tool_result(response, DamagesResult)
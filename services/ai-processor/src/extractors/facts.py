@@ -7,18 +7,56 @@ Specialized extractor for identifying and extracting case facts from documents.
 import logging
 from typing import Optional
 
-from ..bedrock.client import BedrockClient
+from ..bedrock.client import BedrockClient, get_default_client
 from ..bedrock.tools import pydantic_to_tool_schema, extract_tool_result
 from ..schemas.extraction import CaseFact
 from pydantic import BaseModel
 
 
+FACT_SYSTEM_PROMPT = """You are an expert at identifying legally relevant facts in documents.
+
+Extract factual statements that are relevant to the case, focusing on:
+- Liability: Facts showing fault or negligence
+- Causation: Facts linking the incident to damages
+- Damages: Facts supporting claimed losses
+- Witness observations: What witnesses saw or heard
+- Expert opinions: Professional assessments
+- Timelines: Sequence of events
+- Conditions: Environmental or situational factors
+
+For each fact:
+- State it clearly and concisely
+- Categorize it (liability, causation, damages, witness, etc.)
+- Assess its importance (high, medium, low)
+- Assign confidence level
+- Include source text"""
+
+_USER_TEMPLATE_FACTS = """Extract all legally relevant facts from this document{focus_instruction}:
+
+{document_text}
+
+For each fact, provide:
+1. The factual statement (clear and concise)
+2. Category (liability, causation, damages, witness statement, etc.)
+3. Importance level (high/medium/low)
+4. Confidence level
+5. Source text from the document"""
+
+
 class FactsResult(BaseModel):
     """Result of fact extraction."""
 
     facts: list[CaseFact]
 
 
+# Built once at import; the schema is fixed for the result model
+_FACTS_TOOL_SCHEMA = pydantic_to_tool_schema(
+    FactsResult,
+    name="extract_facts",
+    description="Extract legally relevant facts from the document",
+)
+
+
 class FactExtractor:
     """
     Extracts factual statements relevant to the case from document text.
@@ -40,10 +78,10 @@ class FactExtractor:
         Initialize fact extractor.
 
         Args:
-            bedrock_client: Bedrock client instance
+            bedrock_client: Bedrock client instance (uses the shared default if None)
             logger: Logger instance
         """
-        self.bedrock_client = bedrock_client or BedrockClient()
+        self.bedrock_client = bedrock_client or get_default_client()
         self.logger = logger or logging.getLogger("extractor.facts")
 
     def extract_facts(
@@ -64,51 +102,21 @@ class FactExtractor:
         Raises:
             ValueError: If extraction fails
         """
-        system_prompt = """You are an expert at identifying legally relevant facts in documents.
-
-Extract factual statements that are relevant to the case, focusing on:
-- Liability: Facts showing fault or negligence
-- Causation: Facts linking the incident to damages
-- Damages: Facts supporting claimed losses
-- Witness observations: What witnesses saw or heard
-- Expert opinions: Professional assessments
-- Timelines: Sequence of events
-- Conditions: Environmental or situational factors
-
-For each fact:
-- State it clearly and concisely
-- Categorize it (liability, causation, damages, witness, etc.)
-- Assess its importance (high, medium, low)
-- Assign confidence level
-- Include source text"""
-
         focus_instruction = ""
         if focus_area:
             focus_instruction = f"\n\nFocus specifically on facts related to: {focus_area}"
 
-        user_message = f"""Extract all legally relevant facts from this document{focus_instruction}:
-
-{document_text}
-
-For each fact, provide:
-1. The factual statement (clear and concise)
-2. Category (liability, causation, damages, witness statement, etc.)
-3. Importance level (high/medium/low)
-4. Confidence level
-5. Source text from the document"""
-
-        tool_schema = pydantic_to_tool_schema(
-            FactsResult,
-            name="extract_facts",
-            description="Extract legally relevant facts from the document",
+        user_message = _USER_TEMPLATE_FACTS.format_map(
+            {"focus_instruction": focus_instruction, "document_text": document_text}
         )
 
         try:
             response = self.bedrock_client.invoke(
                 messages=[{"role": "user", "content": user_message}],
-                system=system_prompt,
-                tools=[tool_schema],
+                system=FACT_SYSTEM_PROMPT,
+                tools=[_FACTS_TOOL_SCHEMA],
                 tool_choice={"type": "tool", "name": "extract_facts"},
+                cache_prompt=True,
             )
 
             result = extract_tool_result(response, FactsResult)
@@ -7,18 +7,55 @@ Specialized extractor for identifying and extracting party information from docu
 import logging
 from typing import Optional
 
-from ..bedrock.client import BedrockClient
+from ..bedrock.client import BedrockClient, get_default_client
 from ..bedrock.tools import pydantic_to_tool_schema, extract_tool_result
 from ..schemas.extraction import Party
 from pydantic import BaseModel
 
 
+PARTY_SYSTEM_PROMPT = """You are an expert at identifying parties involved in legal cases.
+
+Extract all parties mentioned in the document, including:
+- Plaintiffs and defendants
+- Witnesses
+- Insurance companies and adjusters
+- Medical providers
+- Employers
+- Any other relevant parties
+
+For each party, extract:
+- Full name
+- Role/type (plaintiff, defendant, witness, etc.)
+- Contact information if available
+- Insurance information if applicable
+- Confidence level based on how clearly they are identified"""
+
+_USER_TEMPLATE_PARTIES = """Extract all parties from this document{doc_context}:
+
+{document_text}
+
+For each party, provide:
+1. Full name
+2. Role in the case
+3. Any contact or insurance information
+4. Confidence level
+5. Source text showing where you found this information"""
+
+
 class PartiesResult(BaseModel):
     """Result of party extraction."""
 
     parties: list[Party]
 
 
+# Built once at import; the schema is fixed for the result model
+_PARTIES_TOOL_SCHEMA = pydantic_to_tool_schema(
+    PartiesResult,
+    name="extract_parties",
+    description="Extract all parties from the document",
+)
+
+
 class PartyExtractor:
     """
     Extracts party information from document text.
@@ -36,10 +73,10 @@ class PartyExtractor:
         Initialize party extractor.
 
         Args:
-            bedrock_client: Bedrock client instance
+            bedrock_client: Bedrock client instance (uses the shared default if None)
             logger: Logger instance
         """
-        self.bedrock_client = bedrock_client or BedrockClient()
+        self.bedrock_client = bedrock_client or get_default_client()
         self.logger = logger or logging.getLogger("extractor.parties")
 
     def extract_parties(
@@ -60,47 +97,18 @@ class PartyExtractor:
         Raises:
             ValueError: If extraction fails
         """
-        system_prompt = """You are an expert at identifying parties involved in legal cases.
-
-Extract all parties mentioned in the document, including:
-- Plaintiffs and defendants
-- Witnesses
-- Insurance companies and adjusters
-- Medical providers
-- Employers
-- Any other relevant parties
-
-For each party, extract:
-- Full name
-- Role/type (plaintiff, defendant, witness, etc.)
-- Contact information if available
-- Insurance information if applicable
-- Confidence level based on how clearly they are identified"""
-
         doc_context = f" (Type: {document_type})" if document_type else ""
-        user_message = f"""Extract all parties from this document{doc_context}:
-
-{document_text}
-
-For each party, provide:
-1. Full name
-2. Role in the case
-3. Any contact or insurance information
-4. Confidence level
-5. Source text showing where you found this information"""
-
-        tool_schema = pydantic_to_tool_schema(
-            PartiesResult,
-            name="extract_parties",
-            description="Extract all parties from the document",
+        user_message = _USER_TEMPLATE_PARTIES.format_map(
+            {"doc_context": doc_context, "document_text": document_text}
         )
 
         try:
             response = self.bedrock_client.invoke(
                 messages=[{"role": "user", "content": user_message}],
-                system=system_prompt,
-                tools=[tool_schema],
+                system=PARTY_SYSTEM_PROMPT,
+                tools=[_PARTIES_TOOL_SCHEMA],
                 tool_choice={"type": "tool", "name": "extract_parties"},
+                cache_prompt=True,
             )
 
             result = extract_tool_result(response, PartiesResult)
@@ -4,13 +4,22 @@ AWS Lambda handler for AI processing.
 Provides route-based dispatch for document analysis, letter generation, and refinement.
 """
 
-import json
+import base64
 import logging
 import os
-import traceback
 import uuid
 from typing import Any, Dict, Optional
 
+import orjson
+
+from .metrics import metrics
+from .schemas.letter import (
+    ConversationHistory,
+    GeneratedLetter,
+    LetterGenerationRequest,
+    RefinementFeedback,
+)
+
 # Module-level initialization for reuse across invocations
 logger = logging.getLogger()
 logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
@@ -21,15 +30,29 @@ _document_analyzer = None
 _letter_generator = None
 
 
+def _warm_db_pool() -> None:
+    """Open pooled DB connections during the init phase when DB_WARMUP_ON_INIT=1."""
+    if os.getenv("DB_WARMUP_ON_INIT", "0") != "1":
+        return
+    try:
+        from .db.connection import warmup
+
+        warmup()
+    except Exception as e:
+        # A cold database must not fail the init phase; requests connect lazily
+        logger.warning(f"Database pool warmup failed: {e}")
+
+
+_warm_db_pool()
+
+
 def get_bedrock_client():
     """Get or create Bedrock client (singleton pattern)."""
     global _bedrock_client
     if _bedrock_client is None:
-        from .bedrock.client import BedrockClient
-        from .bedrock.config import BedrockConfig
+        from .bedrock.client import get_default_client
 
-        config = BedrockConfig()
-        _bedrock_client = BedrockClient(config=config)
+        _bedrock_client = get_default_client()
         logger.info("Bedrock client initialized")
     return _bedrock_client
 
@@ -62,6 +85,21 @@ def get_letter_generator():
     return _letter_generator
 
 
+def _prewarm() -> None:
+    """Build the analyzer, generator, and shared Bedrock client during the init phase."""
+    if os.getenv("PREWARM", "1") != "1":
+        return
+    try:
+        get_document_analyzer()
+        get_letter_generator()
+    except Exception as e:
+        # Fall back to building them on first use
+        logger.warning(f"Prewarm failed: {e}")
+
+
+_prewarm()
+
+
 def create_response(
     status_code: int,
     body: Dict[str, Any],
@@ -73,23 +111,77 @@ def create_response(
     Args:
         status_code: HTTP status code
         body: Response body dict
-        correlation_id: Optional correlation ID for tracing
+        correlation_id: Correlation ID for tracing (lambda_handler always
+            supplies one; a new ID is generated only when it is omitted)
 
     Returns:
         Lambda response dict
     """
-    headers = {
-        "Content-Type": "application/json",
-        "X-Correlation-ID": correlation_id or str(uuid.uuid4()),
+    return {
+        "statusCode": status_code,
+        "headers": {
+            "Content-Type": "application/json",
+            "X-Correlation-ID": correlation_id or str(uuid.uuid4()),
+        },
+        # API Gateway needs a str body unless isBase64Encoded is set
+        "body": orjson.dumps(body).decode(),
     }
 
+
+# Required request body fields per route
+_ANALYZE_REQUIRED = frozenset({"document_id", "document_text", "firm_id"})
+_GENERATE_REQUIRED = frozenset({"case_id", "extracted_data", "template_variables"})
+_REFINE_REQUIRED = frozenset({"letter_id", "current_letter", "feedback", "firm_id"})
+
+
+# Fixed parts of the 500 body; only the message is serialized per error
+_ERR_500_PREFIX = '{"error":"Internal server error","message":'
+_ERR_500_SUFFIX = "}"
+
+
+def _internal_error_response(error: Exception, correlation_id: str) -> Dict[str, Any]:
+    """
+    Create the standard 500 response for an unhandled exception.
+
+    Args:
+        error: Exception that aborted the request
+        correlation_id: Correlation ID for tracing
+
+    Returns:
+        Lambda response dict
+    """
     return {
-        "statusCode": status_code,
-        "headers": headers,
-        "body": json.dumps(body),
+        "statusCode": 500,
+        "headers": {
+            "Content-Type": "application/json",
+            "X-Correlation-ID": correlation_id,
+        },
+        "body": _ERR_500_PREFIX + orjson.dumps(str(error)).decode() + _ERR_500_SUFFIX,
     }
 
 
+def _parse_body(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse the JSON request body from an API Gateway proxy event.
+
+    Args:
+        event: Lambda event object
+
+    Returns:
+        Parsed body ({} when the body is missing or empty)
+    """
+    body = event.get("body")
+    if isinstance(body, dict):
+        # Some integrations deliver an already-parsed body
+        return body
+    if not body:
+        return {}
+    if event.get("isBase64Encoded"):
+        # orjson parses the decoded bytes directly
+        return orjson.loads(base64.b64decode(body))
+    return orjson.loads(body)
+
+
 def handle_analyze(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
     """
     Handle document analysis request.
@@ -103,21 +195,21 @@ def handle_analyze(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]
         "user_id": int (optional)
     }
     """
-    logger.info(
-        "Processing analyze request",
-        extra={"correlation_id": correlation_id},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing analyze request",
+            extra={"correlation_id": correlation_id},
+        )
 
     try:
-        body = json.loads(event.get("body", "{}"))
+        body = _parse_body(event)
 
         # Validate required fields
-        required_fields = ["document_id", "document_text", "firm_id"]
-        missing_fields = [f for f in required_fields if f not in body]
+        missing_fields = _ANALYZE_REQUIRED - body.keys()
         if missing_fields:
             return create_response(
                 400,
-                {"error": f"Missing required fields: {', '.join(missing_fields)}"},
+                {"error": f"Missing required fields: {', '.join(sorted(missing_fields))}"},
                 correlation_id,
             )
 
@@ -131,11 +223,12 @@ def handle_analyze(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]
             user_id=body.get("user_id"),
         )
 
-        # Convert result to dict
+        # Models are serialized straight to JSON and spliced in as fragments,
+        # skipping the intermediate dict
         response_body = {
             "success": result.success,
             "document_id": result.document_id,
-            "extracted_data": result.extracted_data.model_dump(mode="json"),
+            "extracted_data": orjson.Fragment(result.extracted_data.model_dump_json()),
             "processing_time_seconds": result.processing_time_seconds,
             "token_usage": result.token_usage,
             "model_id": result.model_id,
@@ -145,15 +238,16 @@ def handle_analyze(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]
         if not result.success:
             response_body["error_message"] = result.error_message
 
-        logger.info(
-            "Document analysis completed",
-            extra={
-                "correlation_id": correlation_id,
-                "document_id": body["document_id"],
-                "success": result.success,
-                "processing_time": result.processing_time_seconds,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Document analysis completed",
+                extra={
+                    "correlation_id": correlation_id,
+                    "document_id": body["document_id"],
+                    "success": result.success,
+                    "processing_time": result.processing_time_seconds,
+                },
+            )
 
         return create_response(
             200 if result.success else 500,
@@ -167,14 +261,10 @@ def handle_analyze(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]
             extra={
                 "correlation_id": correlation_id,
                 "error": str(e),
-                "traceback": traceback.format_exc(),
             },
+            exc_info=True,
         )
-        return create_response(
-            500,
-            {"error": "Internal server error", "message": str(e)},
-            correlation_id,
-        )
+        return _internal_error_response(e, correlation_id)
 
 
 def handle_generate(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
@@ -192,27 +282,24 @@ def handle_generate(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any
         "user_id": int (optional)
     }
     """
-    logger.info(
-        "Processing generate request",
-        extra={"correlation_id": correlation_id},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing generate request",
+            extra={"correlation_id": correlation_id},
+        )
 
     try:
-        body = json.loads(event.get("body", "{}"))
+        body = _parse_body(event)
 
         # Validate required fields
-        required_fields = ["case_id", "extracted_data", "template_variables"]
-        missing_fields = [f for f in required_fields if f not in body]
+        missing_fields = _GENERATE_REQUIRED - body.keys()
         if missing_fields:
             return create_response(
                 400,
-                {"error": f"Missing required fields: {', '.join(missing_fields)}"},
+                {"error": f"Missing required fields: {', '.join(sorted(missing_fields))}"},
                 correlation_id,
             )
 
-        # Import schemas
-        from .schemas.letter import LetterGenerationRequest
-
         # Create generation request (validation happens in Pydantic model)
         gen_request = LetterGenerationRequest.model_validate(body)
 
@@ -224,10 +311,12 @@ def handle_generate(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any
             user_id=body.get("user_id"),
         )
 
-        # Convert result to dict
+        # Models are serialized straight to JSON and spliced in as fragments
         response_body = {
             "success": result.success,
-            "letter": result.letter.model_dump(mode="json") if result.letter else None,
+            "letter": orjson.Fragment(result.letter.model_dump_json())
+            if result.letter
+            else None,
             "processing_time_seconds": result.processing_time_seconds,
             "token_usage": result.token_usage,
             "model_id": result.model_id,
@@ -237,15 +326,16 @@ def handle_generate(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any
         if not result.success:
             response_body["error_message"] = result.error_message
 
-        logger.info(
-            "Letter generation completed",
-            extra={
-                "correlation_id": correlation_id,
-                "letter_id": body["letter_id"],
-                "success": result.success,
-                "processing_time": result.processing_time_seconds,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Letter generation completed",
+                extra={
+                    "correlation_id": correlation_id,
+                    "case_id": gen_request.case_id,
+                    "success": result.success,
+                    "processing_time": result.processing_time_seconds,
+                },
+            )
 
         return create_response(
             200 if result.success else 500,
@@ -259,14 +349,10 @@ def handle_generate(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any
             extra={
                 "correlation_id": correlation_id,
                 "error": str(e),
-                "traceback": traceback.format_exc(),
             },
+            exc_info=True,
         )
-        return create_response(
-            500,
-            {"error": "Internal server error", "message": str(e)},
-            correlation_id,
-        )
+        return _internal_error_response(e, correlation_id)
 
 
 def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
@@ -283,27 +369,25 @@ def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
         "user_id": int (optional)
     }
     """
-    logger.info(
-        "Processing refine request",
-        extra={"correlation_id": correlation_id},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing refine request",
+            extra={"correlation_id": correlation_id},
+        )
 
     try:
-        body = json.loads(event.get("body", "{}"))
+        body = _parse_body(event)
 
         # Validate required fields
-        required_fields = ["letter_id", "current_letter", "feedback", "firm_id"]
-        missing_fields = [f for f in required_fields if f not in body]
+        missing_fields = _REFINE_REQUIRED - body.keys()
         if missing_fields:
             return create_response(
                 400,
-                {"error": f"Missing required fields: {', '.join(missing_fields)}"},
+                {"error": f"Missing required fields: {', '.join(sorted(missing_fields))}"},
                 correlation_id,
             )
 
         # Convert dicts to models
-        from .schemas.letter import GeneratedLetter, RefinementFeedback, ConversationHistory
-
         current_letter = GeneratedLetter.model_validate(body["current_letter"])
         feedback = RefinementFeedback.model_validate(body["feedback"])
         conversation_history = None
@@ -323,10 +407,10 @@ def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
             user_id=body.get("user_id"),
         )
 
-        # Convert result to dict
+        # Models are serialized straight to JSON and spliced in as fragments
         response_body = {
             "success": result.success,
-            "refined_letter": result.refined_letter.model_dump(mode="json")
+            "refined_letter": orjson.Fragment(result.refined_letter.model_dump_json())
             if result.refined_letter
             else None,
             "changes_summary": result.changes_summary,
@@ -334,7 +418,9 @@ def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
             "token_usage": result.token_usage,
             "model_id": result.model_id,
             "refinement_timestamp": result.refinement_timestamp,
-            "conversation_history": result.conversation_history.model_dump(mode="json")
+            "conversation_history": orjson.Fragment(
+                result.conversation_history.model_dump_json()
+            )
             if result.conversation_history
             else None,
         }
@@ -342,15 +428,16 @@ def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
         if not result.success:
             response_body["error_message"] = result.error_message
 
-        logger.info(
-            "Letter refinement completed",
-            extra={
-                "correlation_id": correlation_id,
-                "letter_id": body["letter_id"],
-                "success": result.success,
-                "processing_time": result.processing_time_seconds,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Letter refinement completed",
+                extra={
+                    "correlation_id": correlation_id,
+                    "letter_id": body["letter_id"],
+                    "success": result.success,
+                    "processing_time": result.processing_time_seconds,
+                },
+            )
 
         return create_response(
             200 if result.success else 500,
@@ -364,30 +451,42 @@ def handle_refine(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
             extra={
                 "correlation_id": correlation_id,
                 "error": str(e),
-                "traceback": traceback.format_exc(),
             },
+            exc_info=True,
         )
-        return create_response(
-            500,
-            {"error": "Internal server error", "message": str(e)},
-            correlation_id,
-        )
+        return _internal_error_response(e, correlation_id)
+
+
+# Health response body is static for the life of the process
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "ai-processor",
+        "version": os.getenv("SERVICE_VERSION", "unknown"),
+        "environment": os.getenv("ENVIRONMENT", "unknown"),
+    }
+).decode()
 
 
 def handle_health(event: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
-    """Handle health check request."""
-    logger.info("Health check", extra={"correlation_id": correlation_id})
-
-    return create_response(
-        200,
-        {
-            "status": "healthy",
-            "service": "ai-processor",
-            "version": os.getenv("SERVICE_VERSION", "unknown"),
-            "environment": os.getenv("ENVIRONMENT", "unknown"),
+    """Handle health check request (not logged; probes are frequent)."""
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json",
+            "X-Correlation-ID": correlation_id,
         },
-        correlation_id,
-    )
+        "body": _HEALTH_BODY,
+    }
+
+
+# Route table: (HTTP method, final path segment) -> handler
+_ROUTES = {
+    ("POST", "/analyze"): handle_analyze,
+    ("POST", "/generate"): handle_generate,
+    ("POST", "/refine"): handle_refine,
+    ("GET", "/health"): handle_health,
+}
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -408,51 +507,45 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         API Gateway proxy response
     """
     # Extract correlation ID from headers or generate new one
-    headers = event.get("headers", {})
-    correlation_id = (
-        headers.get("X-Correlation-ID")
-        or headers.get("x-correlation-id")
-        or str(uuid.uuid4())
-    )
-
-    logger.info(
-        "Lambda invocation started",
-        extra={
-            "correlation_id": correlation_id,
-            "request_id": context.aws_request_id if context else "unknown",
-            "path": event.get("path"),
-            "http_method": event.get("httpMethod"),
-        },
-    )
+    # HTTP header names are case-insensitive; lowercase them once
+    headers = {name.lower(): value for name, value in (event.get("headers") or {}).items()}
+    correlation_id = headers.get("x-correlation-id") or str(uuid.uuid4())
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Lambda invocation started",
+            extra={
+                "correlation_id": correlation_id,
+                "request_id": context.aws_request_id if context else "unknown",
+                "path": event.get("path"),
+                "http_method": event.get("httpMethod"),
+            },
+        )
 
     try:
         # Route based on path and method
         path = event.get("path", "")
         method = event.get("httpMethod", "")
 
-        # Route mapping
-        if method == "POST" and path.endswith("/analyze"):
-            return handle_analyze(event, correlation_id)
-        elif method == "POST" and path.endswith("/generate"):
-            return handle_generate(event, correlation_id)
-        elif method == "POST" and path.endswith("/refine"):
-            return handle_refine(event, correlation_id)
-        elif method == "GET" and path.endswith("/health"):
-            return handle_health(event, correlation_id)
-        else:
-            logger.warning(
-                "Route not found",
-                extra={
-                    "correlation_id": correlation_id,
-                    "path": path,
-                    "method": method,
-                },
-            )
-            return create_response(
-                404,
-                {"error": "Not found", "path": path, "method": method},
-                correlation_id,
-            )
+        # Routes match on method and the final path segment (any stage prefix)
+        _, sep, segment = path.rpartition("/")
+        handler = _ROUTES.get((method, sep + segment))
+        if handler is not None:
+            return handler(event, correlation_id)
+
+        logger.warning(
+            "Route not found",
+            extra={
+                "correlation_id": correlation_id,
+                "path": path,
+                "method": method,
+            },
+        )
+        return create_response(
+            404,
+            {"error": "Not found", "path": path, "method": method},
+            correlation_id,
+        )
 
     except Exception as e:
         logger.error(
@@ -460,11 +553,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             extra={
                 "correlation_id": correlation_id,
                 "error": str(e),
-                "traceback": traceback.format_exc(),
             },
+            exc_info=True,
         )
-        return create_response(
-            500,
-            {"error": "Internal server error", "message": str(e)},
-            correlation_id,
-        )
+        return _internal_error_response(e, correlation_id)
+
+    finally:
+        # Emit queued metrics before Lambda freezes the process
+        metrics.flush()
@@ -4,31 +4,117 @@ Letter Generator
 Main module for generating demand letters using Claude and extracted case data.
 """
 
+import asyncio
+import json
 import logging
 import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 
-from .bedrock.client import BedrockClient
-from .bedrock.tools import pydantic_to_tool_schema, extract_tool_result
+from .bedrock.client import CACHE_POINT, BedrockClient, get_default_client
+from .bedrock.tools import ToolInputScanner, pydantic_to_tool_schema, extract_tool_result
 from .prompts.generation_prompts import (
     GENERATION_SYSTEM_PROMPT,
     get_generation_prompt,
-    get_refinement_prompt,
+    get_refinement_prompt_parts,
     get_section_regeneration_prompt,
-    get_tone_adjustment_prompt,
+    get_tone_adjustment_prompt_parts,
 )
 from .schemas.letter import (
     GeneratedLetter,
+    LetterClosing,
+    LetterDamages,
+    LetterDemand,
+    LetterFacts,
     LetterGenerationRequest,
     LetterGenerationResult,
+    LetterHeader,
+    LetterIntroduction,
+    LetterLiability,
     RefinementFeedback,
     RefinementResult,
     ConversationHistory,
     LetterSection,
+    SectionDelta,
     ToneStyle,
 )
 
+# Refinement exchanges resent verbatim; older ones are summarized
+REFINEMENT_HISTORY_TURNS = 4
+
+# Sections short and formulaic enough to regenerate with the small model
+SMALL_MODEL_SECTIONS = frozenset({LetterSection.HEADER, LetterSection.CLOSING})
+
+# Output token caps per section, sized for a thorough but not padded letter
+_MAX_TOKENS_PER_SECTION = {
+    LetterSection.HEADER: 250,
+    LetterSection.INTRODUCTION: 350,
+    LetterSection.FACTS: 900,
+    LetterSection.LIABILITY: 700,
+    LetterSection.DAMAGES: 600,
+    LetterSection.DEMAND: 350,
+    LetterSection.CLOSING: 250,
+}
+# Tool-call JSON and the non-content fields of every section
+_MAX_TOKENS_OVERHEAD = 500
+
+# Placeholder letter for failed generations, built once and shared by every
+# failed result (results are serialized, never edited in place)
+_EMPTY_LETTER = GeneratedLetter(
+    header=LetterHeader(
+        date="",
+        recipient_name="",
+        recipient_address="",
+        subject_line="",
+    ),
+    introduction=LetterIntroduction(content="", client_name=""),
+    facts=LetterFacts(content=""),
+    liability=LetterLiability(content=""),
+    damages=LetterDamages(content="", total_damages=0.0),
+    demand=LetterDemand(content="", demand_amount=0.0),
+    closing=LetterClosing(content="", signature_block=""),
+)
+
+
+def _letter_fields(letter: GeneratedLetter) -> dict[str, dict]:
+    """
+    View a letter as the nested dict the prompt builders read, without model_dump.
+
+    Each section maps to the section model's own field dict, so nothing is
+    copied or serialized. The prompt builders only read from it; do not
+    mutate the result.
+
+    Args:
+        letter: Letter to view
+
+    Returns:
+        Section name to section field values
+    """
+    return {name: vars(getattr(letter, name)) for name in GeneratedLetter.model_fields}
+
+
+def _stripped_longer_than(text: str, n: int) -> bool:
+    """
+    Check len(text.strip()) > n without stripping when the answer is already known.
+
+    Stripping can only shorten text, so anything n characters or shorter
+    fails outright, and text with no whitespace at either end is measured
+    as is. Only text with edge whitespace is stripped.
+
+    Args:
+        text: Text to measure
+        n: Length the stripped text must exceed
+
+    Returns:
+        True if the stripped text is longer than n characters
+    """
+    if len(text) <= n:
+        return False
+    if not (text[0].isspace() or text[-1].isspace()):
+        return True
+    return len(text.strip()) > n
+
 
 class LetterGenerator:
     """
@@ -51,10 +137,10 @@ class LetterGenerator:
         Initialize letter generator.
 
         Args:
-            bedrock_client: Bedrock client instance (creates default if None)
+            bedrock_client: Bedrock client instance (uses the shared default if None)
             logger: Logger instance (creates default if None)
         """
-        self.bedrock_client = bedrock_client or BedrockClient()
+        self.bedrock_client = bedrock_client or get_default_client()
         self.logger = logger or logging.getLogger("letter_generator")
 
     def generate_letter(
@@ -77,7 +163,7 @@ class LetterGenerator:
         Raises:
             ValueError: If generation fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             self.logger.info(
@@ -89,30 +175,9 @@ class LetterGenerator:
                 },
             )
 
-            # Build generation prompt
-            user_message = get_generation_prompt(
-                extracted_data=request.extracted_data,
-                template_variables=request.template_variables.model_dump(),
-                tone=request.tone.value,
-                custom_instructions=request.custom_instructions,
-                include_settlement_deadline=request.include_settlement_deadline,
-                deadline_days=request.deadline_days,
-            )
-
-            # Create tool schema for structured output
-            tool_schema = pydantic_to_tool_schema(
-                GeneratedLetter,
-                name="generate_demand_letter",
-                description="Generate a structured demand letter with all required sections",
-            )
-
             # Invoke Claude with tool calling for structured generation
             response = self.bedrock_client.invoke(
-                messages=[{"role": "user", "content": user_message}],
-                system=GENERATION_SYSTEM_PROMPT,
-                tools=[tool_schema],
-                tool_choice={"type": "tool", "name": "generate_demand_letter"},
-                temperature=self.bedrock_client.config.temperature_generation,
+                **self._generation_params(request),
                 firm_id=firm_id,
                 user_id=user_id,
             )
@@ -121,7 +186,7 @@ class LetterGenerator:
             generated_letter = extract_tool_result(response, GeneratedLetter)
 
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             # Get token usage from response
             usage = response.get("usage", {})
@@ -156,7 +221,7 @@ class LetterGenerator:
             return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_message = str(e)
 
             self.logger.error(
@@ -164,43 +229,311 @@ class LetterGenerator:
                 extra={"case_id": request.case_id, "error": error_message},
             )
 
-            # Return failed result with empty letter
-            from .schemas.letter import (
-                LetterHeader,
-                LetterIntroduction,
-                LetterFacts,
-                LetterLiability,
-                LetterDamages,
-                LetterDemand,
-                LetterClosing,
+            return self._failed_generation_result(
+                request.case_id, error_message, processing_time
+            )
+
+    def generate_letter_stream(
+        self,
+        request: LetterGenerationRequest,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> Iterator[SectionDelta | LetterGenerationResult]:
+        """
+        Generate a demand letter, yielding each section as soon as it is written.
+
+        The letter is generated exactly as in generate_letter but over
+        converse_stream: a SectionDelta is yielded whenever a top-level
+        section of the tool input completes, so a UI can render the opening
+        sections while the rest are still being generated. The final item is
+        always the validated LetterGenerationResult (with success=False if
+        generation failed, as in generate_letter).
+
+        Args:
+            request: Letter generation request with case data and preferences
+            firm_id: Firm ID for multi-tenancy
+            user_id: User ID for tracking
+
+        Yields:
+            SectionDelta items in generation order, then the generation result
+        """
+        start_time = time.perf_counter()
+
+        try:
+            self.logger.info(
+                f"Starting streamed letter generation for case {request.case_id}",
+                extra={
+                    "case_id": request.case_id,
+                    "firm_id": firm_id,
+                    "tone": request.tone,
+                },
             )
 
-            empty_letter = GeneratedLetter(
-                header=LetterHeader(
-                    date="",
-                    recipient_name="",
-                    recipient_address="",
-                    subject_line="",
-                ),
-                introduction=LetterIntroduction(content="", client_name=""),
-                facts=LetterFacts(content=""),
-                liability=LetterLiability(content=""),
-                damages=LetterDamages(content="", total_damages=0.0),
-                demand=LetterDemand(content="", demand_amount=0.0),
-                closing=LetterClosing(content="", signature_block=""),
+            scanner = ToolInputScanner()
+            usage: dict = {}
+            for delta in self.bedrock_client.invoke_stream(
+                **self._generation_params(request),
+                firm_id=firm_id,
+                user_id=user_id,
+                include_usage=True,
+            ):
+                if "toolUse" in delta:
+                    for name, content in scanner.feed(delta["toolUse"].get("input", "")):
+                        if name in GeneratedLetter.model_fields and isinstance(content, dict):
+                            yield SectionDelta(section=LetterSection(name), content=content)
+                elif "usage" in delta:
+                    usage = delta["usage"]
+
+            # Validate the complete tool input once, as generate_letter does
+            tool_input = scanner.text()
+            response = {
+                "output": {
+                    "message": {
+                        "content": [
+                            {
+                                "toolUse": {
+                                    "name": "generate_demand_letter",
+                                    "input": json.loads(tool_input) if tool_input else {},
+                                }
+                            }
+                        ]
+                    }
+                }
+            }
+            generated_letter = extract_tool_result(response, GeneratedLetter)
+
+            processing_time = time.perf_counter() - start_time
+            token_usage = {
+                "input_tokens": usage.get("inputTokens", 0),
+                "output_tokens": usage.get("outputTokens", 0),
+            }
+
+            self.logger.info(
+                f"Successfully generated letter for case {request.case_id}",
+                extra={
+                    "case_id": request.case_id,
+                    "processing_time": processing_time,
+                    "input_tokens": token_usage["input_tokens"],
+                    "output_tokens": token_usage["output_tokens"],
+                    "version": 1,
+                },
             )
 
-            return LetterGenerationResult(
+            yield LetterGenerationResult(
                 case_id=request.case_id,
-                letter=empty_letter,
+                letter=generated_letter,
                 generation_timestamp=datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
                 model_id=self.bedrock_client.config.model_id,
-                token_usage={"input_tokens": 0, "output_tokens": 0},
+                token_usage=token_usage,
                 processing_time_seconds=round(processing_time, 2),
-                version=0,
-                success=False,
-                error_message=error_message,
+                version=1,
+                success=True,
+            )
+
+        except Exception as e:
+            processing_time = time.perf_counter() - start_time
+            error_message = str(e)
+
+            self.logger.error(
+                f"Letter generation failed for case {request.case_id}: {error_message}",
+                extra={"case_id": request.case_id, "error": error_message},
+            )
+
+            yield self._failed_generation_result(
+                request.case_id, error_message, processing_time
+            )
+
+    def generate_letters_batch(
+        self,
+        requests: list[LetterGenerationRequest],
+        firm_id: int | None = None,
+        user_id: int | None = None,
+        **batch_options,
+    ) -> list[LetterGenerationResult]:
+        """
+        Generate many letters through one Bedrock batch inference job.
+
+        For backfills and other jobs that can wait minutes to hours: batch
+        tokens cost half the on-demand rate and do not compete with
+        interactive requests for quota. Each letter is built exactly as in
+        generate_letter.
+
+        Args:
+            requests: Letter generation requests (case IDs must be unique)
+            firm_id: Firm ID for multi-tenancy
+            user_id: User ID for tracking
+            **batch_options: Polling options passed to BedrockClient.batch_invoke
+
+        Returns:
+            Generation results in the same order as requests; records the
+            job could not process come back with success=False
+
+        Raises:
+            ValueError: If two requests share a case ID
+        """
+        custom_ids = [f"case-{request.case_id}" for request in requests]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("Batch generation requires unique case IDs")
+
+        start_time = time.perf_counter()
+        try:
+            responses = self.bedrock_client.batch_invoke(
+                records=[
+                    {"custom_id": custom_id, "params": self._generation_params(request)}
+                    for custom_id, request in zip(custom_ids, requests, strict=True)
+                ],
+                firm_id=firm_id,
+                user_id=user_id,
+                **batch_options,
             )
+        except Exception as e:
+            processing_time = time.perf_counter() - start_time
+            self.logger.error(
+                f"Batch letter generation failed for {len(requests)} cases: {e}",
+                extra={"firm_id": firm_id, "error": str(e)},
+            )
+            return [
+                self._failed_generation_result(request.case_id, str(e), processing_time)
+                for request in requests
+            ]
+
+        processing_time = round(time.perf_counter() - start_time, 2)
+        timestamp = datetime.now(UTC).isoformat().replace('+00:00', 'Z')
+        results = []
+        for custom_id, request in zip(custom_ids, requests, strict=True):
+            response = responses.get(custom_id)
+            if response is None:
+                results.append(
+                    self._failed_generation_result(
+                        request.case_id, "Batch record was not processed", processing_time
+                    )
+                )
+                continue
+            try:
+                letter = extract_tool_result(response, GeneratedLetter)
+            except Exception as e:
+                results.append(
+                    self._failed_generation_result(request.case_id, str(e), processing_time)
+                )
+                continue
+            usage = response["usage"]
+            results.append(
+                LetterGenerationResult(
+                    case_id=request.case_id,
+                    letter=letter,
+                    generation_timestamp=timestamp,
+                    model_id=self.bedrock_client.config.model_id,
+                    token_usage={
+                        "input_tokens": usage.get("inputTokens", 0),
+                        "output_tokens": usage.get("outputTokens", 0),
+                    },
+                    processing_time_seconds=processing_time,
+                    version=1,
+                    success=True,
+                )
+            )
+
+        self.logger.info(
+            f"Batch generated {sum(r.success for r in results)}/{len(results)} letters",
+            extra={"firm_id": firm_id, "processing_time": processing_time},
+        )
+        return results
+
+    def _generation_params(self, request: LetterGenerationRequest) -> dict:
+        """
+        Build the Bedrock invoke arguments for generating one letter.
+
+        Args:
+            request: Letter generation request
+
+        Returns:
+            messages, system, tools, tool_choice, temperature, max_tokens
+            and cache_prompt for invoke
+        """
+        user_message = get_generation_prompt(
+            extracted_data=request.extracted_data,
+            template_variables=request.template_variables.model_dump(),
+            tone=request.tone.value,
+            custom_instructions=request.custom_instructions,
+            include_settlement_deadline=request.include_settlement_deadline,
+            deadline_days=request.deadline_days,
+        )
+
+        # Create tool schema for structured output
+        tool_schema = pydantic_to_tool_schema(
+            GeneratedLetter,
+            name="generate_demand_letter",
+            description="Generate a structured demand letter with all required sections",
+        )
+
+        return {
+            "messages": [{"role": "user", "content": user_message}],
+            "system": GENERATION_SYSTEM_PROMPT,
+            "tools": [tool_schema],
+            "tool_choice": {"type": "tool", "name": "generate_demand_letter"},
+            "temperature": self.bedrock_client.config.temperature_generation,
+            "max_tokens": self._output_budget(),
+            "cache_prompt": True,
+        }
+
+    def _output_budget(
+        self,
+        letter: GeneratedLetter | None = None,
+        rewritten: LetterSection | None = None,
+    ) -> int:
+        """
+        Get the max_tokens for a call that returns a whole letter.
+
+        A new letter gets the sum of the section caps. When rewriting an
+        existing letter, untouched sections are re-emitted roughly verbatim,
+        so they are budgeted at their current size plus a margin. Rewritten
+        sections keep their cap, or their current size if that is larger.
+        The result never exceeds the configured max_tokens.
+
+        Args:
+            letter: Letter being rewritten (None for a new letter)
+            rewritten: The one section being rewritten (None for all)
+
+        Returns:
+            Output token budget
+        """
+        if letter is None:
+            budget = sum(_MAX_TOKENS_PER_SECTION.values())
+        else:
+            budget = 0
+            for section, text in letter.iter_sections():
+                estimate = len(text) >> 2  # Same 4 chars/token estimate as the client
+                if rewritten is None or section == rewritten:
+                    budget += max(_MAX_TOKENS_PER_SECTION[section], estimate)
+                else:
+                    budget += estimate + (estimate >> 2)
+        return min(budget + _MAX_TOKENS_OVERHEAD, self.bedrock_client.config.max_tokens)
+
+    def _failed_generation_result(
+        self, case_id: str, error_message: str, processing_time: float
+    ) -> LetterGenerationResult:
+        """
+        Build a failed generation result with the shared empty letter.
+
+        Args:
+            case_id: Case the generation was for
+            error_message: Why generation failed
+            processing_time: Seconds spent before failing
+
+        Returns:
+            Letter generation result with success=False
+        """
+        return LetterGenerationResult(
+            case_id=case_id,
+            letter=_EMPTY_LETTER,
+            generation_timestamp=datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            model_id=self.bedrock_client.config.model_id,
+            token_usage={"input_tokens": 0, "output_tokens": 0},
+            processing_time_seconds=round(processing_time, 2),
+            version=0,
+            success=False,
+            error_message=error_message,
+        )
 
     def refine_letter(
         self,
@@ -242,15 +575,25 @@ class LetterGenerator:
             conversation_history = ConversationHistory()
 
         # Build refinement prompt
-        user_message = get_refinement_prompt(
-            current_letter=current_letter.model_dump(),
+        letter_part, feedback_part = get_refinement_prompt_parts(
+            current_letter=_letter_fields(current_letter),
             feedback_instruction=feedback.instruction,
             target_section=feedback.target_section.value if feedback.target_section else None,
             additional_context=feedback.context,
         )
 
-        # Add to conversation history
-        conversation_history.add_message("user", user_message)
+        # Add to conversation history, dropping turns past the window first
+        conversation_history.compact(max_turns=REFINEMENT_HISTORY_TURNS)
+        conversation_history.add_message("user", letter_part + feedback_part)
+
+        # Cache through the letter; history keeps plain text so cache points
+        # don't accumulate past Bedrock's per-request limit over many turns
+        messages = conversation_history.messages[:-1] + [
+            {
+                "role": "user",
+                "content": [{"text": letter_part}, CACHE_POINT, {"text": feedback_part}],
+            }
+        ]
 
         # Create tool schema for structured output
         tool_schema = pydantic_to_tool_schema(
@@ -261,20 +604,24 @@ class LetterGenerator:
 
         # Invoke Claude with conversation history
         response = self.bedrock_client.invoke(
-            messages=conversation_history.messages,
+            messages=messages,
             system=GENERATION_SYSTEM_PROMPT,
             tools=[tool_schema],
             tool_choice={"type": "tool", "name": "refine_demand_letter"},
             temperature=self.bedrock_client.config.temperature_generation,
+            max_tokens=self._output_budget(current_letter, feedback.target_section),
             firm_id=firm_id,
             user_id=user_id,
+            cache_prompt=True,
         )
 
         # Extract refined letter
         refined_letter = extract_tool_result(response, GeneratedLetter)
 
         # Determine which sections were modified
-        sections_modified = self._compare_letters(current_letter, refined_letter)
+        sections_modified = self._compare_letters(
+            current_letter.section_digests(), refined_letter.section_digests()
+        )
 
         # Generate change summary
         changes_summary = self._generate_change_summary(
@@ -339,7 +686,7 @@ class LetterGenerator:
 
         # Build section regeneration prompt
         user_message = get_section_regeneration_prompt(
-            current_letter=current_letter.model_dump(),
+            current_letter=_letter_fields(current_letter),
             section_name=section.value,
             regeneration_instruction=instruction,
             case_context=case_data,
@@ -353,15 +700,22 @@ class LetterGenerator:
             description=f"Regenerate the {section.value} section of the demand letter",
         )
 
-        # Invoke Claude
+        # Invoke Claude (the small model for header and closing)
         response = self.bedrock_client.invoke(
             messages=[{"role": "user", "content": user_message}],
             system=GENERATION_SYSTEM_PROMPT,
             tools=[tool_schema],
             tool_choice={"type": "tool", "name": "regenerate_letter_section"},
             temperature=self.bedrock_client.config.temperature_generation,
+            max_tokens=self._output_budget(current_letter, section),
             firm_id=firm_id,
             user_id=user_id,
+            cache_prompt=True,
+            model_id=(
+                self.bedrock_client.config.model_id_small
+                if section in SMALL_MODEL_SECTIONS
+                else None
+            ),
         )
 
         # Extract refined letter
@@ -404,8 +758,8 @@ class LetterGenerator:
         )
 
         # Build tone adjustment prompt
-        user_message = get_tone_adjustment_prompt(
-            current_letter=current_letter.model_dump(),
+        letter_part, tone_part = get_tone_adjustment_prompt_parts(
+            current_letter=_letter_fields(current_letter),
             new_tone=new_tone.value,
             reason=reason,
         )
@@ -419,13 +773,22 @@ class LetterGenerator:
 
         # Invoke Claude
         response = self.bedrock_client.invoke(
-            messages=[{"role": "user", "content": user_message}],
+            messages=[
+                {
+                    "role": "user",
+                    "content": [{"text": letter_part}, CACHE_POINT, {"text": tone_part}],
+                }
+            ],
             system=GENERATION_SYSTEM_PROMPT,
             tools=[tool_schema],
             tool_choice={"type": "tool", "name": "adjust_letter_tone"},
             temperature=self.bedrock_client.config.temperature_generation,
+            max_tokens=self._output_budget(current_letter),
             firm_id=firm_id,
             user_id=user_id,
+            cache_prompt=True,
+            # Rewording keeps every fact, so the small model is sufficient
+            model_id=self.bedrock_client.config.model_id_small,
         )
 
         # Extract adjusted letter
@@ -438,52 +801,168 @@ class LetterGenerator:
 
         return adjusted_letter
 
-    def _compare_letters(
-        self, original: GeneratedLetter, modified: GeneratedLetter
-    ) -> list[LetterSection]:
+    async def agenerate_letter(
+        self,
+        request: LetterGenerationRequest,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> LetterGenerationResult:
         """
-        Compare two letters to identify modified sections.
+        Async variant of generate_letter.
+
+        boto3 is blocking, so the call runs in a worker thread sharing this
+        generator's Bedrock client; callers can asyncio.gather several
+        letters so their Bedrock round-trips overlap.
 
         Args:
-            original: Original letter
-            modified: Modified letter
+            request: Letter generation request with case data and preferences
+            firm_id: Firm ID for multi-tenancy
+            user_id: User ID for tracking
 
         Returns:
-            List of sections that were modified
+            Letter generation result with structured letter
         """
-        modified_sections = []
+        return await asyncio.to_thread(self.generate_letter, request, firm_id, user_id)
 
-        # Compare each section
-        section_comparisons = {
-            LetterSection.HEADER: (
-                original.header.model_dump(),
-                modified.header.model_dump(),
-            ),
-            LetterSection.INTRODUCTION: (
-                original.introduction.content,
-                modified.introduction.content,
-            ),
-            LetterSection.FACTS: (original.facts.content, modified.facts.content),
-            LetterSection.LIABILITY: (
-                original.liability.content,
-                modified.liability.content,
-            ),
-            LetterSection.DAMAGES: (
-                original.damages.content,
-                modified.damages.content,
-            ),
-            LetterSection.DEMAND: (original.demand.content, modified.demand.content),
-            LetterSection.CLOSING: (
-                original.closing.content,
-                modified.closing.content,
-            ),
-        }
+    async def agenerate_letters(
+        self,
+        requests: list[LetterGenerationRequest],
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> list[LetterGenerationResult]:
+        """
+        Generate several letters concurrently.
 
-        for section, (orig_content, mod_content) in section_comparisons.items():
-            if orig_content != mod_content:
-                modified_sections.append(section)
+        Args:
+            requests: Letter generation requests
+            firm_id: Firm ID for multi-tenancy
+            user_id: User ID for tracking
 
-        return modified_sections
+        Returns:
+            Generation results in the same order as requests
+        """
+        return list(
+            await asyncio.gather(
+                *(self.agenerate_letter(request, firm_id, user_id) for request in requests)
+            )
+        )
+
+    async def arefine_letter(
+        self,
+        current_letter: GeneratedLetter,
+        feedback: RefinementFeedback,
+        conversation_history: ConversationHistory | None = None,
+        current_version: int = 1,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> RefinementResult:
+        """Async variant of refine_letter (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.refine_letter,
+            current_letter,
+            feedback,
+            conversation_history,
+            current_version,
+            firm_id,
+            user_id,
+        )
+
+    async def aregenerate_section(
+        self,
+        current_letter: GeneratedLetter,
+        section: LetterSection,
+        instruction: str,
+        case_data: dict | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> GeneratedLetter:
+        """Async variant of regenerate_section (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.regenerate_section,
+            current_letter,
+            section,
+            instruction,
+            case_data,
+            firm_id,
+            user_id,
+        )
+
+    async def aregenerate_sections(
+        self,
+        current_letter: GeneratedLetter,
+        regenerations: list[tuple[LetterSection, str]],
+        case_data: dict | None = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> GeneratedLetter:
+        """
+        Regenerate several sections concurrently and merge them into one letter.
+
+        Each (section, instruction) pair is a regenerate_section call against
+        the current letter, and all run at once. Only the named section is
+        taken from each result; every other section is kept from
+        current_letter.
+
+        Args:
+            current_letter: Current letter
+            regenerations: (section, instruction) pairs, one per section
+            case_data: Original case data for reference (optional)
+            firm_id: Firm ID for multi-tenancy
+            user_id: User ID for tracking
+
+        Returns:
+            Letter with every named section regenerated
+
+        Raises:
+            ValueError: If a section is named twice
+        """
+        sections = [section for section, _ in regenerations]
+        if len(set(sections)) != len(sections):
+            raise ValueError("Each section can only be regenerated once per call")
+
+        regenerated = await asyncio.gather(
+            *(
+                self.aregenerate_section(
+                    current_letter, section, instruction, case_data, firm_id, user_id
+                )
+                for section, instruction in regenerations
+            )
+        )
+
+        return current_letter.model_copy(
+            update={
+                section.value: getattr(letter, section.value)
+                for section, letter in zip(sections, regenerated, strict=True)
+            }
+        )
+
+    async def aadjust_tone(
+        self,
+        current_letter: GeneratedLetter,
+        new_tone: ToneStyle,
+        reason: Optional[str] = None,
+        firm_id: int | None = None,
+        user_id: int | None = None,
+    ) -> GeneratedLetter:
+        """Async variant of adjust_tone (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.adjust_tone, current_letter, new_tone, reason, firm_id, user_id
+        )
+
+    def _compare_letters(
+        self, original: dict[LetterSection, int], modified: dict[LetterSection, int]
+    ) -> list[LetterSection]:
+        """
+        Compare two letters to identify modified sections.
+
+        Args:
+            original: Original letter's GeneratedLetter.section_digests()
+            modified: Modified letter's GeneratedLetter.section_digests()
+
+        Returns:
+            List of sections that were modified, in letter order
+        """
+        return [section for section, digest in original.items() if modified[section] != digest]
 
     def _generate_change_summary(
         self,
@@ -525,11 +1004,16 @@ class LetterGenerator:
         Returns:
             Preview text
         """
-        full_text = letter.to_full_text()
-        if len(full_text) <= max_length:
-            return full_text
+        # Format sections only until the preview is known to be truncated
+        parts = []
+        length = -2  # The first section has no separator
+        for section_text in letter.iter_sections_text():
+            parts.append(section_text)
+            length += 2 + len(section_text)
+            if length > max_length:
+                return "\n\n".join(parts)[:max_length] + "..."
 
-        return full_text[:max_length] + "..."
+        return "\n\n".join(parts)
 
     def validate_letter_completeness(self, letter: GeneratedLetter) -> dict[str, bool]:
         """
@@ -543,11 +1027,17 @@ class LetterGenerator:
         """
         checks = {
             "has_header": bool(letter.header.recipient_name and letter.header.subject_line),
-            "has_introduction": len(letter.introduction.content.strip()) > 50,
-            "has_facts": len(letter.facts.content.strip()) > 100,
-            "has_liability": len(letter.liability.content.strip()) > 100,
-            "has_damages": len(letter.damages.content.strip()) > 50 and letter.damages.total_damages > 0,
-            "has_demand": len(letter.demand.content.strip()) > 50 and letter.demand.demand_amount > 0,
+            "has_introduction": _stripped_longer_than(letter.introduction.content, 50),
+            "has_facts": _stripped_longer_than(letter.facts.content, 100),
+            "has_liability": _stripped_longer_than(letter.liability.content, 100),
+            "has_damages": (
+                _stripped_longer_than(letter.damages.content, 50)
+                and letter.damages.total_damages > 0
+            ),
+            "has_demand": (
+                _stripped_longer_than(letter.demand.content, 50)
+                and letter.demand.demand_amount > 0
+            ),
             "has_closing": bool(letter.closing.content and letter.closing.signature_block),
         }
 
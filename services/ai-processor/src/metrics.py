@@ -10,11 +10,24 @@ Tracks performance and cost metrics for:
 Metrics are logged in structured format for CloudWatch Metrics aggregation.
 """
 
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Optional, Any
-from contextlib import contextmanager
-from .structured_logging import logger
+from typing import Dict, List, Optional, Any
+from .structured_logging import IS_LAMBDA, logger
+
+# Emit metrics as CloudWatch Embedded Metric Format (EMF) lines on stdout,
+# which CloudWatch Logs turns into metrics without any PutMetricData calls.
+# Outside Lambda metrics go to the debug log instead.
+METRICS_EMF = os.environ.get('METRICS_EMF', '1' if IS_LAMBDA else '0') == '1'
+
+# Most metrics the background thread folds into one emission
+METRICS_BATCH_SIZE = 20
 
 
 class MetricsCollector:
@@ -23,6 +36,10 @@ class MetricsCollector:
     def __init__(self, namespace: str = 'DemandLetterGenerator'):
         self.namespace = namespace
         self.environment = 'development'  # Will be set from env
+        # Recorded metrics wait here for the drain thread, started on first use
+        self._queue: queue.Queue = queue.Queue()
+        self._drain_thread: Optional[threading.Thread] = None
+        self._drain_lock = threading.Lock()
 
     def record_metric(
         self,
@@ -34,23 +51,124 @@ class MetricsCollector:
         """
         Record a metric value
 
+        The metric is queued and emitted by a background thread, so the
+        caller never waits on log I/O. Call flush() before the process may
+        be frozen (e.g. at the end of a Lambda invocation).
+
         Args:
             metric_name: Name of the metric
             value: Metric value
             unit: Unit of measurement
             dimensions: Additional dimensions for the metric
         """
-        metric_data = {
-            'namespace': self.namespace,
-            'metricName': metric_name,
-            'value': value,
-            'unit': unit,
-            'dimensions': dimensions or {},
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
+        self._record(metric_name, value, unit, dimensions, time.time())
+
+    def _record(
+        self,
+        metric_name: str,
+        value: float,
+        unit: str,
+        dimensions: Optional[Dict[str, str]],
+        timestamp: float
+    ):
+        """
+        Queue a metric recorded at timestamp (seconds since the epoch)
 
-        # Log metric in structured format
-        logger.debug('Metric recorded', extra={'extra_fields': {'metric': metric_data}})
+        Metrics travel as plain tuples; the drain thread formats them, so
+        the caller pays for no dict or timestamp string. Methods recording
+        several metrics at once share one timestamp.
+        """
+        self._queue.put_nowait((metric_name, value, unit, dimensions or {}, timestamp))
+        if self._drain_thread is None:
+            self._start_drain_thread()
+
+    def flush(self):
+        """Block until every metric recorded so far has been emitted"""
+        if self._drain_thread is not None:
+            self._queue.join()
+
+    def _start_drain_thread(self):
+        """Start the background thread that emits queued metrics"""
+        with self._drain_lock:
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(
+                    target=self._drain, name='metrics-drain', daemon=True
+                )
+                self._drain_thread.start()
+                # Don't lose queued metrics when the process exits
+                atexit.register(self.flush)
+
+    def _drain(self):
+        """Emit queued metrics in batches of up to METRICS_BATCH_SIZE"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < METRICS_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._emit(batch)
+            except Exception as e:
+                logger.warning(f'Failed to emit {len(batch)} metrics: {e}')
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _emit(self, batch: List[tuple]):
+        """
+        Emit a batch of metrics
+
+        With METRICS_EMF each group of metrics sharing dimensions becomes one
+        EMF document (repeated metric names become value arrays); otherwise
+        each metric is logged at debug level.
+
+        Args:
+            batch: (name, value, unit, dimensions, timestamp) tuples from _record
+        """
+        if not METRICS_EMF:
+            for metric_name, value, unit, dimensions, timestamp in batch:
+                metric_data = {
+                    'namespace': self.namespace,
+                    'metricName': metric_name,
+                    'value': value,
+                    'unit': unit,
+                    'dimensions': dimensions,
+                    'timestamp': datetime.utcfromtimestamp(timestamp).isoformat() + 'Z'
+                }
+                logger.debug('Metric recorded', extra={'extra_fields': {'metric': metric_data}})
+            return
+
+        groups: Dict[tuple, List[tuple]] = {}
+        for metric in batch:
+            groups.setdefault(tuple(metric[3].items()), []).append(metric)
+
+        lines = []
+        for dimensions, items in groups.items():
+            definitions = []
+            document: Dict[str, Any] = {
+                '_aws': {
+                    'Timestamp': int(items[0][4] * 1000),
+                    'CloudWatchMetrics': [{
+                        'Namespace': self.namespace,
+                        'Dimensions': [[name for name, _ in dimensions]],
+                        'Metrics': definitions,
+                    }],
+                },
+                **dict(dimensions),
+            }
+            for name, value, unit, _, _ in items:
+                if name not in document:
+                    document[name] = value
+                    definitions.append({'Name': name, 'Unit': unit})
+                elif isinstance(document[name], list):
+                    document[name].append(value)
+                else:
+                    document[name] = [document[name], value]
+            lines.append(json.dumps(document))
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
     def record_bedrock_invocation(
         self,
@@ -59,19 +177,25 @@ class MetricsCollector:
         output_tokens: int,
         duration: float,
         firm_id: str,
-        success: bool = True
+        success: bool = True,
+        cached_input_tokens: int = 0,
+        cache_write_tokens: int = 0
     ):
         """
         Record AWS Bedrock API invocation metrics
 
         Args:
             model: Bedrock model ID
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
             duration: Request duration in seconds
             firm_id: Firm ID for cost allocation
             success: Whether invocation succeeded
+            cached_input_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
         """
+        now = time.time()
+
         dimensions = {
             'Model': model,
             'FirmId': firm_id,
@@ -79,23 +203,26 @@ class MetricsCollector:
         }
 
         # Record token usage
-        self.record_metric('BedrockInputTokens', input_tokens, 'Count', dimensions)
-        self.record_metric('BedrockOutputTokens', output_tokens, 'Count', dimensions)
-        self.record_metric('BedrockTotalTokens', input_tokens + output_tokens, 'Count', dimensions)
+        self._record('BedrockInputTokens', input_tokens, 'Count', dimensions, now)
+        self._record('BedrockOutputTokens', output_tokens, 'Count', dimensions, now)
+        self._record('BedrockCachedInputTokens', cached_input_tokens, 'Count', dimensions, now)
+        self._record('BedrockTotalTokens', input_tokens + output_tokens, 'Count', dimensions, now)
 
         # Record duration
-        self.record_metric('BedrockInvocationDuration', duration * 1000, 'Milliseconds', dimensions)
+        self._record('BedrockInvocationDuration', duration * 1000, 'Milliseconds', dimensions, now)
 
         # Estimate and record cost
-        # Claude 3.5 Sonnet pricing: $3/MTok input, $15/MTok output
-        input_cost = (input_tokens / 1_000_000) * 3
-        output_cost = (output_tokens / 1_000_000) * 15
-        total_cost = input_cost + output_cost
+        cost = calculate_bedrock_cost(
+            input_tokens,
+            output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_tokens=cache_write_tokens,
+        )
 
-        self.record_metric('BedrockCost', total_cost, 'None', dimensions)  # USD
+        self._record('BedrockCost', cost['total'], 'None', dimensions, now)  # USD
 
         # Record invocation count
-        self.record_metric('BedrockInvocations', 1, 'Count', dimensions)
+        self._record('BedrockInvocations', 1, 'Count', dimensions, now)
 
     def record_document_analysis(
         self,
@@ -115,15 +242,17 @@ class MetricsCollector:
             success: Whether analysis succeeded
             firm_id: Firm ID
         """
+        now = time.time()
+
         dimensions = {
             'DocumentType': document_type,
             'FirmId': firm_id,
             'Success': str(success)
         }
 
-        self.record_metric('DocumentAnalysisDuration', duration * 1000, 'Milliseconds', dimensions)
-        self.record_metric('DocumentAnalysisSize', size_bytes, 'Bytes', dimensions)
-        self.record_metric('DocumentAnalysisCount', 1, 'Count', dimensions)
+        self._record('DocumentAnalysisDuration', duration * 1000, 'Milliseconds', dimensions, now)
+        self._record('DocumentAnalysisSize', size_bytes, 'Bytes', dimensions, now)
+        self._record('DocumentAnalysisCount', 1, 'Count', dimensions, now)
 
     def record_letter_generation(
         self,
@@ -141,16 +270,18 @@ class MetricsCollector:
             firm_id: Firm ID
             letter_length: Length of generated letter in characters
         """
+        now = time.time()
+
         dimensions = {
             'FirmId': firm_id,
             'Success': str(success)
         }
 
-        self.record_metric('LetterGenerationDuration', duration * 1000, 'Milliseconds', dimensions)
-        self.record_metric('LetterGenerationCount', 1, 'Count', dimensions)
+        self._record('LetterGenerationDuration', duration * 1000, 'Milliseconds', dimensions, now)
+        self._record('LetterGenerationCount', 1, 'Count', dimensions, now)
 
         if letter_length is not None:
-            self.record_metric('LetterLength', letter_length, 'Count', dimensions)
+            self._record('LetterLength', letter_length, 'Count', dimensions, now)
 
     def record_extraction_accuracy(
         self,
@@ -168,6 +299,8 @@ class MetricsCollector:
             fields_expected: Number of fields expected
             firm_id: Firm ID
         """
+        now = time.time()
+
         accuracy = (fields_extracted / fields_expected * 100) if fields_expected > 0 else 0
 
         dimensions = {
@@ -175,9 +308,9 @@ class MetricsCollector:
             'FirmId': firm_id
         }
 
-        self.record_metric('ExtractionAccuracy', accuracy, 'Percent', dimensions)
-        self.record_metric('FieldsExtracted', fields_extracted, 'Count', dimensions)
-        self.record_metric('FieldsExpected', fields_expected, 'Count', dimensions)
+        self._record('ExtractionAccuracy', accuracy, 'Percent', dimensions, now)
+        self._record('FieldsExtracted', fields_extracted, 'Count', dimensions, now)
+        self._record('FieldsExpected', fields_expected, 'Count', dimensions, now)
 
     def record_error(
         self,
@@ -209,8 +342,10 @@ class MetricsCollector:
         Args:
             duration: Cold start duration in seconds
         """
-        self.record_metric('LambdaColdStartDuration', duration * 1000, 'Milliseconds')
-        self.record_metric('LambdaColdStartCount', 1, 'Count')
+        now = time.time()
+
+        self._record('LambdaColdStartDuration', duration * 1000, 'Milliseconds', None, now)
+        self._record('LambdaColdStartCount', 1, 'Count', None, now)
 
     def record_lambda_memory_usage(self, used_mb: float, allocated_mb: float):
         """
@@ -220,32 +355,32 @@ class MetricsCollector:
             used_mb: Memory used in MB
             allocated_mb: Memory allocated in MB
         """
+        now = time.time()
+
         usage_percent = (used_mb / allocated_mb * 100) if allocated_mb > 0 else 0
 
-        self.record_metric('LambdaMemoryUsed', used_mb, 'Megabytes')
-        self.record_metric('LambdaMemoryAllocated', allocated_mb, 'Megabytes')
-        self.record_metric('LambdaMemoryUsagePercent', usage_percent, 'Percent')
+        self._record('LambdaMemoryUsed', used_mb, 'Megabytes', None, now)
+        self._record('LambdaMemoryAllocated', allocated_mb, 'Megabytes', None, now)
+        self._record('LambdaMemoryUsagePercent', usage_percent, 'Percent', None, now)
 
 
 # Global metrics collector instance
 metrics = MetricsCollector()
 
 
-@contextmanager
-def time_operation(
-    operation_name: str,
-    record_metric: bool = True,
-    dimensions: Optional[Dict[str, str]] = None
-):
+class _Timer:
     """
     Context manager to time an operation and optionally record metric
 
+    A plain class rather than a @contextmanager generator, so entering and
+    leaving costs two method calls and one result dict.
+
     Args:
         operation_name: Name of the operation
         record_metric: Whether to record timing metric
         dimensions: Additional dimensions for the metric
 
-    Yields:
+    Entering returns:
         dict: Result dictionary with 'duration' key set after completion
 
     Example:
@@ -254,71 +389,102 @@ def time_operation(
             pass
         print(f"Duration: {result['duration']} seconds")
     """
-    start_time = time.time()
-    result = {'duration': 0.0}
 
-    try:
-        yield result
-        duration = time.time() - start_time
-        result['duration'] = duration
-        result['success'] = True
+    __slots__ = ('name', 'record', 'dims', 'start', 'result')
 
-        if record_metric:
+    def __init__(
+        self,
+        operation_name: str,
+        record_metric: bool = True,
+        dimensions: Optional[Dict[str, str]] = None
+    ):
+        self.name = operation_name
+        self.record = record_metric
+        self.dims = dimensions
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.result = {'duration': 0.0}
+        self.start = time.perf_counter()
+        return self.result
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Like the generator it replaces, leave BaseExceptions (e.g.
+        # KeyboardInterrupt) untouched
+        if exc_type is not None and not issubclass(exc_type, Exception):
+            return False
+
+        duration = time.perf_counter() - self.start
+        success = exc_type is None
+        self.result['duration'] = duration
+        self.result['success'] = success
+
+        if self.record:
+            dimensions = self.dims
+            if not success:
+                # Only failures pay for a copy of the dimensions
+                dimensions = (
+                    {**self.dims, 'Success': 'false'} if self.dims else {'Success': 'false'}
+                )
             metrics.record_metric(
-                f'{operation_name}Duration',
+                f'{self.name}Duration',
                 duration * 1000,
                 'Milliseconds',
                 dimensions
             )
 
-    except Exception as e:
-        duration = time.time() - start_time
-        result['duration'] = duration
-        result['success'] = False
+        # Never suppress the exception
+        return False
 
-        if record_metric:
-            error_dimensions = dimensions.copy() if dimensions else {}
-            error_dimensions['Success'] = 'false'
-            metrics.record_metric(
-                f'{operation_name}Duration',
-                duration * 1000,
-                'Milliseconds',
-                error_dimensions
-            )
 
-        raise
+time_operation = _Timer
+
 
+# Per-token USD prices: (input, output, cache read, cache write)
+_PER_TOKEN_PRICING = {
+    'claude-3.5-sonnet': (3.0e-6, 15.0e-6, 0.30e-6, 3.75e-6),
+    'claude-3-haiku': (0.25e-6, 1.25e-6, 0.03e-6, 0.30e-6),
+    'claude-3-opus': (15.0e-6, 75.0e-6, 1.50e-6, 18.75e-6),
+}
+_DEFAULT_PRICING = _PER_TOKEN_PRICING['claude-3.5-sonnet']
 
-def calculate_bedrock_cost(input_tokens: int, output_tokens: int, model: str = 'claude-3.5-sonnet') -> Dict[str, float]:
+
+def calculate_bedrock_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model: str = 'claude-3.5-sonnet',
+    cached_input_tokens: int = 0,
+    cache_write_tokens: int = 0
+) -> Dict[str, float]:
     """
     Calculate Bedrock API cost
 
+    Values are unrounded; use format_cost for display.
+
     Args:
-        input_tokens: Number of input tokens
+        input_tokens: Number of uncached input tokens
         output_tokens: Number of output tokens
-        model: Model name (for different pricing)
+        model: Model name (for different pricing; Sonnet if unknown)
+        cached_input_tokens: Input tokens read from the prompt cache
+        cache_write_tokens: Input tokens written to the prompt cache
 
     Returns:
-        dict: Cost breakdown (input, output, total in USD)
+        dict: Cost breakdown (input, output, cache_read, cache_write, total in USD)
     """
-    # Pricing per million tokens
-    pricing = {
-        'claude-3.5-sonnet': {'input': 3.0, 'output': 15.0},
-        'claude-3-haiku': {'input': 0.25, 'output': 1.25},
-        'claude-3-opus': {'input': 15.0, 'output': 75.0},
-    }
-
-    # Default to Sonnet pricing if model not found
-    model_pricing = pricing.get(model, pricing['claude-3.5-sonnet'])
+    input_rate, output_rate, cache_read_rate, cache_write_rate = _PER_TOKEN_PRICING.get(
+        model, _DEFAULT_PRICING
+    )
 
-    input_cost = (input_tokens / 1_000_000) * model_pricing['input']
-    output_cost = (output_tokens / 1_000_000) * model_pricing['output']
-    total_cost = input_cost + output_cost
+    input_cost = input_tokens * input_rate
+    output_cost = output_tokens * output_rate
+    cache_read_cost = cached_input_tokens * cache_read_rate
+    cache_write_cost = cache_write_tokens * cache_write_rate
 
     return {
-        'input': round(input_cost, 6),
-        'output': round(output_cost, 6),
-        'total': round(total_cost, 6),
+        'input': input_cost,
+        'output': output_cost,
+        'cache_read': cache_read_cost,
+        'cache_write': cache_write_cost,
+        'total': input_cost + output_cost + cache_read_cost + cache_write_cost,
         'currency': 'USD'
     }
 
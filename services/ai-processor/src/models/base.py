@@ -5,11 +5,13 @@ This module provides the declarative base and common mixins
 for all database models in the AI processor service.
 """
 
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime
+import enum
+from operator import attrgetter
+from typing import Any, Callable
+
+from sqlalchemy import Column, DateTime, FetchedValue, String, func, text
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 
 # Create declarative base
 Base = declarative_base()
@@ -18,17 +20,28 @@ Base = declarative_base()
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps"""
 
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Read server-generated columns back via RETURNING on flush, so they are
+    # loaded without a lazy SELECT (which the async session cannot issue)
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Filled in by Postgres: the column default on INSERT, and the
+    # update_updated_at_column trigger (migration 001) on UPDATE
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
 
 class UUIDPrimaryKeyMixin:
-    """Mixin for UUID primary key"""
+    """Mixin for UUID primary key (generated by Postgres on INSERT)"""
 
+    # Matches the column default from migration 005, so new keys stay
+    # time-ordered; fetch them with INSERT ... RETURNING rather than binding
+    # a Python-side uuid4
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("uuid_generate_v7()"),
         nullable=False
     )
 
@@ -43,9 +56,68 @@ class FirmScopedMixin:
     )
 
 
+def _enum_values(enum_class: type[enum.Enum]) -> list[str]:
+    """Persist members by value ("pending"), matching the migration's labels."""
+    return [member.value for member in enum_class]
+
+
+def db_enum(enum_class: type[enum.Enum], name: str) -> ENUM:
+    """
+    Map a Python enum onto an existing Postgres enum type.
+
+    The type is created by the SQL migrations, so the ORM never emits
+    CREATE TYPE for it; the column type is built once per model at import
+    and bound parameters reuse the cached compiled statement.
+
+    Keep these columns native enums rather than integer codes: Postgres
+    already stores each label as a 4-byte OID, the API service reads and
+    writes the labels, and idx_documents_virus_pending (migration 006)
+    filters on virus_scan_status = 'pending'.
+
+    Args:
+        enum_class: Enum whose values are the Postgres enum labels
+        name: Postgres type name
+
+    Returns:
+        Native PostgreSQL ENUM column type
+    """
+    return ENUM(enum_class, name=name, create_type=False, values_callable=_enum_values)
+
+
+def row_serializer(
+    fields: tuple[tuple[str, str, Callable[[Any], Any] | None], ...],
+) -> Callable[[Any], dict]:
+    """
+    Build a to_dict function from (key, attribute, converter) triples.
+
+    All attributes are read with one attrgetter call, and each non-None
+    value is passed through its converter (None leaves it as is). Bulk
+    serialization is then a tight loop over prebuilt tuples.
+
+    Args:
+        fields: Output key, model attribute and optional converter per field
+
+    Returns:
+        Function mapping a model instance to a dictionary
+    """
+    keys = tuple(key for key, _, _ in fields)
+    converters = tuple(converter for _, _, converter in fields)
+    get_values = attrgetter(*(attribute for _, attribute, _ in fields))
+
+    def serialize(obj: Any) -> dict:
+        return {
+            key: value if converter is None or value is None else converter(value)
+            for key, converter, value in zip(keys, converters, get_values(obj), strict=True)
+        }
+
+    return serialize
+
+
 __all__ = [
     "Base",
     "TimestampMixin",
     "UUIDPrimaryKeyMixin",
     "FirmScopedMixin",
+    "db_enum",
+    "row_serializer",
 ]
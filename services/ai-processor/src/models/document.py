@@ -5,12 +5,23 @@ This model represents source documents that are analyzed
 to extract information for demand letter generation.
 """
 
-from sqlalchemy import Column, String, BigInteger, Enum, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey, insert, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, insert as pg_insert
+from sqlalchemy.orm import Session, relationship
+from datetime import datetime
+from operator import attrgetter
+from typing import Any
 import enum
+import uuid
 
-from .base import Base, TimestampMixin, UUIDPrimaryKeyMixin, FirmScopedMixin
+from .base import (
+    Base,
+    TimestampMixin,
+    UUIDPrimaryKeyMixin,
+    FirmScopedMixin,
+    db_enum,
+    row_serializer,
+)
 
 
 class VirusScanStatus(str, enum.Enum):
@@ -20,6 +31,10 @@ class VirusScanStatus(str, enum.Enum):
     INFECTED = "infected"
 
 
+# Namespace for Document.derive_id; changing it changes every derived key
+DOCUMENT_ID_NAMESPACE = uuid.UUID("c4f7613b-378f-4006-b554-b9e57de8f32d")
+
+
 class Document(Base, UUIDPrimaryKeyMixin, FirmScopedMixin, TimestampMixin):
     """Document model for source documents"""
 
@@ -39,33 +54,100 @@ class Document(Base, UUIDPrimaryKeyMixin, FirmScopedMixin, TimestampMixin):
 
     # Virus scanning
     virus_scan_status = Column(
-        Enum(VirusScanStatus, name="virus_scan_status"),
+        db_enum(VirusScanStatus, "virus_scan_status"),
         default=VirusScanStatus.PENDING,
         nullable=False
     )
     virus_scan_date = Column(DateTime(timezone=True))
 
-    # Flexible metadata storage (JSONB)
-    metadata = Column(JSONB, default={}, nullable=False)
+    # Flexible metadata storage (JSONB). The attribute can't be named
+    # "metadata" (reserved for Base.metadata), so it maps that column by name
+    doc_metadata = Column(
+        "metadata", JSONB, server_default=text("'{}'::jsonb"), nullable=False
+    )
 
     def __repr__(self):
         return f"<Document(id={self.id}, filename='{self.filename}', firm_id={self.firm_id})>"
 
     def to_dict(self):
         """Convert model to dictionary"""
-        return {
-            "id": str(self.id),
-            "firm_id": str(self.firm_id),
-            "uploaded_by": str(self.uploaded_by),
-            "filename": self.filename,
-            "file_type": self.file_type,
-            "file_size": self.file_size,
-            "virus_scan_status": self.virus_scan_status.value,
-            "virus_scan_date": self.virus_scan_date.isoformat() if self.virus_scan_date else None,
-            "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _document_to_dict(self)
+
+    @classmethod
+    def bulk_create(cls, session: Session, rows: list[dict[str, Any]]) -> list[uuid.UUID]:
+        """
+        Insert a batch of documents with one executemany INSERT.
+
+        Skips the per-object unit-of-work bookkeeping of session.add(); no
+        Document instances are created or added to the session. Keys in each
+        row are attribute names (e.g. doc_metadata); id, timestamps and
+        metadata are filled in by Postgres when omitted. Async callers can
+        use ``await session.run_sync(Document.bulk_create, rows)``.
+
+        Args:
+            session: Active database session (the caller commits)
+            rows: Column values per document
+
+        Returns:
+            Generated document IDs, in the order of rows
+        """
+        if not rows:
+            return []
+        statement = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        return list(session.scalars(statement, rows))
+
+    @staticmethod
+    def derive_id(firm_id: uuid.UUID | str, s3_bucket: str, s3_key: str) -> uuid.UUID:
+        """
+        Derive a document's primary key from its firm and S3 location.
+
+        The same object always maps to the same UUIDv5, so re-ingesting it
+        targets the existing row instead of creating a duplicate.
+        """
+        return uuid.uuid5(DOCUMENT_ID_NAMESPACE, f"{firm_id}|{s3_bucket}|{s3_key}")
+
+    @classmethod
+    def bulk_ingest(cls, session: Session, rows: list[dict[str, Any]]) -> list[uuid.UUID]:
+        """
+        Idempotently insert a batch of documents keyed by S3 location.
+
+        Each row gets the derive_id key for its firm_id, s3_bucket and s3_key,
+        and rows whose key already exists are skipped with ON CONFLICT DO
+        NOTHING; no SELECT is needed to find them first. Derived keys are
+        not time-ordered like the server-generated UUIDv7 ones, so use
+        bulk_create where idempotency isn't needed.
+
+        Args:
+            session: Active database session (the caller commits)
+            rows: Column values per document, including firm_id, s3_bucket and s3_key
+
+        Returns:
+            Document IDs (new or existing), in the order of rows
+        """
+        ids = [
+            cls.derive_id(row["firm_id"], row["s3_bucket"], row["s3_key"]) for row in rows
+        ]
+        if rows:
+            statement = pg_insert(cls).on_conflict_do_nothing(index_elements=[cls.id])
+            session.execute(
+                statement, [{**row, "id": doc_id} for row, doc_id in zip(rows, ids, strict=True)]
+            )
+        return ids
+
+
+_document_to_dict = row_serializer((
+    ("id", "id", str),
+    ("firm_id", "firm_id", str),
+    ("uploaded_by", "uploaded_by", str),
+    ("filename", "filename", None),
+    ("file_type", "file_type", None),
+    ("file_size", "file_size", None),
+    ("virus_scan_status", "virus_scan_status", attrgetter("value")),
+    ("virus_scan_date", "virus_scan_date", datetime.isoformat),
+    ("metadata", "doc_metadata", None),
+    ("created_at", "created_at", datetime.isoformat),
+    ("updated_at", "updated_at", datetime.isoformat),
+))
 
 
 __all__ = ["Document", "VirusScanStatus"]
@@ -4,12 +4,23 @@ Demand Letter model for AI processor service.
 This model represents demand letter projects and their workflow state.
 """
 
-from sqlalchemy import Column, String, Text, Enum, ForeignKey
+from sqlalchemy import Column, String, Text, ForeignKey, cast, func, literal_column, select, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, load_only, relationship
+from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 import enum
+import uuid
 
-from .base import Base, TimestampMixin, UUIDPrimaryKeyMixin, FirmScopedMixin
+from .base import (
+    Base,
+    TimestampMixin,
+    UUIDPrimaryKeyMixin,
+    FirmScopedMixin,
+    db_enum,
+    row_serializer,
+)
 
 
 class LetterStatus(str, enum.Enum):
@@ -34,7 +45,7 @@ class DemandLetter(Base, UUIDPrimaryKeyMixin, FirmScopedMixin, TimestampMixin):
     # Letter metadata
     title = Column(String(500), nullable=False)
     status = Column(
-        Enum(LetterStatus, name="letter_status"),
+        db_enum(LetterStatus, "letter_status"),
         default=LetterStatus.DRAFT,
         nullable=False
     )
@@ -43,30 +54,85 @@ class DemandLetter(Base, UUIDPrimaryKeyMixin, FirmScopedMixin, TimestampMixin):
     current_content = Column(Text)
 
     # Extracted data from document analysis (JSONB)
-    extracted_data = Column(JSONB, default={}, nullable=False)
+    extracted_data = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)
 
     # AI generation metadata (JSONB)
     # Stores: model used, tokens consumed, generation params, etc.
-    generation_metadata = Column(JSONB, default={}, nullable=False)
+    generation_metadata = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)
 
     def __repr__(self):
         return f"<DemandLetter(id={self.id}, title='{self.title}', status={self.status.value}, firm_id={self.firm_id})>"
 
     def to_dict(self):
         """Convert model to dictionary"""
-        return {
-            "id": str(self.id),
-            "firm_id": str(self.firm_id),
-            "created_by": str(self.created_by),
-            "template_id": str(self.template_id) if self.template_id else None,
-            "title": self.title,
-            "status": self.status.value,
-            "current_content": self.current_content,
-            "extracted_data": self.extracted_data,
-            "generation_metadata": self.generation_metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-__all__ = ["DemandLetter", "LetterStatus"]
+        return _letter_to_dict(self)
+
+    @classmethod
+    def fetch_json(
+        cls, session: Session, letter_id: uuid.UUID, firm_id: uuid.UUID
+    ) -> str | None:
+        """
+        Fetch one letter as JSON text rendered by Postgres.
+
+        The object has the same keys as to_dict(), but the JSONB columns are
+        never parsed into Python objects and re-encoded; embed the result in
+        a response with orjson.Fragment.
+
+        Args:
+            session: Active database session
+            letter_id: Letter ID
+            firm_id: Firm the letter must belong to
+
+        Returns:
+            JSON object text, or None if no such letter exists for the firm
+        """
+        statement = select(_LETTER_JSON).where(cls.id == letter_id, cls.firm_id == firm_id)
+        return session.scalar(statement)
+
+
+# Loader option for listings that never read the letter body or JSONB blobs:
+#   select(DemandLetter).options(LETTER_SUMMARY_COLUMNS)
+# current_content, extracted_data and generation_metadata (often TOASTed,
+# tens of KB) are left out of the SELECT; touching them later issues a
+# per-row load, so leave it off queries whose rows go through to_dict().
+LETTER_SUMMARY_COLUMNS = load_only(
+    DemandLetter.id,
+    DemandLetter.firm_id,
+    DemandLetter.created_by,
+    DemandLetter.template_id,
+    DemandLetter.title,
+    DemandLetter.status,
+    DemandLetter.created_at,
+    DemandLetter.updated_at,
+)
+
+
+_LETTER_FIELDS = (
+    ("id", "id", str),
+    ("firm_id", "firm_id", str),
+    ("created_by", "created_by", str),
+    ("template_id", "template_id", str),
+    ("title", "title", None),
+    ("status", "status", attrgetter("value")),
+    ("current_content", "current_content", None),
+    ("extracted_data", "extracted_data", None),
+    ("generation_metadata", "generation_metadata", None),
+    ("created_at", "created_at", datetime.isoformat),
+    ("updated_at", "updated_at", datetime.isoformat),
+)
+
+_letter_to_dict = row_serializer(_LETTER_FIELDS)
+
+# to_dict()'s object built in SQL; cast to text so no driver decodes it
+_LETTER_JSON = cast(
+    func.json_build_object(
+        *chain.from_iterable(
+            (literal_column(f"'{key}'"), getattr(DemandLetter, attribute))
+            for key, attribute, _ in _LETTER_FIELDS
+        )
+    ),
+    Text,
+)
+
+
+__all__ = ["DemandLetter", "LetterStatus", "LETTER_SUMMARY_COLUMNS"]
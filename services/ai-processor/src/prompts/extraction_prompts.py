@@ -4,6 +4,12 @@ Prompts for document extraction using Claude.
 These prompts guide the AI to extract structured information from legal documents.
 """
 
+import functools
+
+# Bump whenever SYSTEM_PROMPT, the guidelines, or the extraction prompt change;
+# it is part of the extraction cache key
+EXTRACTION_PROMPT_VERSION = "1"
+
 SYSTEM_PROMPT = """You are an expert legal document analyst specialized in extracting structured information from various types of legal documents including:
 - Police reports
 - Medical records
@@ -36,22 +42,7 @@ Quality standards:
 Be thorough but concise. Focus on information relevant to a demand letter or legal claim."""
 
 
-def get_extraction_prompt(document_text: str, document_type: str | None = None) -> str:
-    """
-    Generate extraction prompt for a document.
-
-    Args:
-        document_text: Full text of the document
-        document_type: Type of document if known (helps with context)
-
-    Returns:
-        Formatted prompt for Claude
-    """
-    doc_type_context = ""
-    if document_type:
-        doc_type_context = f"\n\nDocument type: {document_type}"
-
-    return f"""Please analyze the following document and extract all relevant structured information.{doc_type_context}
+_EXTRACTION_PROMPT_TEMPLATE = """Please analyze the following document and extract all relevant structured information.{doc_type_context}
 
 Document text:
 ---
@@ -75,6 +66,40 @@ Provide a brief 2-3 sentence summary of the document's content.
 If the document is difficult to parse or contains unclear information, note this in the extraction_notes field."""
 
 
+# Split around the document so only the (type-dependent) head is ever formatted
+_EXTRACTION_PROMPT_HEAD, _EXTRACTION_PROMPT_TAIL = _EXTRACTION_PROMPT_TEMPLATE.split(
+    "{document_text}"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _extraction_prompt_head(document_type: str | None) -> str:
+    """Render the part of the extraction prompt before the document text."""
+    doc_type_context = ""
+    if document_type:
+        doc_type_context = f"\n\nDocument type: {document_type}"
+    return _EXTRACTION_PROMPT_HEAD.format_map({"doc_type_context": doc_type_context})
+
+
+def get_extraction_prompt(document_text: str, document_type: str | None = None) -> str:
+    """
+    Generate extraction prompt for a document.
+
+    The instructions around the document are rendered once per document
+    type; each call only splices the document text between them.
+
+    Args:
+        document_text: Full text of the document
+        document_type: Type of document if known (helps with context)
+
+    Returns:
+        Formatted prompt for Claude
+    """
+    return "".join(
+        (_extraction_prompt_head(document_type), document_text, _EXTRACTION_PROMPT_TAIL)
+    )
+
+
 def get_focused_extraction_prompt(
     document_text: str, focus_area: str, additional_context: str | None = None
 ) -> str:
@@ -164,10 +189,8 @@ def get_multi_document_synthesis_prompt(
         Formatted synthesis prompt
     """
     summaries_text = "\n\n".join(
-        [
-            f"Document {i+1} ({doc.get('type', 'Unknown')}):\n{doc.get('summary', '')}"
-            for i, doc in enumerate(document_summaries)
-        ]
+        f"Document {i+1} ({doc.get('type', 'Unknown')}):\n{doc.get('summary', '')}"
+        for i, doc in enumerate(document_summaries)
     )
 
     return f"""Please synthesize information from multiple documents to {synthesis_goal}.
@@ -247,10 +270,14 @@ For wage loss statements, pay special attention to:
 }
 
 
+@functools.lru_cache(maxsize=64)
 def get_document_type_guidelines(document_type: str) -> str:
     """
     Get specific guidelines for a document type.
 
+    Results are cached per document_type spelling, so repeated lookups skip
+    the lowercasing.
+
     Args:
         document_type: Type of document
 
@@ -258,3 +285,29 @@ def get_document_type_guidelines(document_type: str) -> str:
         Guidelines string or empty string if no specific guidelines
     """
     return DOCUMENT_TYPE_GUIDELINES.get(document_type.lower(), "")
+
+
+# System prompts with document-type guidelines appended, built once at import
+SYSTEM_PROMPTS_BY_TYPE = {
+    document_type: f"{SYSTEM_PROMPT}\n\n{guidelines}"
+    for document_type, guidelines in DOCUMENT_TYPE_GUIDELINES.items()
+    if guidelines
+}
+
+
+@functools.lru_cache(maxsize=64)
+def get_system_prompt(document_type: str | None = None) -> str:
+    """
+    Get the extraction system prompt for a document type.
+
+    Results are cached per document_type spelling.
+
+    Args:
+        document_type: Type of document (optional)
+
+    Returns:
+        SYSTEM_PROMPT plus any document-type guidelines
+    """
+    if not document_type:
+        return SYSTEM_PROMPT
+    return SYSTEM_PROMPTS_BY_TYPE.get(document_type.lower(), SYSTEM_PROMPT)
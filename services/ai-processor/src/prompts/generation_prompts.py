@@ -207,6 +207,34 @@ def get_refinement_prompt(
     Returns:
         Formatted refinement prompt
     """
+    return "".join(
+        get_refinement_prompt_parts(
+            current_letter, feedback_instruction, target_section, additional_context
+        )
+    )
+
+
+def get_refinement_prompt_parts(
+    current_letter: dict,
+    feedback_instruction: str,
+    target_section: Optional[str] = None,
+    additional_context: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    Generate the refinement prompt as a letter prefix and a feedback suffix.
+
+    The prefix depends only on the letter, so it can be marked as a prompt
+    cache point and reused across feedback on the same version.
+
+    Args:
+        current_letter: Current letter content (GeneratedLetter schema)
+        feedback_instruction: Attorney's instruction for changes
+        target_section: Specific section to modify (if applicable)
+        additional_context: Additional context for refinement
+
+    Returns:
+        (letter prefix, feedback suffix); joined they form the full prompt
+    """
     # Format current letter
     letter_text = _format_letter_for_refinement(current_letter)
 
@@ -220,14 +248,16 @@ def get_refinement_prompt(
     if additional_context:
         context_section = f"\n\n**Additional Context:**\n{additional_context}"
 
-    prompt = f"""Please refine the following demand letter based on the attorney's feedback.
+    letter_part = f"""Please refine the following demand letter based on the attorney's feedback.
 
 **Current Letter:**
 ---
 {letter_text}
 ---
 
-**Attorney's Instruction:**
+"""
+
+    feedback_part = f"""**Attorney's Instruction:**
 {feedback_instruction}
 {section_focus}
 {context_section}
@@ -243,7 +273,7 @@ Please provide:
 - The complete refined letter (all sections)
 - A brief summary of changes made"""
 
-    return prompt
+    return letter_part, feedback_part
 
 
 def get_section_regeneration_prompt(
@@ -307,6 +337,23 @@ def get_tone_adjustment_prompt(current_letter: dict, new_tone: str, reason: Opti
     Returns:
         Formatted tone adjustment prompt
     """
+    return "".join(get_tone_adjustment_prompt_parts(current_letter, new_tone, reason))
+
+
+def get_tone_adjustment_prompt_parts(
+    current_letter: dict, new_tone: str, reason: Optional[str] = None
+) -> tuple[str, str]:
+    """
+    Generate the tone adjustment prompt as a letter prefix and a tone suffix.
+
+    Args:
+        current_letter: Current letter content
+        new_tone: Desired new tone
+        reason: Reason for tone change (optional)
+
+    Returns:
+        (letter prefix, tone suffix); joined they form the full prompt
+    """
     letter_text = _format_letter_for_refinement(current_letter)
     tone_guidance = TONE_STYLE_GUIDANCE.get(new_tone, TONE_STYLE_GUIDANCE["formal"])
 
@@ -314,14 +361,16 @@ def get_tone_adjustment_prompt(current_letter: dict, new_tone: str, reason: Opti
     if reason:
         reason_section = f"\n\n**Reason for Tone Change:** {reason}"
 
-    prompt = f"""Please rewrite this demand letter with a different tone.
+    letter_part = f"""Please rewrite this demand letter with a different tone.
 
 **Current Letter:**
 ---
 {letter_text}
 ---
 
-**New Tone:**
+"""
+
+    tone_part = f"""**New Tone:**
 {tone_guidance}
 {reason_section}
 
@@ -334,7 +383,7 @@ def get_tone_adjustment_prompt(current_letter: dict, new_tone: str, reason: Opti
 
 Please provide the complete letter with the new tone."""
 
-    return prompt
+    return letter_part, tone_part
 
 
 # Helper functions for formatting
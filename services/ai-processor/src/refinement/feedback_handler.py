@@ -300,14 +300,11 @@ class FeedbackHandler:
         Raises:
             ValueError: If session or versions not found
         """
-        letter_a = self.rollback_to_version(session_id, version_a)
-        letter_b = self.rollback_to_version(session_id, version_b)
-
-        # Use the letter generator's comparison logic
-        modified_sections = self.letter_generator._compare_letters(letter_a, letter_b)
+        conversation_history = self.conversation_histories.get(session_id)
+        if conversation_history is None:
+            raise ValueError(f"Refinement session not found: {session_id}")
 
-        # Get version entries for timestamps and summaries
-        conversation_history = self.conversation_histories[session_id]
+        # Get version entries for snapshots, timestamps and summaries
         entry_a = next(
             (v for v in conversation_history.version_history if v["version"] == version_a),
             None,
@@ -316,14 +313,23 @@ class FeedbackHandler:
             (v for v in conversation_history.version_history if v["version"] == version_b),
             None,
         )
+        for version, entry in ((version_a, entry_a), (version_b, entry_b)):
+            if entry is None:
+                raise ValueError(f"Version {version} not found in session {session_id}")
+
+        # Use the letter generator's comparison logic on the stored snapshots
+        modified_sections = self.letter_generator._compare_letters(
+            GeneratedLetter.model_validate(entry_a["letter_snapshot"]).section_digests(),
+            GeneratedLetter.model_validate(entry_b["letter_snapshot"]).section_digests(),
+        )
 
         return {
             "version_a": version_a,
             "version_b": version_b,
-            "timestamp_a": entry_a["timestamp"] if entry_a else None,
-            "timestamp_b": entry_b["timestamp"] if entry_b else None,
-            "changes_summary_a": entry_a["changes_summary"] if entry_a else None,
-            "changes_summary_b": entry_b["changes_summary"] if entry_b else None,
+            "timestamp_a": entry_a["timestamp"],
+            "timestamp_b": entry_b["timestamp"],
+            "changes_summary_a": entry_a["changes_summary"],
+            "changes_summary_b": entry_b["changes_summary"],
             "modified_sections": [s.value for s in modified_sections],
             "section_count_modified": len(modified_sections),
         }
@@ -5,6 +5,8 @@ These schemas define the structured output format for AI-generated demand letter
 and the refinement feedback system.
 """
 
+import hashlib
+from collections.abc import Callable, Iterator
 from datetime import datetime, UTC
 from enum import Enum
 from typing import Optional
@@ -140,8 +142,27 @@ class GeneratedLetter(BaseModel):
         Returns:
             Complete letter as formatted text
         """
-        sections = []
+        return "\n\n".join(self.iter_sections_text())
 
+    def iter_sections_text(self) -> Iterator[str]:
+        """
+        Yield the formatted text of each section in letter order.
+
+        Joined with blank lines this is the full letter text; consumers that
+        need only a prefix can stop early without formatting the rest.
+
+        Yields:
+            Header, body sections, then closing, as formatted text
+        """
+        return (text for _, text in self.iter_sections())
+
+    def iter_sections(self) -> Iterator[tuple[LetterSection, str]]:
+        """
+        Yield each section with its formatted text, in letter order.
+
+        Yields:
+            (section, formatted text) pairs from header to closing
+        """
         # Header
         header_text = f"{self.header.date}\n\n"
         header_text += f"{self.header.recipient_name}\n"
@@ -150,22 +171,48 @@ class GeneratedLetter(BaseModel):
         header_text += f"{self.header.recipient_address}\n\n"
         header_text += f"{self.header.subject_line}\n\n"
         header_text += f"{self.header.salutation}\n"
-        sections.append(header_text)
+        yield LetterSection.HEADER, header_text
 
         # Body sections
-        sections.append(self.introduction.content)
-        sections.append(self.facts.content)
-        sections.append(self.liability.content)
-        sections.append(self.damages.content)
-        sections.append(self.demand.content)
+        yield LetterSection.INTRODUCTION, self.introduction.content
+        yield LetterSection.FACTS, self.facts.content
+        yield LetterSection.LIABILITY, self.liability.content
+        yield LetterSection.DAMAGES, self.damages.content
+        yield LetterSection.DEMAND, self.demand.content
 
         # Closing
         closing_text = f"{self.closing.content}\n\n"
         closing_text += f"{self.closing.closing_phrase}\n\n"
         closing_text += self.closing.signature_block
-        sections.append(closing_text)
+        yield LetterSection.CLOSING, closing_text
 
-        return "\n\n".join(sections)
+    def section_digests(self) -> dict[LetterSection, int]:
+        """
+        Get a 64-bit BLAKE2b digest of each section's content.
+
+        Comparing two letters' digests is one integer compare per section,
+        and digests can be kept alongside a letter version in place of its
+        text. The header digest covers all header fields.
+
+        Returns:
+            Digest for every section, keyed by section
+        """
+        header_text = "\x1f".join(str(value) for _, value in self.header)
+        texts = (
+            (LetterSection.HEADER, header_text),
+            (LetterSection.INTRODUCTION, self.introduction.content),
+            (LetterSection.FACTS, self.facts.content),
+            (LetterSection.LIABILITY, self.liability.content),
+            (LetterSection.DAMAGES, self.damages.content),
+            (LetterSection.DEMAND, self.demand.content),
+            (LetterSection.CLOSING, self.closing.content),
+        )
+        return {
+            section: int.from_bytes(
+                hashlib.blake2b(text.encode(), digest_size=8).digest()
+            )
+            for section, text in texts
+        }
 
     def get_section_text(self, section: LetterSection) -> str:
         """
@@ -281,6 +328,27 @@ class LetterGenerationResult(BaseModel):
     )
 
 
+class SectionDelta(BaseModel):
+    """A letter section that finished generating during a streamed generation."""
+
+    section: LetterSection = Field(..., description="Section that completed")
+    content: dict = Field(
+        ...,
+        description="Section fields as generated (validated only in the final result)",
+    )
+
+
+# Opens the user message that stands in for turns dropped by compact()
+HISTORY_SUMMARY_PREFIX = "Summary of earlier refinement turns (full messages omitted):"
+
+
+def _summarize_replies(messages: list[dict]) -> str:
+    """Summarize dropped turns as their assistant replies, one bullet each."""
+    return "\n".join(
+        f"- {message['content']}" for message in messages if message["role"] == "assistant"
+    )
+
+
 class ConversationHistory(BaseModel):
     """Conversation history for iterative refinement."""
 
@@ -302,6 +370,47 @@ class ConversationHistory(BaseModel):
         """
         self.messages.append({"role": role, "content": content})
 
+    def compact(
+        self,
+        max_turns: int = 4,
+        summarizer: Callable[[list[dict]], str] | None = None,
+    ) -> None:
+        """
+        Keep only the last turns verbatim, folding older ones into a summary.
+
+        Every refinement turn resends the whole letter, so input tokens grow
+        with each turn. This keeps the last max_turns user/assistant
+        exchanges. Older exchanges are replaced by one summary exchange at
+        the start, and the summary carries forward across later compactions.
+        version_history is untouched.
+
+        Args:
+            max_turns: Number of most recent exchanges to keep verbatim
+            summarizer: Turns dropped messages into summary text (defaults
+                to listing their assistant replies)
+        """
+        messages = self.messages
+        has_summary = bool(messages) and str(messages[0]["content"]).startswith(
+            HISTORY_SUMMARY_PREFIX
+        )
+        start = 2 if has_summary else 0
+        cut = max(len(messages) - 2 * max_turns, start)
+        # Retained turns must open with a user message
+        while cut < len(messages) and messages[cut]["role"] != "user":
+            cut += 1
+        if cut == start:
+            return
+
+        summary_lines = [(summarizer or _summarize_replies)(messages[start:cut])]
+        if has_summary:
+            summary_lines.insert(0, messages[0]["content"][len(HISTORY_SUMMARY_PREFIX) + 1:])
+        summary = "\n".join(line for line in summary_lines if line)
+
+        self.messages = [
+            {"role": "user", "content": f"{HISTORY_SUMMARY_PREFIX}\n{summary}"},
+            {"role": "assistant", "content": "Noted."},
+        ] + messages[cut:]
+
     def add_version(
         self, version: int, letter: GeneratedLetter, changes_summary: str
     ) -> None:
@@ -9,8 +9,11 @@ Provides centralized logging configuration with:
 - Context enrichment (environment, service, Lambda context)
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import sys
 import os
 from datetime import datetime
@@ -22,6 +25,11 @@ LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
 ENVIRONMENT = os.environ.get('NODE_ENV', 'development')
 IS_LAMBDA = bool(os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
 
+# Hand records to a background thread so callers never block on stdout. Off
+# by default in Lambda, where the process is frozen between invocations and
+# records still queued at that point would be delayed or lost.
+LOG_QUEUE = os.environ.get('LOG_QUEUE', '0' if IS_LAMBDA else '1') == '1'
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs JSON structured logs"""
@@ -29,7 +37,7 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         # Base log structure
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
             'level': record.levelname,
             'message': record.getMessage(),
             'service': 'ai-processor',
@@ -68,7 +76,7 @@ class DevelopmentFormatter(logging.Formatter):
     """Human-readable formatter for development"""
 
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = datetime.utcfromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
         correlation_id = f"[{record.correlation_id}]" if hasattr(record, 'correlation_id') else ""
         message = f"{timestamp} {record.levelname} {correlation_id}: {record.getMessage()}"
 
@@ -81,6 +89,34 @@ class DevelopmentFormatter(logging.Formatter):
         return message
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handler"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record can go as-is
+        # (keeping exc_info and extra fields for the real formatter); only
+        # the message is rendered now, while its arguments are current
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the current queue listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# One hook for whichever listener is current, so a listener replaced by a
+# later setup_logger() call is never stopped twice
+atexit.register(_stop_queue_listener)
+
+
 def setup_logger() -> logging.Logger:
     """Configure and return the root logger"""
     logger = logging.getLogger('ai-processor')
@@ -98,7 +134,15 @@ def setup_logger() -> logging.Logger:
     else:
         handler.setFormatter(StructuredFormatter())
 
-    logger.addHandler(handler)
+    if LOG_QUEUE:
+        global _queue_listener
+        _stop_queue_listener()
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, handler)
+        _queue_listener.start()
+        logger.addHandler(_InProcessQueueHandler(log_queue))
+    else:
+        logger.addHandler(handler)
 
     # Don't propagate to root logger
     logger.propagate = False
@@ -7,7 +7,11 @@ from typing import Any, Callable, TypeVar
 
 from botocore.exceptions import ClientError
 
-from ..bedrock.exceptions import BedrockServerError, BedrockThrottlingError
+from ..bedrock.exceptions import (
+    BedrockRateLimitError,
+    BedrockServerError,
+    BedrockThrottlingError,
+)
 
 # Type variable for generic decorator
 F = TypeVar("F", bound=Callable[..., Any])
@@ -37,6 +41,7 @@ def exponential_backoff(
         - InternalServerException (500)
 
     Does NOT retry on:
+        - BedrockRateLimitError (client-side limit; already waited its maximum)
         - ValidationException (400)
         - AccessDeniedException (403)
         - ResourceNotFoundException (404)
@@ -86,6 +91,10 @@ def exponential_backoff(
 
                     time.sleep(delay)
 
+                except BedrockRateLimitError:
+                    # Retrying would only queue for the same bucket again
+                    raise
+
                 except (BedrockThrottlingError, BedrockServerError) as e:
                     last_exception = e
 
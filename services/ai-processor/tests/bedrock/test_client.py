@@ -1,18 +1,28 @@
 """Unit tests for BedrockClient."""
 
+import io
+import json
 import logging
+from dataclasses import replace
 from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
 from src.bedrock import (
     BedrockClient,
     BedrockConfig,
+    BedrockConfigurationError,
+    BedrockRateLimitError,
+    BedrockThrottlingError,
     BedrockValidationError,
     ExampleExtraction,
+    extract_tool_result,
+    get_default_client,
 )
+from src.bedrock.client import CACHE_POINT, TokenBucket, _get_rate_limiter
 
 
 class TestBedrockClient:
@@ -25,6 +35,36 @@ class TestBedrockClient:
             assert client.config == test_config
             assert isinstance(client.logger, logging.Logger)
 
+    def test_clients_share_boto3_client(self, test_config: BedrockConfig):
+        """Test instances in the same region reuse one boto3 client."""
+        with patch("boto3.client") as mock_factory:
+            first = BedrockClient(config=test_config)
+            second = BedrockClient(config=test_config)
+
+            assert first.client is second.client
+            mock_factory.assert_called_once()
+
+    def test_client_uses_injected_session(self, test_config: BedrockConfig):
+        """Test a supplied boto3 session builds (and caches) the runtime client."""
+        session = Mock()
+        with patch("boto3.client") as mock_factory:
+            first = BedrockClient(config=test_config, session=session)
+            second = BedrockClient(config=test_config, session=session)
+
+            assert first.client is second.client
+            session.client.assert_called_once()
+            assert session.client.call_args[1]["region_name"] == test_config.aws_region
+            mock_factory.assert_not_called()
+
+    def test_default_client_is_shared(self):
+        """Test the default client is built once and reused."""
+        with patch("boto3.client"):
+            first = get_default_client()
+            second = get_default_client()
+
+            assert first is second
+            assert isinstance(first, BedrockClient)
+
     def test_invoke_basic(
         self,
         test_config: BedrockConfig,
@@ -65,6 +105,52 @@ class TestBedrockClient:
             call_kwargs = mock_boto3_client.converse.call_args[1]
             assert call_kwargs["system"] == system
 
+    def test_invoke_with_prompt_cache(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test cache_prompt adds a cache point and cached tokens are priced."""
+        mock_boto3_client.converse.return_value = {
+            "output": {"message": {"content": [{"text": "ok"}]}},
+            "usage": {
+                "inputTokens": 100,
+                "outputTokens": 10,
+                "cacheReadInputTokens": 2000,
+                "cacheWriteInputTokens": 0,
+            },
+        }
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=test_config)
+
+            with patch("src.bedrock.client.log_bedrock_response") as mock_log:
+                client.invoke(
+                    messages=[{"role": "user", "content": "Test"}],
+                    system="You are a helpful assistant.",
+                    cache_prompt=True,
+                )
+
+            call_kwargs = mock_boto3_client.converse.call_args[1]
+            assert call_kwargs["system"] == [
+                {"text": "You are a helpful assistant."},
+                CACHE_POINT,
+            ]
+            log_kwargs = mock_log.call_args[1]
+            assert log_kwargs["cache_read_tokens"] == 2000
+            assert log_kwargs["cost_estimate"] == pytest.approx(
+                test_config.calculate_cost(100, 10) + 2000 * test_config.cost_per_input_token * 0.1
+            )
+
+    def test_invoke_reports_client_reuse(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test only the first call on a shared runtime client is reported as new."""
+        with patch("boto3.client", return_value=mock_boto3_client):
+            messages = [{"role": "user", "content": "Test"}]
+            with patch("src.bedrock.client.log_bedrock_response") as mock_log:
+                BedrockClient(config=test_config).invoke(messages=messages)
+                BedrockClient(config=test_config).invoke(messages=messages)
+
+            assert [c[1]["client_reused"] for c in mock_log.call_args_list] == [False, True]
+
     def test_invoke_with_temperature_override(
         self, test_config: BedrockConfig, mock_boto3_client: Mock
     ):
@@ -110,6 +196,158 @@ class TestBedrockClient:
             assert result.facts[0].fact_type == "party"
             assert result.summary == "Test extraction summary"
 
+    def test_invoke_stream(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test streaming yields content deltas as they arrive."""
+        mock_boto3_client.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {"contentBlockDelta": {"delta": {"text": "Hello"}, "contentBlockIndex": 0}},
+                {"contentBlockDelta": {"delta": {"text": ", world"}, "contentBlockIndex": 0}},
+                {"contentBlockStop": {"contentBlockIndex": 0}},
+                {"messageStop": {"stopReason": "end_turn"}},
+                {"metadata": {"usage": {"inputTokens": 10, "outputTokens": 4}}},
+            ]
+        }
+
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=test_config)
+
+            messages = [{"role": "user", "content": "Hello, Claude!"}]
+            deltas = list(client.invoke_stream(messages=messages, system="Be brief."))
+
+            assert "".join(d["text"] for d in deltas) == "Hello, world"
+            call_kwargs = mock_boto3_client.converse_stream.call_args[1]
+            assert call_kwargs["modelId"] == test_config.model_id
+            assert call_kwargs["system"] == "Be brief."
+            mock_boto3_client.converse.assert_not_called()
+
+            deltas = list(
+                client.invoke_stream(
+                    messages=messages, system="Be brief.", include_usage=True
+                )
+            )
+            assert deltas[-1] == {"usage": {"inputTokens": 10, "outputTokens": 4}}
+
+    def test_invoke_via_stream_assembles_tool_use(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test streamed toolUse input is reassembled into a converse-shaped response."""
+        mock_boto3_client.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {
+                    "contentBlockStart": {
+                        "start": {"toolUse": {"toolUseId": "t1", "name": "extract_data"}},
+                        "contentBlockIndex": 0,
+                    }
+                },
+                {
+                    "contentBlockDelta": {
+                        "delta": {"toolUse": {"input": '{"facts": [], '}},
+                        "contentBlockIndex": 0,
+                    }
+                },
+                {
+                    "contentBlockDelta": {
+                        "delta": {"toolUse": {"input": '"summary": "Streamed"}'}},
+                        "contentBlockIndex": 0,
+                    }
+                },
+                {"contentBlockStop": {"contentBlockIndex": 0}},
+                {"messageStop": {"stopReason": "tool_use"}},
+                {"metadata": {"usage": {"inputTokens": 10, "outputTokens": 6}}},
+            ]
+        }
+
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=test_config)
+
+            response = client.invoke_via_stream(
+                messages=[{"role": "user", "content": "Extract"}]
+            )
+
+            result = extract_tool_result(response, ExampleExtraction)
+            assert result.summary == "Streamed"
+            assert response["stopReason"] == "tool_use"
+            assert response["usage"]["outputTokens"] == 6
+
+    def test_batch_invoke(self, test_config: BedrockConfig):
+        """Test batch records go out as JSONL and come back converse-shaped."""
+        config = replace(
+            test_config,
+            batch_s3_uri="s3://batch-bucket/jobs",
+            batch_role_arn="arn:aws:iam::123:role/batch",
+        )
+        clients = {"bedrock-runtime": Mock(), "bedrock": Mock(), "s3": Mock()}
+        session = Mock()
+        session.client.side_effect = lambda service, **kwargs: clients[service]
+
+        control = clients["bedrock"]
+        control.create_model_invocation_job.return_value = {
+            "jobArn": "arn:aws:bedrock:us-east-1:123:model-invocation-job/abc123"
+        }
+        control.get_model_invocation_job.side_effect = [
+            {"status": "InProgress"},
+            {"status": "Completed"},
+        ]
+        output = {
+            "recordId": "case-1",
+            "modelOutput": {
+                "content": [
+                    {"type": "tool_use", "id": "t1", "name": "extract_data",
+                     "input": {"facts": [], "summary": "Batched"}}
+                ],
+                "stop_reason": "tool_use",
+                "usage": {"input_tokens": 12, "output_tokens": 5},
+            },
+        }
+        failed = {"recordId": "case-2", "error": {"errorMessage": "bad input"}}
+        clients["s3"].get_object.return_value = {
+            "Body": io.BytesIO(f"{json.dumps(output)}\n{json.dumps(failed)}\n".encode())
+        }
+
+        tool = {"toolSpec": {"name": "extract_data", "description": "Extract",
+                             "inputSchema": {"json": {"type": "object"}}}}
+        params = {
+            "messages": [{"role": "user", "content": "Extract"}],
+            "tools": [tool],
+            "tool_choice": {"tool": {"name": "extract_data"}},
+        }
+        client = BedrockClient(config=config, session=session)
+        with patch("src.bedrock.client.time.sleep") as mock_sleep:
+            responses = client.batch_invoke(
+                [{"custom_id": "case-1", "params": params},
+                 {"custom_id": "case-2", "params": params}],
+                job_name="job",
+                poll_interval=1.0,
+            )
+
+        mock_sleep.assert_called_once_with(1.0)
+        put_kwargs = clients["s3"].put_object.call_args[1]
+        assert put_kwargs["Bucket"] == "batch-bucket"
+        assert put_kwargs["Key"] == "jobs/job/input.jsonl"
+        first_record = json.loads(put_kwargs["Body"].splitlines()[0])
+        assert first_record["recordId"] == "case-1"
+        assert first_record["modelInput"]["tools"][0]["input_schema"] == {"type": "object"}
+        assert first_record["modelInput"]["tool_choice"] == {"type": "tool", "name": "extract_data"}
+        output_key = clients["s3"].get_object.call_args[1]["Key"]
+        assert output_key == "jobs/job/output/abc123/input.jsonl.out"
+
+        assert list(responses) == ["case-1"]
+        result = extract_tool_result(responses["case-1"], ExampleExtraction)
+        assert result.summary == "Batched"
+        assert responses["case-1"]["usage"] == {"inputTokens": 12, "outputTokens": 5}
+
+    def test_batch_invoke_requires_configuration(self, test_config: BedrockConfig):
+        """Test batch_invoke refuses to run without S3 and role settings."""
+        with patch("boto3.client"):
+            client = BedrockClient(config=test_config)
+
+            with pytest.raises(BedrockConfigurationError, match="BEDROCK_BATCH_S3_URI"):
+                client.batch_invoke([])
+
     def test_invoke_correlation_id(
         self, test_config: BedrockConfig, mock_boto3_client: Mock
     ):
@@ -157,6 +395,37 @@ class TestBedrockClient:
         assert calculated_cost == expected_cost
         assert calculated_cost > 0
 
+    def test_cost_calculation_small_model(self, test_config: BedrockConfig):
+        """Test the small model is priced at its own rates."""
+        config = replace(
+            test_config,
+            model_id_small="anthropic.claude-3-5-haiku-20241022-v1:0",
+            cost_per_input_token_small=0.0000008,
+            cost_per_output_token_small=0.000004,
+        )
+
+        small_cost = config.calculate_cost(100, 50, model_id=config.model_id_small)
+
+        assert small_cost == pytest.approx(100 * 0.0000008 + 50 * 0.000004)
+        assert config.calculate_cost(100, 50, model_id=config.model_id) == (
+            config.calculate_cost(100, 50)
+        )
+
+    def test_invoke_with_model_override(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test invoke sends the overriding model ID."""
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=test_config)
+
+            client.invoke(
+                messages=[{"role": "user", "content": "Hi"}],
+                model_id="anthropic.claude-3-5-haiku-20241022-v1:0",
+            )
+
+            call_kwargs = mock_boto3_client.converse.call_args[1]
+            assert call_kwargs["modelId"] == "anthropic.claude-3-5-haiku-20241022-v1:0"
+
     def test_multi_tenant_context(
         self, test_config: BedrockConfig, mock_boto3_client: Mock
     ):
@@ -170,3 +439,103 @@ class TestBedrockClient:
             client.invoke(messages=messages, firm_id=1, user_id=100)
 
             mock_boto3_client.converse.assert_called_once()
+
+    def test_invoke_reserves_rate_limit(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test invoke reserves max_tokens up front and refunds what went unused."""
+        # 600 TPM refills only 10 tokens a second, too slow to matter here
+        config = replace(test_config, tokens_per_minute=600, rate_limit_max_wait=0.0)
+        mock_boto3_client.converse.return_value = {
+            "output": {"message": {"content": [{"text": "Hi"}]}},
+            "usage": {"inputTokens": 10, "outputTokens": 100},
+        }
+
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=config)
+            messages = [{"role": "user", "content": "Hi"}]
+
+            # Each call gets back all but the 100 tokens it generated
+            client.invoke(messages=messages, max_tokens=500)
+            client.invoke(messages=messages, max_tokens=480)
+
+            # Raised without retrying or reaching Bedrock
+            with patch("time.sleep") as mock_sleep, pytest.raises(BedrockRateLimitError):
+                client.invoke(messages=messages, max_tokens=450)
+            mock_sleep.assert_not_called()
+            assert mock_boto3_client.converse.call_count == 2
+
+    def test_invoke_refunds_reservation_on_failure(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test a failed call returns its reservation before each retry."""
+        config = replace(test_config, tokens_per_minute=20_000, requests_per_minute=4)
+        mock_boto3_client.converse.side_effect = ClientError(
+            {
+                "Error": {"Code": "ThrottlingException", "Message": "Slow down"},
+                "ResponseMetadata": {"HTTPStatusCode": 429},
+            },
+            "Converse",
+        )
+
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=config)
+            messages = [{"role": "user", "content": "Hi"}]
+
+            with patch("time.sleep"), pytest.raises(BedrockThrottlingError):
+                client.invoke(messages=messages, max_tokens=4000)
+
+        assert mock_boto3_client.converse.call_count == 4
+        # Every token and request slot is back in the bucket
+        limiter = _get_rate_limiter(config, config.model_id)
+        assert limiter.acquire(20_000, max_wait=0.0) == 0.0
+        for _ in range(3):
+            limiter.acquire(0, max_wait=0.0)
+
+    def test_invoke_stream_refunds_reservation_on_failure(
+        self, test_config: BedrockConfig, mock_boto3_client: Mock
+    ):
+        """Test a stream that fails returns its whole reservation."""
+        config = replace(test_config, tokens_per_minute=20_000)
+        mock_boto3_client.converse_stream.side_effect = RuntimeError("connection reset")
+
+        with patch("boto3.client", return_value=mock_boto3_client):
+            client = BedrockClient(config=config)
+            messages = [{"role": "user", "content": "Hi"}]
+
+            with pytest.raises(RuntimeError):
+                list(client.invoke_stream(messages=messages, max_tokens=4000))
+
+        limiter = _get_rate_limiter(config, config.model_id)
+        assert limiter.acquire(20_000, max_wait=0.0) == 0.0
+
+
+class TestTokenBucket:
+    """Test the client-side rate limiter."""
+
+    def test_acquire_waits_for_refill(self):
+        """Test a request over the remaining tokens sleeps until they refill."""
+        with patch("src.bedrock.client.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            bucket = TokenBucket(tokens_per_minute=600)
+
+            assert bucket.acquire(600) == 0.0
+            waited = bucket.acquire(50, max_wait=10.0)
+
+            assert waited == pytest.approx(5.0)
+            mock_time.sleep.assert_called_once_with(waited)
+
+    def test_acquire_raises_past_max_wait(self):
+        """Test an over-long wait raises without reserving anything."""
+        with patch("src.bedrock.client.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            bucket = TokenBucket(requests_per_minute=2)
+            bucket.acquire(0)
+            bucket.acquire(0)
+
+            with pytest.raises(BedrockRateLimitError) as exc_info:
+                bucket.acquire(0, max_wait=1.0)
+
+            assert exc_info.value.retry_after == 31
+            mock_time.monotonic.return_value = 30.0
+            assert bucket.acquire(0, max_wait=0.0) == 0.0
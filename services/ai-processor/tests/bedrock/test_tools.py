@@ -7,7 +7,11 @@ from pydantic import BaseModel, Field
 
 from src.bedrock.exceptions import BedrockValidationError
 from src.bedrock.tools import (
+    CACHED_TOOL_USE_KEY,
+    EXAMPLE_EXTRACTION_TOOL,
     ExampleExtraction,
+    ExtractedFact,
+    ToolInputScanner,
     create_tool_choice,
     extract_tool_result,
     pydantic_to_tool_schema,
@@ -65,6 +69,17 @@ class TestToolSchema:
         assert properties["items"]["type"] == "array"
         assert properties["metadata"]["type"] == "object"
 
+    def test_schema_is_cached(self):
+        """Test repeated conversions reuse the cached schema."""
+        first = pydantic_to_tool_schema(SimpleModel, "simple_tool", "A simple tool")
+        second = pydantic_to_tool_schema(SimpleModel, "simple_tool", "A simple tool")
+        other = pydantic_to_tool_schema(SimpleModel, "other_tool", "A simple tool")
+
+        assert first is second
+        assert other["toolSpec"]["name"] == "other_tool"
+        # Tools built from one model share its JSON schema
+        assert other["toolSpec"]["inputSchema"]["json"] is first["toolSpec"]["inputSchema"]["json"]
+
     def test_tool_choice_creation(self):
         """Test creating tool choice directive."""
         choice = create_tool_choice("my_tool")
@@ -90,6 +105,54 @@ class TestToolResultExtraction:
         assert result.facts[0].content == "John Doe"
         assert result.summary == "Test extraction summary"
 
+    def test_extract_prefers_cached_tool_use(self):
+        """Test the toolUse block cached by invoke is used without rescanning."""
+        response = {
+            "output": {"message": {"content": []}},
+            CACHED_TOOL_USE_KEY: {
+                "name": "test_tool",
+                "input": {"facts": [], "summary": "Cached summary"},
+            },
+        }
+
+        result = extract_tool_result(response, ExampleExtraction)
+
+        assert result.summary == "Cached summary"
+
+    def test_extract_without_validation(
+        self, mock_bedrock_responses: dict[str, Any]
+    ):
+        """Test validate=False builds nested models without validating."""
+        response = mock_bedrock_responses["tool_use_response"]
+
+        result = extract_tool_result(response, ExampleExtraction, validate=False)
+
+        assert isinstance(result, ExampleExtraction)
+        assert isinstance(result.facts[0], ExtractedFact)
+        assert result.facts[0].content == "John Doe"
+        assert result == extract_tool_result(response, ExampleExtraction)
+
+    def test_extract_without_validation_checks_required_fields(self):
+        """Test validate=False still rejects output missing required fields."""
+        response = {
+            "output": {
+                "message": {
+                    "content": [
+                        {
+                            "toolUse": {
+                                "toolUseId": "test",
+                                "name": "test_tool",
+                                "input": {"facts": []},
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+
+        with pytest.raises(BedrockValidationError, match="missing fields"):
+            extract_tool_result(response, ExampleExtraction, validate=False)
+
     def test_extract_missing_tool_use(self):
         """Test error when response has no tool use."""
         response = {
@@ -157,6 +220,23 @@ class TestToolResultExtraction:
         assert result.summary == "Empty facts"
 
 
+class TestToolInputScanner:
+    """Test incremental scanning of streamed tool input."""
+
+    def test_fields_complete_as_fragments_arrive(self):
+        """Test each top-level field is reported once its value closes."""
+        tool_input = '{"facts": [{"content": "a, \\"b\\"}"}], "summary": "done"}'
+        split = tool_input.index('"summary"')
+        scanner = ToolInputScanner()
+
+        first = scanner.feed(tool_input[:split])
+        rest = scanner.feed(tool_input[split:])
+
+        assert first == [("facts", [{"content": 'a, "b"}'}])]
+        assert rest == [("summary", "done")]
+        assert scanner.text() == tool_input
+
+
 class TestExampleSchemas:
     """Test example schema definitions."""
 
@@ -193,3 +273,14 @@ class TestExampleSchemas:
 
         # Confidence should be between 0 and 1 (but Pydantic allows any float)
         # If we want to enforce this, we'd need validators
+
+    def test_prebuilt_example_tool_schema(self):
+        """Test the import-time tool schema matches an on-demand conversion."""
+        tool = pydantic_to_tool_schema(
+            ExampleExtraction,
+            EXAMPLE_EXTRACTION_TOOL["toolSpec"]["name"],
+            EXAMPLE_EXTRACTION_TOOL["toolSpec"]["description"],
+        )
+
+        assert tool is EXAMPLE_EXTRACTION_TOOL
+        assert "facts" in tool["toolSpec"]["inputSchema"]["json"]["properties"]
@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 
 from src.bedrock import BedrockConfig
+from src.bedrock.client import reset_client_cache
 
 
 @pytest.fixture
@@ -55,3 +56,11 @@ def set_test_env():
     os.environ["BEDROCK_MODEL_ID"] = "anthropic.claude-3-5-sonnet-20241022-v2:0"
     os.environ["LOG_LEVEL"] = "DEBUG"
     yield
+
+
+@pytest.fixture(autouse=True)
+def clear_bedrock_client_cache():
+    """Ensure each test builds its own (possibly mocked) boto3 client."""
+    reset_client_cache()
+    yield
+    reset_client_cache()
@@ -0,0 +1,121 @@
+"""Unit tests for the async database engine and session helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+from src.db import async_connection
+from src.db.async_connection import (
+    _async_database_url,
+    _make_async_engine,
+    close_async_connections,
+    get_async_db_session,
+    get_async_engine,
+)
+from src.db.connection import DB_POOL_SIZE, dump_json, ping_if_idle, receive_checkin
+
+
+class TestAsyncDatabaseUrl:
+    """Test driver selection for the async engine URL."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "postgresql://user:secret@db:5432/demand_letters",
+            "postgresql+psycopg://user:secret@db:5432/demand_letters",
+        ],
+    )
+    def test_postgres_urls_use_asyncpg(self, url):
+        """Test any PostgreSQL driver is swapped for asyncpg, keeping the password."""
+        assert (
+            _async_database_url(url)
+            == "postgresql+asyncpg://user:secret@db:5432/demand_letters"
+        )
+
+    def test_other_backends_unchanged(self):
+        """Test non-PostgreSQL URLs pass through untouched."""
+        assert _async_database_url("sqlite+aiosqlite:///test.db") == "sqlite+aiosqlite:///test.db"
+
+
+class TestMakeAsyncEngine:
+    """Test pool and listener wiring per process role."""
+
+    def test_worker_engine_is_unpooled(self):
+        """Test worker processes get a NullPool engine with the orjson codec."""
+        engine = _make_async_engine(role="worker")
+
+        assert isinstance(engine.sync_engine.pool, NullPool)
+        assert engine.dialect._json_serializer is dump_json
+        assert not event.contains(engine.sync_engine, "checkout", ping_if_idle)
+
+    def test_api_engine_is_pooled_with_idle_ping(self):
+        """Test the API engine is pooled and pings only idle connections."""
+        engine = _make_async_engine(role="api")
+
+        assert engine.sync_engine.pool.size() == DB_POOL_SIZE
+        assert event.contains(engine.sync_engine, "checkin", receive_checkin)
+        assert event.contains(engine.sync_engine, "checkout", ping_if_idle)
+
+    def test_engine_is_created_once(self, monkeypatch):
+        """Test the process-wide engine is built on first use and reused."""
+        monkeypatch.setattr(async_connection, "_async_engine", None)
+        factory = MagicMock()
+        monkeypatch.setattr(async_connection, "AsyncSessionLocal", factory)
+        with patch.object(async_connection, "_make_async_engine") as mock_make:
+            first = get_async_engine()
+            second = get_async_engine()
+
+        assert first is second
+        mock_make.assert_called_once()
+        factory.configure.assert_called_once_with(bind=first)
+
+    def test_close_disposes_engine(self, monkeypatch):
+        """Test shutdown disposes the engine's pooled connections."""
+        engine = MagicMock(dispose=AsyncMock())
+        monkeypatch.setattr(async_connection, "_async_engine", engine)
+
+        asyncio.run(close_async_connections())
+
+        engine.dispose.assert_awaited_once()
+
+
+class TestAsyncDbSession:
+    """Test commit and rollback handling of the session context manager."""
+
+    @pytest.fixture
+    def mock_session(self, monkeypatch):
+        """Replace the engine and session factory with mocks."""
+        monkeypatch.setattr(async_connection, "_async_engine", MagicMock())
+        session = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+        monkeypatch.setattr(async_connection, "AsyncSessionLocal", factory)
+        return session
+
+    def test_session_commits_on_success(self, mock_session):
+        """Test the session is committed when the block completes."""
+
+        async def use_session():
+            async with get_async_db_session() as session:
+                assert session is mock_session
+
+        asyncio.run(use_session())
+
+        mock_session.commit.assert_awaited_once()
+        mock_session.rollback.assert_not_awaited()
+
+    def test_session_rolls_back_on_error(self, mock_session):
+        """Test the session is rolled back and the error re-raised."""
+
+        async def use_session():
+            async with get_async_db_session():
+                raise RuntimeError("query failed")
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            asyncio.run(use_session())
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
@@ -0,0 +1,39 @@
+"""Unit tests for application settings loading."""
+
+import pytest
+
+from src.config import Settings, get_settings, reset_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    """Ensure each test loads settings from scratch."""
+    reset_settings()
+    yield
+    reset_settings()
+
+
+class TestSettings:
+    """Test settings loading and caching."""
+
+    def test_get_settings_is_cached(self):
+        """Test repeated calls return the same instance."""
+        assert get_settings() is get_settings()
+
+    def test_loads_from_snapshot(self, tmp_path, monkeypatch):
+        """Test a JSON snapshot takes precedence over the environment."""
+        snapshot = tmp_path / "settings.json"
+        snapshot.write_text(
+            Settings(bedrock_max_tokens=1234).model_dump_json(), encoding="utf-8"
+        )
+        monkeypatch.setenv("SETTINGS_SNAPSHOT_PATH", str(snapshot))
+        monkeypatch.setenv("BEDROCK_MAX_TOKENS", "99")
+
+        assert get_settings().bedrock_max_tokens == 1234
+
+    def test_missing_snapshot_falls_back_to_env(self, tmp_path, monkeypatch):
+        """Test a missing snapshot file falls back to environment settings."""
+        monkeypatch.setenv("SETTINGS_SNAPSHOT_PATH", str(tmp_path / "missing.json"))
+        monkeypatch.setenv("BEDROCK_MAX_TOKENS", "99")
+
+        assert get_settings().bedrock_max_tokens == 99
@@ -0,0 +1,103 @@
+"""Tests for the specialized extractors."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.extractors import BatchExtractor, CombinedExtractionResult
+
+
+def _tool_response(tool_input: dict) -> dict:
+    """Build a Bedrock converse response containing a single toolUse block."""
+    return {
+        "output": {
+            "message": {
+                "content": [
+                    {"toolUse": {"toolUseId": "t1", "name": "extract_all", "input": tool_input}}
+                ]
+            }
+        }
+    }
+
+
+class TestBatchExtractor:
+    """Test combined extraction."""
+
+    def test_extract_all_single_call(self):
+        """Test parties, damages, and facts come back from one invoke."""
+        bedrock_client = Mock()
+        bedrock_client.invoke.return_value = _tool_response(
+            {
+                "parties": [
+                    {"name": "Jane Doe", "party_type": "plaintiff", "confidence": "high"}
+                ],
+                "damages": [
+                    {
+                        "damage_type": "medical",
+                        "description": "ER visit",
+                        "amount": 1200.0,
+                        "confidence": "high",
+                    }
+                ],
+                "total_estimated": 1200.0,
+                "facts": [
+                    {
+                        "fact": "Defendant ran a red light",
+                        "category": "liability",
+                        "confidence": "high",
+                    }
+                ],
+            }
+        )
+
+        result = BatchExtractor(bedrock_client=bedrock_client).extract_all(
+            "Document text", document_type="police_report"
+        )
+
+        assert isinstance(result, CombinedExtractionResult)
+        assert result.parties[0].name == "Jane Doe"
+        assert result.damages[0].amount == 1200.0
+        assert result.facts[0].category == "liability"
+        bedrock_client.invoke.assert_called_once()
+        call_kwargs = bedrock_client.invoke.call_args[1]
+        assert call_kwargs["tool_choice"] == {"type": "tool", "name": "extract_all"}
+        assert call_kwargs["cache_prompt"] is True
+
+    def test_extract_all_failure(self):
+        """Test Bedrock errors surface as ValueError."""
+        bedrock_client = Mock()
+        bedrock_client.invoke.side_effect = RuntimeError("Bedrock down")
+
+        with pytest.raises(ValueError, match="Bedrock down"):
+            BatchExtractor(bedrock_client=bedrock_client).extract_all("Document text")
+
+    def test_extract_all_concurrently(self):
+        """Test focused extractors run concurrently and merge into one result."""
+        responses = {
+            "extract_parties": {
+                "parties": [{"name": "Jane Doe", "party_type": "plaintiff"}]
+            },
+            "extract_damages": {
+                "damages": [
+                    {"damage_type": "medical", "description": "ER", "amount": 50.0}
+                ],
+                "total_estimated": 50.0,
+            },
+            "extract_facts": {"facts": [{"fact": "Light was red"}]},
+        }
+        bedrock_client = Mock()
+        bedrock_client.invoke.side_effect = lambda **kwargs: _tool_response(
+            responses[kwargs["tool_choice"]["name"]]
+        )
+
+        result = asyncio.run(
+            BatchExtractor(bedrock_client=bedrock_client).extract_all_concurrently(
+                "Document text"
+            )
+        )
+
+        assert bedrock_client.invoke.call_count == 3
+        assert result.parties[0].name == "Jane Doe"
+        assert result.total_estimated == 50.0
+        assert result.facts[0].fact == "Light was red"
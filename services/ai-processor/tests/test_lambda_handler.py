@@ -1,5 +1,6 @@
 """Tests for Lambda handler."""
 
+import base64
 import json
 from unittest.mock import Mock, patch
 import pytest
@@ -10,6 +11,7 @@ from src.lambda_handler import (
     handle_generate,
     handle_health,
     create_response,
+    _parse_body,
 )
 
 
@@ -60,6 +62,18 @@ class TestLambdaHandler:
 
         assert response["headers"]["X-Correlation-ID"] == "custom-correlation-123"
 
+    def test_correlation_id_header_case_insensitive(self):
+        """Test the correlation ID header is matched regardless of case."""
+        event = {
+            "path": "/ai/health",
+            "httpMethod": "GET",
+            "headers": {"X-Correlation-Id": "mixed-case-123"},
+        }
+
+        response = lambda_handler(event, Mock())
+
+        assert response["headers"]["X-Correlation-ID"] == "mixed-case-123"
+
     def test_correlation_id_generated(self):
         """Test correlation ID is generated if not provided."""
         event = {
@@ -86,7 +100,7 @@ class TestHandleAnalyze:
             success=True,
             document_id="doc-001",
             extracted_data=Mock(
-                model_dump=Mock(return_value={"test": "data"})
+                model_dump_json=Mock(return_value='{"test": "data"}')
             ),
             processing_time_seconds=1.5,
             token_usage={"input_tokens": 100, "output_tokens": 50},
@@ -111,6 +125,7 @@ class TestHandleAnalyze:
         body = json.loads(response["body"])
         assert body["success"] is True
         assert body["document_id"] == "doc-001"
+        assert body["extracted_data"] == {"test": "data"}
         mock_analyzer.analyze_document.assert_called_once()
 
     def test_analyze_missing_fields(self):
@@ -154,6 +169,42 @@ class TestHandleAnalyze:
 class TestHandleGenerate:
     """Test letter generation handler."""
 
+    @patch("src.lambda_handler.get_letter_generator")
+    def test_generate_success(self, mock_get_generator):
+        """Test a successful generation returns 200 without a letter_id in the body."""
+        mock_result = Mock(
+            success=True,
+            letter=Mock(model_dump_json=Mock(return_value='{"content": "Dear Sir"}')),
+            processing_time_seconds=2.0,
+            token_usage={"input_tokens": 100, "output_tokens": 200},
+            model_id="claude-3-5-sonnet",
+            generation_timestamp="2024-01-01T00:00:00Z",
+        )
+        mock_get_generator.return_value.generate_letter.return_value = mock_result
+
+        event = {
+            "body": json.dumps({
+                "case_id": "case-001",
+                "extracted_data": {},
+                "template_variables": {
+                    "attorney_name": "John Smith",
+                    "law_firm": "Smith & Associates",
+                    "firm_address": "123 Legal Ave, City, ST 12345",
+                    "firm_phone": "(555) 123-4567",
+                    "firm_email": "john@smithlaw.com",
+                    "client_name": "Jane Doe",
+                },
+                "firm_id": 1,
+            })
+        }
+
+        response = handle_generate(event, "test-correlation")
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["success"] is True
+        assert body["letter"] == {"content": "Dear Sir"}
+
     def test_generate_missing_fields(self):
         """Test generate with missing required fields."""
         event = {
@@ -197,3 +248,18 @@ class TestCreateResponse:
 
         assert "X-Correlation-ID" in response["headers"]
         assert len(response["headers"]["X-Correlation-ID"]) > 0
+
+
+class TestParseBody:
+    """Test request body parsing helper."""
+
+    def test_parse_body_variants(self):
+        """Test string, base64, pre-parsed, and empty bodies."""
+        payload = {"document_id": "doc-001"}
+        encoded = base64.b64encode(json.dumps(payload).encode()).decode()
+
+        assert _parse_body({"body": json.dumps(payload)}) == payload
+        assert _parse_body({"body": encoded, "isBase64Encoded": True}) == payload
+        assert _parse_body({"body": payload}) is payload
+        assert _parse_body({"body": None}) == {}
+        assert _parse_body({}) == {}
@@ -8,12 +8,17 @@ Tests the demand letter generation functionality including:
 - Integration with Bedrock client
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
-from src.letter_generator import LetterGenerator
+from src.bedrock.client import CACHE_POINT
+from src.letter_generator import LetterGenerator, _letter_fields
 from src.schemas.letter import (
+    ConversationHistory,
     GeneratedLetter,
     LetterGenerationRequest,
     LetterGenerationResult,
@@ -28,6 +33,7 @@ from src.schemas.letter import (
     LetterClosing,
     LetterSection,
     RefinementFeedback,
+    SectionDelta,
 )
 from src.schemas.extraction import ExtractedData, DocumentMetadata
 
@@ -38,7 +44,9 @@ def mock_bedrock_client():
     client = Mock()
     client.config = Mock()
     client.config.model_id = "anthropic.claude-3-5-sonnet-20241022-v2:0"
+    client.config.model_id_small = "anthropic.claude-3-5-haiku-20241022-v1:0"
     client.config.temperature_generation = 0.7
+    client.config.max_tokens = 4096
     return client
 
 
@@ -161,7 +169,9 @@ class TestLetterGenerator:
         mock_bedrock_client.invoke.return_value = mock_response
 
         generator = LetterGenerator(bedrock_client=mock_bedrock_client)
-        result = generator.generate_letter(sample_generation_request)
+        # Clock pinned so the measured duration is deterministic
+        with patch("src.letter_generator.time.perf_counter", side_effect=[100.0, 101.5]):
+            result = generator.generate_letter(sample_generation_request)
 
         # Verify result
         assert isinstance(result, LetterGenerationResult)
@@ -170,13 +180,106 @@ class TestLetterGenerator:
         assert result.version == 1
         assert result.token_usage["input_tokens"] == 1000
         assert result.token_usage["output_tokens"] == 2000
-        assert result.processing_time_seconds > 0
+        assert result.processing_time_seconds == 1.5
 
         # Verify Bedrock client was called
         mock_bedrock_client.invoke.assert_called_once()
         call_args = mock_bedrock_client.invoke.call_args
         assert call_args[1]["temperature"] == 0.7
 
+    def test_generate_letter_stream(
+        self, mock_bedrock_client, sample_generation_request, sample_generated_letter
+    ):
+        """Test sections are yielded as they complete, then the validated result."""
+        tool_input = json.dumps(sample_generated_letter.model_dump())
+        mock_bedrock_client.invoke_stream.return_value = iter(
+            [{"toolUse": {"input": tool_input[i:i + 40]}} for i in range(0, len(tool_input), 40)]
+            + [{"usage": {"inputTokens": 1000, "outputTokens": 2000}}]
+        )
+
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+        items = list(generator.generate_letter_stream(sample_generation_request))
+
+        deltas, result = items[:-1], items[-1]
+        assert all(isinstance(d, SectionDelta) for d in deltas)
+        assert [d.section for d in deltas] == list(LetterSection)
+        assert deltas[1].content == sample_generated_letter.introduction.model_dump()
+        assert isinstance(result, LetterGenerationResult)
+        assert result.success is True
+        assert result.letter == sample_generated_letter
+        assert result.token_usage["output_tokens"] == 2000
+        call_kwargs = mock_bedrock_client.invoke_stream.call_args[1]
+        assert call_kwargs["include_usage"] is True
+        assert call_kwargs["tool_choice"]["name"] == "generate_demand_letter"
+        mock_bedrock_client.invoke.assert_not_called()
+
+    def test_agenerate_letters_concurrently(
+        self, mock_bedrock_client, sample_generation_request, sample_generated_letter
+    ):
+        """Test async generation fans out and keeps request order."""
+        mock_bedrock_client.invoke.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {
+                            "toolUse": {
+                                "name": "generate_demand_letter",
+                                "input": sample_generated_letter.model_dump(),
+                            }
+                        }
+                    ]
+                }
+            },
+            "usage": {"inputTokens": 1000, "outputTokens": 2000},
+        }
+        second_request = sample_generation_request.model_copy(update={"case_id": "CASE-002"})
+
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+        results = asyncio.run(
+            generator.agenerate_letters([sample_generation_request, second_request])
+        )
+
+        assert [r.case_id for r in results] == ["CASE-001", "CASE-002"]
+        assert all(r.success for r in results)
+        assert mock_bedrock_client.invoke.call_count == 2
+
+    def test_generate_letters_batch(
+        self, mock_bedrock_client, sample_generation_request, sample_generated_letter
+    ):
+        """Test batch generation maps results back to request order."""
+        second_request = sample_generation_request.model_copy(update={"case_id": "CASE-002"})
+        mock_bedrock_client.batch_invoke.return_value = {
+            "case-CASE-002": {
+                "output": {
+                    "message": {
+                        "content": [
+                            {
+                                "toolUse": {
+                                    "name": "generate_demand_letter",
+                                    "input": sample_generated_letter.model_dump(),
+                                }
+                            }
+                        ]
+                    }
+                },
+                "usage": {"inputTokens": 1000, "outputTokens": 2000},
+            }
+        }
+
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+        results = generator.generate_letters_batch(
+            [sample_generation_request, second_request]
+        )
+
+        records = mock_bedrock_client.batch_invoke.call_args[1]["records"]
+        assert [r["custom_id"] for r in records] == ["case-CASE-001", "case-CASE-002"]
+        assert records[0]["params"]["tool_choice"]["name"] == "generate_demand_letter"
+        assert [r.case_id for r in results] == ["CASE-001", "CASE-002"]
+        assert results[0].success is False
+        assert results[1].success is True
+        assert results[1].token_usage["output_tokens"] == 2000
+        mock_bedrock_client.invoke.assert_not_called()
+
     def test_generate_letter_failure(
         self, mock_bedrock_client, sample_generation_request
     ):
@@ -225,9 +328,11 @@ class TestLetterGenerator:
             target_section=LetterSection.FACTS,
         )
 
+        history = ConversationHistory()
         result = generator.refine_letter(
             current_letter=sample_generated_letter,
             feedback=feedback,
+            conversation_history=history,
             current_version=1,
         )
 
@@ -236,6 +341,14 @@ class TestLetterGenerator:
         assert LetterSection.FACTS in result.sections_modified
         assert len(result.changes_summary) > 0
 
+        # The letter prefix is sent as a cacheable block; history keeps plain text
+        call_kwargs = mock_bedrock_client.invoke.call_args[1]
+        assert call_kwargs["cache_prompt"] is True
+        letter_block, cache_point, feedback_block = call_kwargs["messages"][-1]["content"]
+        assert cache_point == CACHE_POINT
+        assert "Add more details" in feedback_block["text"]
+        assert history.messages[0]["content"] == letter_block["text"] + feedback_block["text"]
+
     def test_compare_letters(self, mock_bedrock_client, sample_generated_letter):
         """Test letter comparison logic."""
         generator = LetterGenerator(bedrock_client=mock_bedrock_client)
@@ -247,13 +360,42 @@ class TestLetterGenerator:
 
         # Compare letters
         sections_modified = generator._compare_letters(
-            sample_generated_letter, modified_letter
+            sample_generated_letter.section_digests(), modified_letter.section_digests()
         )
 
         assert LetterSection.FACTS in sections_modified
         assert LetterSection.DAMAGES in sections_modified
         assert LetterSection.INTRODUCTION not in sections_modified
 
+    def test_output_budget(self, mock_bedrock_client, sample_generated_letter):
+        """Test generation budgets sum the section caps within the configured max."""
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+
+        assert generator._output_budget() == 3900
+        mock_bedrock_client.config.max_tokens = 1000
+        assert generator._output_budget() == 1000
+        assert generator._output_budget(sample_generated_letter, LetterSection.FACTS) == 1000
+
+    def test_letter_fields_matches_model_dump(self, sample_generated_letter):
+        """Test the prompt-builder view of a letter matches its model_dump."""
+        assert _letter_fields(sample_generated_letter) == sample_generated_letter.model_dump()
+
+    def test_section_digests(self, sample_generated_letter):
+        """Test digests change only for the sections whose content changed."""
+        modified_letter = sample_generated_letter.model_copy(deep=True)
+        modified_letter.header.salutation = "Dear Counsel:"
+        modified_letter.closing.content = "Different closing"
+
+        original = sample_generated_letter.section_digests()
+        modified = modified_letter.section_digests()
+
+        assert set(original) == set(LetterSection)
+        assert original == sample_generated_letter.model_copy(deep=True).section_digests()
+        assert [s for s in LetterSection if original[s] != modified[s]] == [
+            LetterSection.HEADER,
+            LetterSection.CLOSING,
+        ]
+
     def test_validate_letter_completeness_complete(
         self, mock_bedrock_client, sample_generated_letter
     ):
@@ -315,6 +457,18 @@ class TestLetterGenerator:
         assert len(preview) <= 103  # 100 + "..."
         assert preview.endswith("...")
 
+    def test_get_letter_preview_matches_full_text_prefix(
+        self, mock_bedrock_client, sample_generated_letter
+    ):
+        """Test the truncated preview is the full-text prefix at every cut point."""
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+        full_text = sample_generated_letter.to_full_text()
+
+        for max_length in (0, 1, 60, len(full_text) - 1):
+            preview = generator.get_letter_preview(sample_generated_letter, max_length)
+            assert preview == full_text[:max_length] + "..."
+        assert generator.get_letter_preview(sample_generated_letter, len(full_text)) == full_text
+
     def test_regenerate_section(self, mock_bedrock_client, sample_generated_letter):
         """Test section regeneration."""
         # Create modified letter with new facts section
@@ -347,6 +501,66 @@ class TestLetterGenerator:
         )
 
         assert result.facts.content == "Completely regenerated facts section."
+        call_kwargs = mock_bedrock_client.invoke.call_args[1]
+        assert call_kwargs["model_id"] is None
+        # Untouched sections are budgeted by size, not at the generous cap
+        assert call_kwargs["max_tokens"] < generator._output_budget(sample_generated_letter)
+
+        generator.regenerate_section(
+            current_letter=sample_generated_letter,
+            section=LetterSection.CLOSING,
+            instruction="Shorter sign-off",
+        )
+        assert mock_bedrock_client.invoke.call_args[1]["model_id"] == (
+            mock_bedrock_client.config.model_id_small
+        )
+
+    def test_aregenerate_sections_merges_named_sections(
+        self, mock_bedrock_client, sample_generated_letter
+    ):
+        """Test concurrent regeneration keeps only each call's named section."""
+        modified_letter = sample_generated_letter.model_copy(deep=True)
+        modified_letter.facts.content = "Regenerated facts."
+        modified_letter.liability.content = "Regenerated liability."
+        modified_letter.closing.content = "Unrequested closing change."
+        mock_bedrock_client.invoke.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {
+                            "toolUse": {
+                                "name": "regenerate_letter_section",
+                                "input": modified_letter.model_dump(),
+                            }
+                        }
+                    ]
+                }
+            },
+        }
+
+        generator = LetterGenerator(bedrock_client=mock_bedrock_client)
+        result = asyncio.run(
+            generator.aregenerate_sections(
+                sample_generated_letter,
+                [
+                    (LetterSection.FACTS, "More chronological detail"),
+                    (LetterSection.LIABILITY, "Cite the police report"),
+                ],
+            )
+        )
+
+        assert result.facts.content == "Regenerated facts."
+        assert result.liability.content == "Regenerated liability."
+        assert result.closing == sample_generated_letter.closing
+        assert mock_bedrock_client.invoke.call_count == 2
+
+        with pytest.raises(ValueError, match="only be regenerated once"):
+            asyncio.run(
+                generator.aregenerate_sections(
+                    sample_generated_letter,
+                    [(LetterSection.FACTS, "a"), (LetterSection.FACTS, "b")],
+                )
+            )
 
     def test_adjust_tone(self, mock_bedrock_client, sample_generated_letter):
         """Test tone adjustment."""
@@ -379,6 +593,9 @@ class TestLetterGenerator:
         )
 
         assert "aggressively" in result.introduction.content.lower()
+        assert mock_bedrock_client.invoke.call_args[1]["model_id"] == (
+            mock_bedrock_client.config.model_id_small
+        )
 
     def test_generate_change_summary(self, mock_bedrock_client, sample_generated_letter):
         """Test change summary generation."""
@@ -411,6 +628,13 @@ class TestLetterGenerator:
         assert "$18,000" in full_text
         assert "John Smith, Esq." in full_text
 
+    def test_letter_iter_sections(self, sample_generated_letter):
+        """Test sections are yielded in letter order alongside the full text."""
+        pairs = list(sample_generated_letter.iter_sections())
+
+        assert [section for section, _ in pairs] == list(LetterSection)
+        assert sample_generated_letter.to_full_text() == "\n\n".join(text for _, text in pairs)
+
     def test_letter_get_section_text(self, sample_generated_letter):
         """Test getting specific section text."""
         intro_text = sample_generated_letter.get_section_text(LetterSection.INTRODUCTION)
@@ -0,0 +1,94 @@
+"""Tests for metrics.py"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.metrics import MetricsCollector, calculate_bedrock_cost, time_operation
+
+
+class TestMetricsCollector:
+    """Test background metric emission."""
+
+    def test_emit_groups_by_dimensions(self, capsys):
+        """Test a batch becomes one EMF document per dimension set."""
+        collector = MetricsCollector(namespace="Test")
+        batch = [
+            ("Latency", 10, "Milliseconds", {"Model": "m"}, 1.0),
+            ("Latency", 20, "Milliseconds", {"Model": "m"}, 1.0),
+            ("Errors", 1, "Count", {"Model": "other"}, 2.0),
+        ]
+
+        with patch("src.metrics.METRICS_EMF", True):
+            collector._emit(batch)
+
+        documents = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        by_model = {doc["Model"]: doc for doc in documents}
+
+        latency = by_model["m"]
+        directive = latency["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "Test"
+        assert directive["Dimensions"] == [["Model"]]
+        assert directive["Metrics"] == [{"Name": "Latency", "Unit": "Milliseconds"}]
+        assert latency["_aws"]["Timestamp"] == 1000
+        assert latency["Latency"] == [10, 20]
+        assert by_model["other"]["Errors"] == 1
+
+    def test_flush_waits_for_queued_metrics(self, capsys):
+        """Test flush returns only after every recorded metric is emitted."""
+        collector = MetricsCollector(namespace="Test")
+
+        with patch("src.metrics.METRICS_EMF", True):
+            for value in range(5):
+                collector.record_metric("Count", value, "Count")
+            collector.flush()
+
+        emitted = []
+        for line in capsys.readouterr().out.splitlines():
+            value = json.loads(line)["Count"]
+            emitted.extend(value if isinstance(value, list) else [value])
+        assert emitted == [0, 1, 2, 3, 4]
+
+    def test_flush_without_metrics_returns(self):
+        """Test flush is a no-op before anything is recorded."""
+        MetricsCollector().flush()
+
+
+class TestTimeOperation:
+    """Test the time_operation context manager."""
+
+    def test_records_duration(self):
+        """Test success fills the result and records the caller's dimensions."""
+        with patch("src.metrics.metrics.record_metric") as mock_record:
+            with time_operation("Work", dimensions={"Firm": "1"}) as result:
+                pass
+
+        assert result["success"] is True
+        assert result["duration"] >= 0
+        name, _, unit, dimensions = mock_record.call_args[0]
+        assert (name, unit, dimensions) == ("WorkDuration", "Milliseconds", {"Firm": "1"})
+
+    def test_failure_marks_dimensions_and_reraises(self):
+        """Test an exception propagates and is recorded with Success=false."""
+        dimensions = {"Firm": "1"}
+        with patch("src.metrics.metrics.record_metric") as mock_record:
+            with pytest.raises(ValueError):
+                with time_operation("Work", dimensions=dimensions) as result:
+                    raise ValueError("boom")
+
+        assert result["success"] is False
+        assert mock_record.call_args[0][3] == {"Firm": "1", "Success": "false"}
+        assert dimensions == {"Firm": "1"}
+
+
+def test_calculate_bedrock_cost_with_cache():
+    """Test cache reads and writes are priced separately from input tokens."""
+    cost = calculate_bedrock_cost(
+        1_000_000, 0, cached_input_tokens=1_000_000, cache_write_tokens=1_000_000
+    )
+
+    assert cost["input"] == pytest.approx(3.0)
+    assert cost["cache_read"] == pytest.approx(0.3)
+    assert cost["cache_write"] == pytest.approx(3.75)
+    assert cost["total"] == pytest.approx(7.05)
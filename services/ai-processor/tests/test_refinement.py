@@ -26,6 +26,7 @@ from src.schemas.letter import (
     RefinementFeedback,
     RefinementResult,
     ConversationHistory,
+    HISTORY_SUMMARY_PREFIX,
     LetterSection,
 )
 
@@ -475,6 +476,35 @@ class TestConversationHistory:
         assert history.messages[0]["role"] == "user"
         assert history.messages[1]["content"] == "Hi there"
 
+    def test_compact_keeps_recent_turns(self):
+        """Test compaction keeps the last turns and carries the summary forward."""
+        history = ConversationHistory()
+        for turn in range(5):
+            history.compact(max_turns=2)
+            history.add_message("user", f"Refine {turn}")
+            history.add_message("assistant", f"Changed {turn}")
+
+        history.compact(max_turns=2)
+
+        summary = history.messages[0]["content"]
+        assert summary.startswith(HISTORY_SUMMARY_PREFIX)
+        assert "- Changed 0\n- Changed 1\n- Changed 2" in summary
+        assert "Refine 2" not in summary
+        assert [m["content"] for m in history.messages[2:]] == [
+            "Refine 3", "Changed 3", "Refine 4", "Changed 4",
+        ]
+        assert [m["role"] for m in history.messages] == ["user", "assistant"] * 3
+
+    def test_compact_short_history_unchanged(self):
+        """Test compaction leaves a history within the window untouched."""
+        history = ConversationHistory()
+        history.add_message("user", "Hello")
+        history.add_message("assistant", "Hi there")
+
+        history.compact(max_turns=1)
+
+        assert [m["content"] for m in history.messages] == ["Hello", "Hi there"]
+
     def test_add_version(self, sample_letter):
         """Test adding version to history."""
         history = ConversationHistory()
@@ -0,0 +1,50 @@
+-- Migration: 005 UUIDv7 Primary Keys
+-- Description: Default new primary keys to time-ordered UUIDv7 values so inserts
+--              append to the right edge of each primary key B-tree instead of
+--              landing on random leaf pages (UUIDv4)
+-- Created: 2025-11-14
+
+-- ===========================================================================
+-- FUNCTION: uuid_generate_v7
+-- ===========================================================================
+-- 48-bit Unix millisecond timestamp followed by random bits. The version nibble
+-- is rewritten from 4 to 7; the RFC 4122 variant bits from gen_random_uuid()
+-- are already correct. Existing UUIDv4 keys remain valid UUIDs.
+
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+BEGIN
+    RETURN encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::BIGINT) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::UUID;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+COMMENT ON FUNCTION uuid_generate_v7() IS 'Time-ordered UUID (version 7) for primary key defaults';
+
+-- ===========================================================================
+-- Primary key defaults
+-- ===========================================================================
+
+ALTER TABLE firms ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE refresh_tokens ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE templates ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE template_versions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE documents ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE demand_letters ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE letter_revisions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE letter_documents ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE password_reset_tokens ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE invitations ALTER COLUMN id SET DEFAULT uuid_generate_v7();
@@ -0,0 +1,36 @@
+-- Migration: 006 Hot Path Indexes
+-- Description: Replace single-column indexes on refresh_tokens and documents with
+--              covering/partial indexes shaped to the queries the API runs
+-- Created: 2025-11-14
+
+-- Note: partial index predicates must be immutable, so "expires_at > CURRENT_TIMESTAMP"
+-- cannot be used as a WHERE clause here. Range scans on expires_at cover it instead.
+
+-- ===========================================================================
+-- refresh_tokens
+-- ===========================================================================
+
+-- verifyRefreshToken / invalidateRefreshToken:
+--   SELECT id, user_id, token_hash FROM refresh_tokens WHERE expires_at > NOW()
+-- cleanupExpiredTokens:
+--   DELETE FROM refresh_tokens WHERE expires_at <= NOW()
+-- INCLUDE lets the SELECTs run as index-only scans.
+DROP INDEX IF EXISTS idx_refresh_tokens_expires_at;
+CREATE INDEX idx_refresh_tokens_expires_at
+    ON refresh_tokens(expires_at) INCLUDE (id, user_id, token_hash);
+
+-- Lookup by hash returns the owner and expiry without a heap fetch
+DROP INDEX IF EXISTS idx_refresh_tokens_token_hash;
+CREATE INDEX idx_refresh_tokens_token_hash
+    ON refresh_tokens(token_hash) INCLUDE (user_id, expires_at);
+
+-- ===========================================================================
+-- documents
+-- ===========================================================================
+
+-- Only pending documents are ever searched by scan status; clean/infected rows
+-- no longer need index entries. Ordered by upload time (created_at) for the
+-- scan queue.
+DROP INDEX IF EXISTS idx_documents_virus_scan_status;
+CREATE INDEX idx_documents_virus_pending
+    ON documents(created_at) WHERE virus_scan_status = 'pending';
@@ -0,0 +1,25 @@
+-- Migration: 007 Drop Redundant Indexes
+-- Description: Remove single-column firm_id indexes (and an exact duplicate) whose
+--              columns already lead a composite index or unique constraint
+-- Created: 2025-11-14
+
+-- Any "WHERE firm_id = ?" predicate is served by a composite index with firm_id
+-- as its leading column, so these only add write amplification on every
+-- INSERT/UPDATE and compete for shared buffers.
+
+-- users: covered by idx_users_firm_role and the unique_email_per_firm index
+DROP INDEX IF EXISTS idx_users_firm_id;
+-- users(firm_id, email) duplicates the index backing unique_email_per_firm
+DROP INDEX IF EXISTS idx_users_firm_email;
+
+-- templates: covered by idx_templates_firm_default / idx_templates_firm_name
+DROP INDEX IF EXISTS idx_templates_firm_id;
+
+-- documents: covered by idx_documents_firm_uploaded_by / idx_documents_firm_created_at
+DROP INDEX IF EXISTS idx_documents_firm_id;
+
+-- demand_letters: covered by idx_demand_letters_firm_status and friends
+DROP INDEX IF EXISTS idx_demand_letters_firm_id;
+
+-- invitations: covered by idx_invitations_firm_email
+DROP INDEX IF EXISTS idx_invitations_firm_id;
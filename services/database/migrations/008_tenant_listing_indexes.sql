@@ -0,0 +1,27 @@
+-- Migration: 008 Tenant Listing Indexes
+-- Description: Order demand letter listing indexes by updated_at so the
+--              dashboard's firm-scoped pages are read straight off an index
+-- Created: 2026-10-14
+
+-- ===========================================================================
+-- demand_letters
+-- ===========================================================================
+
+-- DemandLetter.listByFirm:
+--   SELECT * FROM demand_letters WHERE firm_id = $1 [AND status = $2]
+--   ORDER BY updated_at DESC LIMIT $3 OFFSET $4
+-- (firm_id, status) and (firm_id, created_at) match the filter but not the
+-- sort, so Postgres fetches every matching row and sorts before the LIMIT.
+
+-- Status-filtered listing; also serves "WHERE firm_id = ? AND status = ?"
+-- on its leading columns, so it replaces idx_demand_letters_firm_status
+DROP INDEX IF EXISTS idx_demand_letters_firm_status;
+CREATE INDEX idx_demand_letters_firm_status_updated_at
+    ON demand_letters(firm_id, status, updated_at DESC);
+
+-- Unfiltered listing
+CREATE INDEX idx_demand_letters_firm_updated_at
+    ON demand_letters(firm_id, updated_at DESC);
+
+-- documents: listings sort by created_at DESC, which a backward scan of the
+-- existing idx_documents_firm_created_at already provides
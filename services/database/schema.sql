@@ -22,7 +22,7 @@
 -- ============================================================================
 -- Key Patterns:
 -- ============================================================================
--- - UUID primary keys (gen_random_uuid())
+-- - UUID primary keys (time-ordered uuid_generate_v7(), see migration 005)
 -- - Foreign keys with CASCADE/SET NULL as appropriate
 -- - Indexes on firm_id and foreign keys
 -- - JSONB for flexible metadata storage
@@ -66,9 +66,22 @@
 -- Index Strategy:
 -- ============================================================================
 -- 1. All foreign keys have indexes
--- 2. (firm_id, <common_query_column>) composite indexes
+-- 2. (firm_id, <common_query_column>) composite indexes; no separate firm_id-only
+--    index where a composite already leads with firm_id (migration 007)
 -- 3. Unique constraints where appropriate
--- 4. Timestamp indexes for ordering/filtering
+-- 4. Timestamp indexes for ordering/filtering, with the listing's sort column
+--    last, e.g. demand_letters(firm_id, status, updated_at DESC) (migration 008)
+
+-- ============================================================================
+-- Partitioning:
+-- ============================================================================
+-- documents and demand_letters are deliberately not partitioned by firm_id.
+-- Postgres requires the partition key in every primary key and unique
+-- constraint, so id would have to become (firm_id, id) and every foreign key
+-- (letter_revisions, letter_documents, collaboration_documents) would need
+-- firm_id too; ON CONFLICT (id) ingestion would lose its unique target.
+-- Tenant-scoped queries already range-scan composite indexes led by firm_id
+-- (strategy 2 above), which is what partition pruning would buy them.
 
 -- ============================================================================
 -- JSONB Fields:
@@ -78,6 +91,14 @@
 -- documents.metadata: { "page_count": 10, "extracted_text": "...", ... }
 -- demand_letters.extracted_data: { "parties": [...], "damages": [...], ... }
 -- demand_letters.generation_metadata: { "model": "...", "tokens": 1000, ... }
+--
+-- No JSONB column is indexed: nothing filters on their contents today, and a
+-- GIN index on extracted_data (tens of KB, rewritten on every generation)
+-- would only add write cost. If a containment filter is introduced, e.g.
+--   SELECT * FROM demand_letters WHERE firm_id = $1 AND extracted_data @> $2;
+-- add it in a migration with the smaller, containment-only operator class:
+--   CREATE INDEX idx_demand_letters_extracted_data
+--       ON demand_letters USING GIN (extracted_data jsonb_path_ops);
 
 -- ============================================================================
 -- Schema Version: 1